@@ -0,0 +1,6 @@
+"""Contains microbenchmarks for the hot paths of the solver."""
+
+from pathlib import Path
+
+# The root of the project, holding the shipped dictionary.
+PROJECT_DIR = Path(__file__).parent.parent
@@ -0,0 +1,38 @@
+"""Microbenchmark of parsing boards and tile pools from the benchmark corpus.
+
+Run from the project root with ``python -m benchmarks.parse``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmarks import PROJECT_DIR
+from benchmarks.suite import load_corpus
+from bongo_solver.board import Board
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.tile_pool import TilePool
+
+NUMBER = 2_000
+
+
+def main() -> None:
+    """Time parsing each board and pool of the corpus and print the throughput."""
+    dictionary = Dictionary.from_directory(PROJECT_DIR)
+    puzzles = load_corpus(slow=True)
+
+    def parse_boards() -> None:
+        for puzzle in puzzles:
+            Board.from_str(puzzle.board, dictionary)
+
+    def parse_pools() -> None:
+        for puzzle in puzzles:
+            TilePool.from_str(puzzle.pool)
+
+    for name, parse in [("boards", parse_boards), ("pools", parse_pools)]:
+        seconds = timeit.timeit(parse, number=NUMBER)
+        print(f"{name}: {NUMBER * len(puzzles) / seconds:,.0f} {name}/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
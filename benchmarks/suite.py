@@ -0,0 +1,213 @@
+"""Benchmark suite of parsing, scoring, dictionary lookup and solving.
+
+Each benchmark is timed with timeit, best of a few repeats, and the seconds
+per call are written as JSON. Given the JSON of an earlier run, benchmarks
+slower than it by more than a threshold are listed and the exit code is 1.
+Solving runs on the fixed corpus of boards in boards.jsonl, read as a batch.
+Boards marked slow, with full pools of 20 to 25 tiles, take seconds each
+and are only solved given --slow.
+
+Run from the project root with ``python -m benchmarks.suite``, for example
+``python -m benchmarks.suite -o new.json --compare old.json --threshold 0.2``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+from collections.abc import Callable, Sequence
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from benchmarks import PROJECT_DIR
+from bongo_solver import TYPECHECK
+from bongo_solver.batch import Puzzle, read_puzzles, solve_puzzle
+from bongo_solver.board import Board
+from bongo_solver.cli import open_stream
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.letter_tile import LetterTile
+from bongo_solver.tile_pool import TilePool
+from bongo_solver.word.word_row import WordRow
+
+CORPUS_PATH = Path(__file__).with_name("boards.jsonl")
+REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+
+BOARD = "[ B  2][  B  ][ 3 B ][  B  ][2    ]"
+POOL = "A(1)3E(1)3S(1)3R(1)2O(1)2T(1)2N(1)2L(2)I(1)D(2)C(3)H(4)U(2)P(3)"
+
+# A benchmark as its name, the statement timed and the calls per repeat.
+Benchmark = tuple[str, Callable[[], object], int]
+
+
+def load_corpus(path: Path = CORPUS_PATH, *, slow: bool = False) -> list[Puzzle]:
+    """Return the puzzles of the corpus solved by the suite.
+
+    Those marked slow are left out unless slow is set.
+    """
+    with path.open() as lines:
+        return [
+            puzzle
+            for puzzle in read_puzzles(lines)
+            if slow or not puzzle.fields.get("slow", False)
+        ]
+
+
+def build_benchmarks(
+    dictionary: Dictionary,
+    puzzles: Sequence[Puzzle],
+) -> list[Benchmark]:
+    """Return the benchmarks of the suite, ready to time."""
+    pool = TilePool.from_str(POOL)
+    row = WordRow.from_str("[ 2   ]", dictionary)
+    tiles = [LetterTile(letter, 5) for letter in "CRANE"]
+    for ix, tile in enumerate(tiles):
+        row[ix] = tile
+
+    def take_and_add() -> None:
+        tile = pool.take("E")
+        if tile is not None:
+            pool.add(tile)
+
+    def place_and_score() -> int:
+        row[0] = tiles[0]
+        return row.score
+
+    benchmarks: list[Benchmark] = [
+        (
+            "Dictionary.from_directory",
+            partial(Dictionary.from_directory, PROJECT_DIR),
+            5,
+        ),
+        (
+            "Dictionary.__contains__[hit]",
+            partial(dictionary.__contains__, "CRANE"),
+            20_000,
+        ),
+        (
+            "Dictionary.__contains__[miss]",
+            partial(dictionary.__contains__, "CRXNE"),
+            20_000,
+        ),
+        ("TilePool.from_str", partial(TilePool.from_str, POOL), 2_000),
+        ("TilePool.take/add", take_and_add, 20_000),
+        ("Board.from_str", partial(Board.from_str, BOARD, dictionary), 2_000),
+        ("Word.score", place_and_score, 20_000),
+    ]
+    benchmarks.extend(
+        (
+            f"solve[{puzzle.fields.get('name', ix)}]",
+            partial(solve_puzzle, puzzle, dictionary),
+            1,
+        )
+        for ix, puzzle in enumerate(puzzles)
+    )
+    return benchmarks
+
+
+def measure(benchmarks: Sequence[Benchmark], repeat: int = REPEAT) -> dict[str, float]:
+    """Return the seconds per call of each benchmark, best of the repeats."""
+    return {
+        name: min(timeit.repeat(statement, number=number, repeat=repeat)) / number
+        for name, statement, number in benchmarks
+    }
+
+
+def compare(
+    seconds: dict[str, float],
+    baseline: dict[str, float],
+    threshold: float,
+) -> dict[str, float]:
+    """Return the benchmarks slower than a baseline by more than a threshold.
+
+    Each is given with its time as a multiple of the baseline's. Benchmarks
+    missing from the baseline are left out.
+    """
+    ratios = {
+        name: seconds[name] / baseline[name]
+        for name in seconds
+        if baseline.get(name, 0) > 0
+    }
+    return {name: ratio for name, ratio in ratios.items() if ratio > 1 + threshold}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser of the suite."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="JSON file to write the results to, - for stdout (default)",
+    )
+    parser.add_argument(
+        "--compare",
+        type=Path,
+        help="JSON file of an earlier run to flag regressions against",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="fraction slower than the baseline flagged (default 0.2)",
+    )
+    parser.add_argument(
+        "-k",
+        "--filter",
+        default="",
+        help="run only the benchmarks whose name contains this text",
+    )
+    parser.add_argument(
+        "--slow",
+        action="store_true",
+        help="also solve the boards of the corpus marked slow",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=REPEAT,
+        help="number of timings each result is the best of (default 5)",
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the suite, write its results and return 1 if any regressed."""
+    args = build_parser().parse_args(argv)
+    if args.threshold < 0:
+        msg = "The threshold must be at least 0."
+        raise ValueError(msg)
+
+    dictionary = Dictionary.from_directory(PROJECT_DIR)
+    benchmarks = [
+        benchmark
+        for benchmark in build_benchmarks(dictionary, load_corpus(slow=args.slow))
+        if args.filter in benchmark[0]
+    ]
+    seconds = measure(benchmarks, args.repeat)
+    results: dict[str, Any] = {
+        "python": platform.python_version(),
+        "typecheck": TYPECHECK,
+        "seconds": seconds,
+    }
+    with open_stream(args.output, "w", sys.stdout) as out:
+        out.write(json.dumps(results, indent=2) + "\n")
+
+    if args.compare is None:
+        return 0
+
+    baseline = json.loads(args.compare.read_text())
+    if baseline.get("typecheck") != TYPECHECK:
+        print("The baseline was run with type checking set otherwise.", file=sys.stderr)  # noqa: T201
+    regressions = compare(seconds, baseline["seconds"], args.threshold)
+    for name, ratio in regressions.items():
+        print(f"{name}: {ratio:.2f}x the baseline", file=sys.stderr)  # noqa: T201
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
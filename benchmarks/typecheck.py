@@ -0,0 +1,75 @@
+"""Microbenchmark of the per-call cost of runtime type checking.
+
+Runs the hot constructors and pool operations once with beartype enabled and
+once with BONGO_SOLVER_TYPECHECK=0. The variable is read when the package is
+imported, so each mode is timed in its own interpreter.
+
+Run from the project root with ``python -m benchmarks.typecheck``.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+import timeit
+
+NUMBER = 50_000
+# Statements timed, with the setup shared by all of them.
+SETUP = """
+from bongo_solver.letter import Letter
+from bongo_solver.letter_tile import LetterTile
+from bongo_solver.tile_pool import TilePool
+from bongo_solver.type_helpers.letter_like import coerce_to_letter
+
+tile = LetterTile("E", 5)
+pool = TilePool.from_str("A(5)3E(5)3S(5)2R(7)2")
+"""
+STATEMENTS = {
+    "Letter": 'Letter("E")',
+    "LetterTile": 'LetterTile("E", 5)',
+    "coerce_to_letter": 'coerce_to_letter("E")',
+    "TilePool.take/add": 'pool.add(pool.take("E"))',
+    "TilePool.count_of": 'pool.count_of("E")',
+}
+
+
+def measure() -> dict[str, float]:
+    """Return the nanoseconds per call of each statement in this interpreter."""
+    return {
+        name: timeit.timeit(stmt, SETUP, number=NUMBER) / NUMBER * 1e9
+        for name, stmt in STATEMENTS.items()
+    }
+
+
+def measure_in_subprocess(typecheck: str) -> dict[str, float]:
+    """Return the timings from an interpreter with type checking set."""
+    env = {**os.environ, "BONGO_SOLVER_TYPECHECK": typecheck}
+    output = subprocess.run(  # noqa: S603
+        [sys.executable, "-m", "benchmarks.typecheck", "--measure"],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    """Time each statement with and without type checking and print both."""
+    checked = measure_in_subprocess("1")
+    unchecked = measure_in_subprocess("0")
+    for name in STATEMENTS:
+        print(  # noqa: T201
+            f"{name}: {checked[name]:,.0f} ns checked, "
+            f"{unchecked[name]:,.0f} ns unchecked "
+            f"({checked[name] / unchecked[name]:.1f}x)",
+        )
+
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        print(json.dumps(measure()))  # noqa: T201
+    else:
+        main()
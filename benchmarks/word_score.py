@@ -0,0 +1,38 @@
+"""Microbenchmark of Word.score throughput against the shipped dictionary.
+
+Run from the project root with ``python -m benchmarks.word_score``.
+"""
+
+from __future__ import annotations
+
+import timeit
+
+from benchmarks import PROJECT_DIR
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.letter_tile import LetterTile
+from bongo_solver.word.word_row import WordRow
+
+# A common word, a valid but uncommon word and a non-word.
+WORDS = ["CRANE", "AALII", "CRXNE"]
+NUMBER = 20_000
+
+
+def make_row(word: str, dictionary: Dictionary) -> WordRow:
+    """Return a row holding the tiles of a word."""
+    row = WordRow.from_str("[ 2   ]", dictionary)
+    for ix, letter in enumerate(word):
+        row[ix] = LetterTile(letter, 5)
+    return row
+
+
+def main() -> None:
+    """Time scoring a filled row and print the throughput."""
+    dictionary = Dictionary.from_directory(PROJECT_DIR)
+    for word in WORDS:
+        row = make_row(word, dictionary)
+        seconds = timeit.timeit("row.score", globals={"row": row}, number=NUMBER)
+        print(f"{word}: {NUMBER / seconds:,.0f} scores/s")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,27 @@
 """Bongo Solver package initialization file.
 
-Sets up beartype for the entire package.
+Sets up beartype for the entire package. Set the BONGO_SOLVER_TYPECHECK
+environment variable to 0, false, no or off before importing the package to
+run it without runtime type checks.
 """
 
+import os
+
 from beartype import BeartypeConf, BeartypeStrategy, beartype
 from beartype.claw import beartype_this_package
 
-beartype_this_package()
+TYPECHECK_ENV_VAR = "BONGO_SOLVER_TYPECHECK"
+TYPECHECK_OFF_VALUES = frozenset({"0", "false", "no", "off"})
+
+# Whether the modules of the package are type-checked at runtime.
+TYPECHECK = os.environ.get(TYPECHECK_ENV_VAR, "").lower() not in TYPECHECK_OFF_VALUES
+
+if TYPECHECK:
+    beartype_this_package()
 
 # Dynamically create a new @nobeartype decorator disabling type-checking.
 nobeartype = beartype(conf=BeartypeConf(strategy=BeartypeStrategy.O0))
+
+# A duration in seconds. beartype does not accept an int for a float as static
+# type checkers do, so both are named.
+Seconds = int | float
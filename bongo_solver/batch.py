@@ -0,0 +1,289 @@
+"""Solves a stream of puzzles, such as an archive of daily boards."""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import deque
+from collections.abc import Iterable, Iterator  # noqa: TC003
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
+from pathlib import Path  # noqa: TC003
+from typing import Any
+
+from bongo_solver.board import Board
+from bongo_solver.dictionary import Dictionary  # noqa: TC001
+from bongo_solver.solver.candidate_table import CandidateTableCache
+from bongo_solver.solver.result_cache import ResultCache
+from bongo_solver.solver.search_stats import SearchStats
+from bongo_solver.solver.solution import Solution  # noqa: TC001
+from bongo_solver.solver.worker_state import (
+    call_at_worker_exit,
+    keep_worker_state,
+    worker_state,
+)
+from bongo_solver.tile_pool import TilePool
+
+# Puzzles queued per worker ahead of the one whose result is awaited, which
+# keeps workers busy while bounding the memory held for pending results.
+PENDING_PER_WORKER = 2
+
+
+class Puzzle:
+    """A board and tile pool to solve, as given on one line of a batch.
+
+    A line that does not give a puzzle holds the error found reading it
+    instead, so it is reported in its place in the results.
+    """
+
+    def __init__(
+        self,
+        board: str,
+        pool: str,
+        fields: dict[str, Any],
+        error: str | None = None,
+    ) -> None:
+        """Initialize the puzzle with the fields of its input line."""
+        self.__board = board
+        self.__pool = pool
+        self.__fields = fields
+        self.__error = error
+
+    @property
+    def board(self) -> str:
+        """Return the board string."""
+        return self.__board
+
+    @property
+    def pool(self) -> str:
+        """Return the tile pool string."""
+        return self.__pool
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """Return every field of the input line, including board and pool."""
+        return self.__fields
+
+    @property
+    def error(self) -> str | None:
+        """Return why the input line gives no puzzle, None if it does."""
+        return self.__error
+
+
+class PuzzleResult:
+    """The solution of a puzzle and the time taken to find it.
+
+    A puzzle that could not be parsed or solved has no solution, but the
+    error that stopped it instead.
+    """
+
+    def __init__(
+        self,
+        puzzle: Puzzle,
+        solution: Solution | None,
+        seconds: float,
+        stats: SearchStats | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Initialize the result."""
+        if (solution is None) == (error is None):
+            msg = "A puzzle result holds either a solution or an error."
+            raise ValueError(msg)
+        self.__puzzle = puzzle
+        self.__solution = solution
+        self.__seconds = seconds
+        self.__stats = stats
+        self.__error = error
+
+    @property
+    def puzzle(self) -> Puzzle:
+        """Return the puzzle solved."""
+        return self.__puzzle
+
+    @property
+    def solution(self) -> Solution | None:
+        """Return the highest scoring solution, None if the puzzle failed."""
+        return self.__solution
+
+    @property
+    def error(self) -> str | None:
+        """Return why the puzzle failed, None if it was solved."""
+        return self.__error
+
+    @property
+    def seconds(self) -> float:
+        """Return the time spent parsing and solving the puzzle."""
+        return self.__seconds
+
+    @property
+    def stats(self) -> SearchStats | None:
+        """Return the work done solving the puzzle, if it was gathered."""
+        return self.__stats
+
+    def to_json(self) -> str:
+        """Return the input fields and the solution or error as one JSON line."""
+        fields = dict(self.__puzzle.fields)
+        if self.__solution is None:
+            fields["error"] = self.__error
+        else:
+            fields["words"] = self.__solution.words
+            fields["bonus_word"] = self.__solution.bonus_word
+            fields["score"] = self.__solution.score
+        fields["seconds"] = round(self.__seconds, 6)
+        if self.__stats is not None:
+            fields["stats"] = self.__stats.to_dict()
+        return json.dumps(fields)
+
+
+def read_puzzles(lines: Iterable[str]) -> Iterator[Puzzle]:
+    """Parse puzzles from lines of JSON objects with board and pool strings.
+
+    Blank lines are skipped. Other fields are kept and echoed in the results.
+    A line that is not valid JSON or lacks the board and pool strings gives
+    a puzzle holding the error, with the fields of the line if any, so the
+    lines after it are still read.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except json.JSONDecodeError:
+            yield Puzzle("", "", {}, f"Line {line_number} is not valid JSON.")
+            continue
+        if not isinstance(fields, dict) or not all(
+            isinstance(fields.get(key), str) for key in ("board", "pool")
+        ):
+            msg = f"Line {line_number} must have 'board' and 'pool' strings."
+            yield Puzzle("", "", fields if isinstance(fields, dict) else {}, msg)
+            continue
+        yield Puzzle(fields["board"], fields["pool"], fields)
+
+
+def solve_puzzle(
+    puzzle: Puzzle,
+    dictionary: Dictionary,
+    cache: CandidateTableCache | None = None,
+    results: ResultCache | None = None,
+    *,
+    gather_stats: bool = False,
+) -> PuzzleResult:
+    """Parse and solve one puzzle, timing both.
+
+    A puzzle whose solution is held in results is not searched again. With
+    gather_stats the result holds the work done in each phase. A puzzle whose
+    board or pool is invalid gives a result holding the error instead of a
+    solution, so one bad puzzle does not stop a batch, as does a puzzle
+    holding the error of its input line.
+    """
+    if puzzle.error is not None:
+        return PuzzleResult(puzzle, None, 0.0, error=puzzle.error)
+    start = time.perf_counter()
+    stats = SearchStats() if gather_stats else None
+    try:
+        with stats.phase("parse") if stats is not None else nullcontext():
+            board = Board.from_str(puzzle.board, dictionary)
+            pool = TilePool.from_str(puzzle.pool)
+        solution = board.solve(pool, cache=cache, stats=stats, results=results)
+    except ValueError as e:
+        seconds = time.perf_counter() - start
+        return PuzzleResult(puzzle, None, seconds, stats, error=str(e))
+    return PuzzleResult(puzzle, solution, time.perf_counter() - start, stats)
+
+
+def init_worker(
+    dictionary: Dictionary,
+    result_path: Path | None = None,
+    table_path: Path | None = None,
+) -> None:
+    """Keep the dictionary shipped to a worker for every puzzle it solves.
+
+    The word index is built up front so puzzle timings do not include it.
+    Given a result path, the worker opens its own connection to the results,
+    closed when the worker exits. Given a table path, the worker starts with
+    the candidate tables saved there and saves its own when it exits.
+    """
+    results = None
+    if result_path is not None:
+        results = ResultCache(path=result_path)
+        call_at_worker_exit(results.close)
+    cache = CandidateTableCache(path=table_path)
+    if table_path is not None:
+        call_at_worker_exit(cache.save)
+    keep_worker_state(dictionary=dictionary, cache=cache, results=results)
+    _ = dictionary.index
+
+
+def solve_in_worker(puzzle: Puzzle, *, gather_stats: bool = False) -> PuzzleResult:
+    """Solve a puzzle with the dictionary of the worker."""
+    return solve_puzzle(
+        puzzle,
+        worker_state("dictionary"),
+        worker_state("cache"),
+        worker_state("results"),
+        gather_stats=gather_stats,
+    )
+
+
+def solve_many(  # noqa: PLR0913
+    puzzles: Iterable[Puzzle],
+    dictionary: Dictionary,
+    workers: int = 1,
+    result_path: Path | None = None,
+    *,
+    table_path: Path | None = None,
+    gather_stats: bool = False,
+) -> Iterator[PuzzleResult]:
+    """Solve puzzles and yield their results in input order as they finish.
+
+    With more than one worker the puzzles are solved by a pool of processes,
+    each given the dictionary once when it starts. Only a few puzzles per
+    worker are read ahead of the results, so memory does not grow with the
+    number of puzzles. Each process keeps the candidate tables of the rows it
+    solves, for puzzles repeating a row layout and pool. Given a result
+    path, solutions are kept in the result cache there and puzzles solved
+    before, in this run or an earlier one, are not searched again. Given a
+    table path, the candidate tables saved there are used and those of this
+    run are saved back when it ends. With several workers each saves its own
+    tables as it exits, and the last to exit wins. With gather_stats each
+    result holds the work done solving its puzzle. A puzzle that cannot be
+    solved gives a result holding its error, and the puzzles after it are
+    still solved.
+    """
+    if workers < 1:
+        msg = "The number of workers must be at least 1."
+        raise ValueError(msg)
+
+    if workers == 1:
+        cache = CandidateTableCache(path=table_path)
+        with (
+            ResultCache(path=result_path) if result_path is not None else nullcontext()
+        ) as results:
+            try:
+                for puzzle in puzzles:
+                    yield solve_puzzle(
+                        puzzle,
+                        dictionary,
+                        cache,
+                        results,
+                        gather_stats=gather_stats,
+                    )
+            finally:
+                if table_path is not None:
+                    cache.save()
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(dictionary, result_path, table_path),
+    ) as executor:
+        pending: deque[Future[PuzzleResult]] = deque()
+        for puzzle in puzzles:
+            pending.append(
+                executor.submit(solve_in_worker, puzzle, gather_stats=gather_stats),
+            )
+            if len(pending) > workers * PENDING_PER_WORKER:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
@@ -2,15 +2,33 @@
 
 from __future__ import annotations
 
-import re
-from typing import cast
+import hashlib
+import heapq
+import json
+from typing import TYPE_CHECKING, cast
 
+from bongo_solver import Seconds, nobeartype
 from bongo_solver.dictionary import Dictionary  # noqa: TC001
 from bongo_solver.letter_slot.bonus_letter_slot import BonusLetterSlot
-from bongo_solver.word.bonus_word import BonusWord
+from bongo_solver.letter_tile import LetterTile  # noqa: TC001
+from bongo_solver.solver.candidate_table import (
+    CandidateTableCache,
+    pool_signature,
+    row_layout,
+)
+from bongo_solver.solver.result_cache import ResultCache  # noqa: TC001
+from bongo_solver.solver.search_stats import SearchStats  # noqa: TC001
+from bongo_solver.solver.solution import Solution  # noqa: TC001
+from bongo_solver.tile_pool import TilePool  # noqa: TC001
+from bongo_solver.tokenizer import tokenize_board
+from bongo_solver.word.bonus_path import BonusPath
+from bongo_solver.word.bonus_word import BONUS_WORD_LENGTH, BonusWord
 
 from .word.word_row import WordRow
 
+if TYPE_CHECKING:  # pragma: no cover
+    from bongo_solver.solver.branch_and_bound import BranchAndBoundSolver
+
 BOARD_SIZE = 5
 
 
@@ -33,21 +51,16 @@ def try_get_bonus_word(rows: list[WordRow], dictionary: Dictionary) -> BonusWord
     return BonusWord(bonus_slots, dictionary)
 
 
-BOARD_ROW_PATTERN = re.compile(r"(\[.....\])")
-
-
 class Board:
     """A board of word rows that make up a Bongo puzzle."""
 
     @classmethod
     def from_str(cls, board_str: str, dictionary: Dictionary) -> Board:
         """Convert a string contianin a board configuration."""
-        matches = re.findall(BOARD_ROW_PATTERN, board_str)
-        msg = "Insufficient board configuration in board_str."
-
-        if len(matches) != BOARD_SIZE:
-            raise ValueError(msg)
-        words = [WordRow.from_str(row, dictionary) for row in matches]
+        words = [
+            WordRow.from_layout(multipliers, bonus_ix, dictionary)
+            for multipliers, bonus_ix in tokenize_board(board_str)
+        ]
         return cls(words, dictionary)
 
     def __init__(self, rows: list[WordRow], dictionary: Dictionary) -> None:
@@ -56,10 +69,196 @@ class Board:
             msg = f"A board must contain {BOARD_SIZE} rows."
             raise ValueError(msg)
         self.__rows = rows
-        self.__bonus_word = try_get_bonus_word(rows, dictionary)
-        if not self.__bonus_word:
+        self.__dictionary = dictionary
+        bonus_word = try_get_bonus_word(rows, dictionary)
+        if not bonus_word:
             msg = "The board does not have a valid bonus word configuration."
             raise ValueError(msg)
+        self.__bonus_word = bonus_word
+        self.__bonus_path: BonusPath | None = None
+
+    @property
+    def rows(self) -> list[WordRow]:
+        """Return the word rows of the board."""
+        return self.__rows
+
+    @property
+    def bonus_word(self) -> BonusWord:
+        """Return the bonus word threaded through the rows."""
+        return self.__bonus_word
+
+    @property
+    def bonus_path(self) -> BonusPath:
+        """Return the slots of the bonus word and the words fitting them.
+
+        It is built on first use and kept, as the layout never changes.
+        """
+        if self.__bonus_path is None:
+            self.__bonus_path = BonusPath(
+                [
+                    (row_ix, row.get_bonus_ix())
+                    for row_ix, row in enumerate(self.__rows[:BONUS_WORD_LENGTH])
+                ],
+                self.__dictionary,
+            )
+        return self.__bonus_path
+
+    @property
+    def dictionary(self) -> Dictionary:
+        """Return the dictionary used to validate words."""
+        return self.__dictionary
+
+    @property
+    def score(self) -> int:
+        """Return the score of the rows plus the bonus word."""
+        return sum(row.score for row in self.__rows) + self.__bonus_word.score
+
+    def fingerprint(self, pool: TilePool) -> str:
+        """Return a hash identifying the best filling of the board from a pool.
+
+        It covers all the solution depends on: the slot multipliers and bonus
+        slots of the rows, the count and score of each letter in the pool and
+        the words of the dictionary. Boards and pools written differently but
+        holding the same, such as with runs of tiles split or reordered,
+        share it.
+        """
+        canonical = json.dumps(
+            [
+                [row_layout(row) for row in self.__rows],
+                pool_signature(pool),
+                self.__dictionary.version,
+            ],
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def solve(
+        self,
+        pool: TilePool,
+        workers: int = 1,
+        cache: CandidateTableCache | None = None,
+        stats: SearchStats | None = None,
+        results: ResultCache | None = None,
+    ) -> Solution:
+        """Return the highest scoring filling of the board from the tile pool.
+
+        With more than one worker the search is split across processes. The
+        candidate words of each row are looked up in and added to the cache.
+        Given stats, the work of the search is added to them. A solution held
+        in results for the fingerprint of the board and pool is returned
+        without a search, and a solution searched for is added to them.
+        """
+        if workers < 1:
+            msg = "The number of workers must be at least 1."
+            raise ValueError(msg)
+        if workers > 1 and stats is not None:
+            msg = "Search stats are only gathered by a single worker."
+            raise ValueError(msg)
+
+        if results is not None:
+            key = self.fingerprint(pool)
+            solution = results.get(key)
+            if solution is None:
+                solution = self.solve(pool, workers, cache, stats)
+                results.put(key, solution)
+            return solution
+
+        if workers > 1:
+            # Imported here as the parallel solver depends on the board.
+            from bongo_solver.solver.parallel import solve_parallel
+
+            return solve_parallel(self, pool, workers, cache)
+
+        return self.__solver(pool, cache, stats).solve()
+
+    def solve_anytime(
+        self,
+        pool: TilePool,
+        time_budget: Seconds,
+        max_gap: int = 0,
+        cache: CandidateTableCache | None = None,
+        stats: SearchStats | None = None,
+    ) -> Solution:
+        """Return the best filling found within time_budget seconds.
+
+        The search stops sooner once no filling can beat the one found by more
+        than max_gap.
+        """
+        solver = self.__solver(pool, cache, stats)
+        return solver.solve_anytime(time_budget, max_gap)
+
+    def top_solutions(
+        self,
+        pool: TilePool,
+        k: int,
+        time_budget: Seconds | None = None,
+        cache: CandidateTableCache | None = None,
+        stats: SearchStats | None = None,
+    ) -> list[Solution]:
+        """Return the k highest scoring fillings of the board, best first.
+
+        When time_budget seconds pass before the search completes the best
+        fillings found by then are returned.
+        """
+        if k < 1:
+            msg = "The number of solutions must be at least 1."
+            raise ValueError(msg)
+
+        solver = self.__solver(pool, cache, stats)
+        return heapq.nlargest(
+            k,
+            solver.solutions(k, time_budget),
+            key=lambda solution: solution.score,
+        )
+
+    @nobeartype
+    def __solver(
+        self,
+        pool: TilePool,
+        cache: CandidateTableCache | None,
+        stats: SearchStats | None,
+    ) -> BranchAndBoundSolver:
+        """Return a solver of the board from the tile pool."""
+        # Imported here as the solver depends on the board.
+        from bongo_solver.solver.branch_and_bound import BranchAndBoundSolver
+
+        return BranchAndBoundSolver(self, pool, cache, stats)
+
+    def fill(self, solution: Solution, pool: TilePool) -> None:
+        """Place tiles taken from the pool on the board as laid out by a solution.
+
+        If the solution cannot be placed, the board and pool are left as they
+        were.
+        """
+        snapshot = pool.snapshot()
+        replaced: list[tuple[WordRow, int, LetterTile | None]] = []
+        try:
+            self.__place(solution, pool, replaced)
+        except BaseException:
+            for row, ix, tile in reversed(replaced):
+                row[ix] = tile
+            pool.restore(snapshot)
+            raise
+
+    def __place(
+        self,
+        solution: Solution,
+        pool: TilePool,
+        replaced: list[tuple[WordRow, int, LetterTile | None]],
+    ) -> None:
+        """Place the tiles of a solution, noting each slot and its old tile."""
+        for row, placement in zip(self.__rows, solution.placements, strict=True):
+            if placement is None:
+                continue
+            for ix, letter in enumerate(placement.word):
+                tile = pool.take(letter)
+                if tile is None:
+                    msg = f"Tile pool has no tile left for letter '{letter}'."
+                    raise ValueError(msg)
+                slot_ix = placement.offset + ix
+                replaced.append((row, slot_ix, row[slot_ix].letter_tile))
+                row[slot_ix] = tile
 
-    # TODO(ZD): SCORE
-    # https://github.com/zackdrescher/bongo_solver/issues/2
+    def __str__(self) -> str:
+        """Return a string representation of the board."""
+        return "\n".join(str(row) for row in self.__rows)
@@ -0,0 +1,130 @@
+"""Command line interface for the bongo solver."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from collections.abc import Sequence  # noqa: TC003
+from contextlib import AbstractContextManager, nullcontext
+from pathlib import Path
+from typing import IO
+
+from bongo_solver.batch import read_puzzles, solve_many
+from bongo_solver.dictionary import Dictionary
+
+
+def load_dictionary(path: Path) -> Dictionary:
+    """Load a compiled dictionary file or a directory of word lists."""
+    if path.is_dir():
+        return Dictionary.from_directory(path)
+    return Dictionary.from_compiled(path)
+
+
+def open_stream(
+    name: str,
+    mode: str,
+    standard: IO[str],
+) -> AbstractContextManager[IO[str]]:
+    """Open a file by name, or leave the standard stream open for -."""
+    if name == "-":
+        return nullcontext(standard)
+    return Path(name).open(mode)
+
+
+def compile_dictionary(args: argparse.Namespace) -> int:
+    """Compile the word lists of a directory into a dictionary file."""
+    dictionary = Dictionary.from_directory(args.directory)
+    dictionary.compile(args.output)
+    return 0
+
+
+def batch(args: argparse.Namespace) -> int:
+    """Solve the puzzles of a JSON lines file and write a result per line."""
+    dictionary = load_dictionary(args.dictionary)
+    with (
+        open_stream(args.input, "r", sys.stdin) as lines,
+        open_stream(args.output, "w", sys.stdout) as out,
+    ):
+        for result in solve_many(
+            read_puzzles(lines),
+            dictionary,
+            args.workers,
+            args.result_cache,
+            table_path=args.table_cache,
+            gather_stats=args.stats,
+        ):
+            out.write(result.to_json() + "\n")
+            out.flush()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Return the argument parser for the command line interface."""
+    parser = argparse.ArgumentParser(prog="bongo-solver")
+    subparsers = parser.add_subparsers(required=True)
+
+    compile_parser = subparsers.add_parser(
+        "compile-dictionary",
+        help="precompile word lists into a file for Dictionary.from_compiled",
+    )
+    compile_parser.add_argument(
+        "directory",
+        type=Path,
+        help="directory holding common_words.txt and valid_words.txt",
+    )
+    compile_parser.add_argument("output", type=Path, help="compiled file to write")
+    compile_parser.set_defaults(command=compile_dictionary)
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="solve puzzles read as JSON lines with board and pool strings",
+    )
+    batch_parser.add_argument("input", help="JSON lines file of puzzles, - for stdin")
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        default="-",
+        help="JSON lines file to write results to, - for stdout (default)",
+    )
+    batch_parser.add_argument(
+        "-d",
+        "--dictionary",
+        type=Path,
+        default=Path(),
+        help="compiled dictionary file or directory of word lists (default .)",
+    )
+    batch_parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="number of processes solving puzzles (default 1)",
+    )
+    batch_parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="add the nodes, prunes and phase timings of each solve to its result",
+    )
+    batch_parser.add_argument(
+        "--result-cache",
+        type=Path,
+        help="SQLite file keeping solutions across runs, so repeats skip the search",
+    )
+    batch_parser.add_argument(
+        "--table-cache",
+        type=Path,
+        help="JSON file keeping candidate tables across runs, so rows skip rebuilding",
+    )
+    batch_parser.set_defaults(command=batch)
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface and return its exit code."""
+    args = build_parser().parse_args(argv)
+    return args.command(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
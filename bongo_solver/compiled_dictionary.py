@@ -0,0 +1,81 @@
+"""Reads and writes the sections of a precompiled dictionary file.
+
+A compiled dictionary starts with a fixed header giving the format version
+and the size of each section, followed by the sections themselves, each
+padded to a multiple of eight bytes:
+
+- the common words, sorted and separated by newlines
+- the valid words, sorted and separated by newlines
+- the word index bitsets, as written by WordIndex.to_bytes
+- the word trie arrays, as written by WordTrie.to_bytes
+"""
+
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+
+MAGIC = b"BONGODIC"
+FORMAT_VERSION = 1
+SECTION_NAMES = ("common words", "valid words", "index", "trie")
+ALIGNMENT = 8
+
+# The magic bytes, format version and the size of each section.
+HEADER = struct.Struct(f"<8sI{len(SECTION_NAMES)}Q4x")
+
+
+def _padding(size: int) -> int:
+    """Return the number of bytes aligning a section of a size."""
+    return -size % ALIGNMENT
+
+
+def write_sections(path: str | Path, sections: list[bytes]) -> None:
+    """Write the sections of a compiled dictionary to a file."""
+    if len(sections) != len(SECTION_NAMES):
+        msg = f"Expected {len(SECTION_NAMES)} sections, got {len(sections)}."
+        raise ValueError(msg)
+
+    with Path(path).open("wb") as file:
+        file.write(
+            HEADER.pack(MAGIC, FORMAT_VERSION, *(len(data) for data in sections)),
+        )
+        for data in sections:
+            file.write(data)
+            file.write(bytes(_padding(len(data))))
+
+
+def read_sections(path: str | Path) -> list[memoryview]:
+    """Map a compiled dictionary file into memory and return its sections.
+
+    The sections are read-only views into the memory map, which stays open
+    for as long as any of them is referenced.
+    """
+    with Path(path).open("rb") as file:
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    view = memoryview(mapped)
+    if len(view) < HEADER.size:
+        msg = f"'{path}' is too short to be a compiled dictionary."
+        raise ValueError(msg)
+
+    magic, version, *sizes = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        msg = f"'{path}' is not a compiled dictionary."
+        raise ValueError(msg)
+    if version != FORMAT_VERSION:
+        msg = (
+            f"'{path}' has compiled dictionary format {version}, "
+            f"expected {FORMAT_VERSION}."
+        )
+        raise ValueError(msg)
+
+    sections = []
+    offset = HEADER.size
+    for size in sizes:
+        if offset + size > len(view):
+            msg = f"'{path}' is truncated."
+            raise ValueError(msg)
+        sections.append(view[offset : offset + size])
+        offset += size + _padding(size)
+    return sections
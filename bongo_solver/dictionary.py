@@ -2,9 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+from collections.abc import Mapping, Sequence  # noqa: TC003
+from enum import Enum
 from pathlib import Path
+from types import MappingProxyType
 
+from bongo_solver.compiled_dictionary import read_sections, write_sections
 from bongo_solver.type_helpers.word_list import WordList, coerce_to_set
+from bongo_solver.word_index import WordIndex
+from bongo_solver.word_trie import WordTrie
 
 
 def load_word_file(file_path: str | Path) -> set[str]:
@@ -17,6 +24,13 @@ def load_word_file(file_path: str | Path) -> set[str]:
     return set(words)
 
 
+class WordKind(Enum):
+    """Whether a dictionary word is common or only valid."""
+
+    VALID = "valid"
+    COMMON = "common"
+
+
 class Dictionary:
     """Class for storing a set of valid bongo words."""
 
@@ -41,14 +55,50 @@ class Dictionary:
 
         return cls.from_text_files(common_words_path, valid_words_path)
 
+    @classmethod
+    def from_compiled(cls, path: str | Path) -> Dictionary:
+        """Initialize a dictionary from a file written by compile.
+
+        The index and trie are loaded prebuilt rather than built from the
+        words. The file is memory mapped, so processes loading the same file
+        share the pages holding the trie.
+        """
+        common, valid, index, trie = read_sections(path)
+        common_words = set(bytes(common).decode("ascii").split())
+        valid_words = set(bytes(valid).decode("ascii").split())
+
+        return cls(
+            common_words,
+            valid_words,
+            index=WordIndex(common_words | valid_words, index),
+            trie=WordTrie(arrays=trie),
+        )
+
     def __init__(
         self,
         common_words: WordList,
         valid_words: WordList,
+        *,
+        index: WordIndex | None = None,
+        trie: WordTrie | None = None,
     ) -> None:
-        """Initialize the dictionary with a set of valid bongo words."""
+        """Initialize the dictionary with a set of valid bongo words.
+
+        A prebuilt index and trie over the same words may be given.
+        """
         self.__common_words = coerce_to_set(common_words)
         self.__valid_words = coerce_to_set(valid_words) - self.__common_words
+        lookup = dict.fromkeys(self.__valid_words, WordKind.VALID)
+        lookup.update(dict.fromkeys(self.__common_words, WordKind.COMMON))
+        self.__lookup = MappingProxyType(lookup)
+        self.__all_words = frozenset(lookup)
+        self.__index = index
+        self.__trie = trie
+        self.__version: str | None = None
+
+    def __reduce__(self) -> tuple[type[Dictionary], tuple[set[str], set[str]]]:
+        """Pickle the words only, leaving the index and trie to be rebuilt."""
+        return Dictionary, (self.__common_words, self.__valid_words)
 
     @property
     def common_words(self) -> set[str]:
@@ -61,14 +111,79 @@ class Dictionary:
         return self.__valid_words
 
     @property
-    def all_words(self) -> set[str]:
+    def all_words(self) -> frozenset[str]:
         """Return the set of all words."""
-        return self.__common_words | self.__valid_words
+        return self.__all_words
+
+    @property
+    def index(self) -> WordIndex:
+        """Return the index of all words, building it on first use."""
+        if self.__index is None:
+            self.__index = WordIndex(self.all_words)
+        return self.__index
+
+    @property
+    def trie(self) -> WordTrie:
+        """Return the prefix tree of all words, building it on first use."""
+        if self.__trie is None:
+            self.__trie = WordTrie(self.all_words)
+        return self.__trie
+
+    @property
+    def version(self) -> str:
+        """Return a hash of the words, equal for dictionaries of equal words.
+
+        It identifies the dictionary results were computed with, so results
+        kept across runs are only reused with the same words.
+        """
+        if self.__version is None:
+            digest = hashlib.sha256()
+            for words in (self.common_words, self.valid_words):
+                digest.update("\n".join(sorted(words)).encode())
+                digest.update(b"\0")
+            self.__version = digest.hexdigest()
+        return self.__version
+
+    def compile(self, path: str | Path) -> None:
+        """Write the words, index and trie to a file for from_compiled."""
+        write_sections(
+            path,
+            [
+                "\n".join(sorted(self.common_words)).encode("ascii"),
+                "\n".join(sorted(self.valid_words)).encode("ascii"),
+                self.index.to_bytes(),
+                self.trie.to_bytes(),
+            ],
+        )
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return True if at least one word starts with the prefix."""
+        return self.trie.has_prefix(prefix)
+
+    def matching(
+        self,
+        pattern: str,
+        letters: Mapping[str, int] | None = None,
+    ) -> list[str]:
+        """Return the words fitting a pattern such as ?A??S.
+
+        When letters maps letters to the number available, only the words
+        that can be spelled from them are returned.
+        """
+        return self.index.matching(pattern, letters)
 
     def __contains__(self, word: str) -> bool:
         """Return True if the word is in the dictionary."""
-        return word in self.all_words
+        return word in self.__lookup
 
     def is_common(self, word: str) -> bool:
         """Return True if the word is a common word."""
-        return word in self.__common_words
+        return self.__lookup.get(word) is WordKind.COMMON
+
+    def kind_of(self, word: str) -> WordKind | None:
+        """Return whether a word is common or valid, None if not a word."""
+        return self.__lookup.get(word)
+
+    def kinds_of(self, words: Sequence[str]) -> list[WordKind | None]:
+        """Return the kind of each word, None for those not in the dictionary."""
+        return list(map(self.__lookup.get, words))
@@ -1,11 +1,42 @@
 """Provides a class for representing a letter in Bongo."""
 
+from __future__ import annotations
+
+from typing import ClassVar, Self, cast
+
+from bongo_solver import nobeartype
+
+# The spellings of letters interned at most before the table starts afresh.
+MAX_INTERNED_LETTERS = 1024
+
 
 class Letter:
-    """A class to represent a letter in Bongo."""
+    """A class to represent a letter in Bongo.
+
+    Letters are interned: constructing a letter returns the instance already
+    made for that letter, so letters mostly compare by identity and their
+    hash is computed once. The table is emptied once it holds
+    MAX_INTERNED_LETTERS spellings, so letters made before and after compare
+    equal by their character instead.
+    """
+
+    __slots__ = ("__hash", "__letter")
 
-    def __init__(self, letter: str) -> None:
-        """Initialize the letter with a single character and score."""
+    __hash: int
+    __letter: str
+    __interned: ClassVar[dict[str, Letter]] = {}
+
+    @nobeartype
+    def __new__(cls, letter: str) -> Letter:  # noqa: PYI034
+        """Return the letter for a single character, creating it on first use."""
+        interned = cls.__interned.get(letter)
+        if interned is None:
+            interned = cls.__intern(letter)
+        return interned
+
+    @classmethod
+    def __intern(cls, letter: str) -> Self:
+        """Validate a character and return its letter, interning it under both."""
         if len(letter) != 1:
             msg = "Letter must be a single character."
             raise ValueError(msg)
@@ -14,26 +45,46 @@ class Letter:
             msg = "Letter must be a letter."
             raise ValueError(msg)
 
-        self.letter = letter.upper()
+        if len(cls.__interned) >= MAX_INTERNED_LETTERS:
+            cls.__interned.clear()
+
+        upper = letter.upper()
+        interned = cls.__interned.get(upper)
+        if interned is None:
+            interned = super().__new__(cls)
+            interned.__letter = upper  # noqa: SLF001
+            interned.__hash = hash(upper)  # noqa: SLF001
+            cls.__interned[upper] = interned
+        cls.__interned[letter] = interned
+        return cast(Self, interned)
+
+    @property
+    def letter(self) -> str:
+        """Return the letter as an uppercase character."""
+        return self.__letter
 
     def __str__(self) -> str:
         """Return the letter as a string."""
-        return self.letter
+        return self.__letter
 
     def __repr__(self) -> str:
         """Return a string representation of the letter."""
-        return f"Letter('{self.letter}')"
+        return f"Letter('{self.__letter}')"
+
+    def __reduce__(self) -> tuple[type[Self], tuple[str]]:
+        """Unpickle to the interned letter."""
+        return type(self), (self.__letter,)
 
     def __eq__(self, other: object) -> bool:
         """Return True if the letters are the same."""
         if isinstance(other, Letter):
-            return self.letter == other.letter
+            return self is other or self.__letter == other.__letter
 
         if isinstance(other, str):
-            return self.letter == other.upper()
+            return self.__letter == other.upper()
 
         return False
 
     def __hash__(self) -> int:
         """Hash the letter."""
-        return hash(self.letter)
+        return self.__hash
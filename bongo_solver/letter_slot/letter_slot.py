@@ -2,19 +2,56 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+from bongo_solver import nobeartype
 from bongo_solver.letter_tile import LetterTile  # noqa: TC001
 
+if TYPE_CHECKING:  # pragma: no cover
+    from bongo_solver.word.word import Word
+
 
 class LetterSlot:
     """A slot to contain a letter in a word."""
 
     container_format = "[{}]"
 
-    letter_tile: LetterTile | None = None
+    # The words the slot is part of, told whenever its tile changes.
+    __words: list[Word]
 
     def __init__(self, multiplier: int = 1) -> None:
         """Initialize the letter slot."""
         self.__multiplier: int = multiplier
+        self.__letter_tile: LetterTile | None = None
+        self.__words = []
+
+    @property
+    @nobeartype
+    def letter_tile(self) -> LetterTile | None:
+        """Return the tile in the slot, if any."""
+        return self.__letter_tile
+
+    @letter_tile.setter
+    @nobeartype
+    def letter_tile(self, tile: LetterTile | None) -> None:
+        """Place a tile in the slot, or empty it, updating the words it is in."""
+        old_tile = self.__letter_tile
+        self.__letter_tile = tile
+        if not self.__words:
+            return
+
+        score_change = (tile.score if tile is not None else 0) - (
+            old_tile.score if old_tile is not None else 0
+        )
+        score_change *= self.__multiplier
+        filled_change = int(old_tile is None) - int(tile is None)
+        for word in self.__words:
+            word.slot_changed(score_change, filled_change)
+
+    @nobeartype
+    def watch(self, word: Word) -> None:
+        """Tell a word made up of the slot whenever its tile changes."""
+        self.__words.append(word)
 
     @property
     def multiplier(self) -> int:
@@ -29,15 +66,15 @@ class LetterSlot:
     @property
     def score(self) -> int:
         """Return the score of the letter tile in the slot."""
-        if self.letter_tile is None:
+        if self.__letter_tile is None:
             return 0
 
-        return self.letter_tile.score * self.__multiplier
+        return self.__letter_tile.score * self.__multiplier
 
     @property
     def is_empty(self) -> bool:
         """Return True if the slot is empty."""
-        return self.letter_tile is None
+        return self.__letter_tile is None
 
     @property
     def contents(self) -> str:
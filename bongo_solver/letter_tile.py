@@ -2,21 +2,68 @@
 
 from __future__ import annotations
 
+from typing import ClassVar, Self, cast
+
+from bongo_solver import nobeartype
+
 from .letter import Letter
 from .letter_scores import try_get_letter_score
 
+# The letter and score pairs interned at most before the table starts afresh.
+MAX_INTERNED_TILES = 4096
+
 
 class LetterTile:
-    """A class to represent a letter tile in Bongo."""
+    """A class to represent a letter tile in Bongo.
+
+    Tiles are interned by letter and score, so tiles of a letter with the
+    same score are mostly one object and compare by identity. The table is
+    emptied once it holds MAX_INTERNED_TILES pairs, as scores are arbitrary,
+    so tiles made before and after compare equal by letter and score instead.
+    """
+
+    __slots__ = ("__hash", "__letter", "__score")
+
+    __hash: int
+    __letter: Letter
+    __score: int
+    __interned: ClassVar[dict[tuple[str | Letter, int], LetterTile]] = {}
 
-    def __init__(self, letter: str | Letter, score: int | None = None) -> None:
-        """Initialize the letter tile with a single character."""
+    @nobeartype
+    def __new__(  # noqa: PYI034
+        cls,
+        letter: str | Letter,
+        score: int | None = None,
+    ) -> LetterTile:
+        """Return the tile of a letter and score, creating it on first use."""
+        if score is None:
+            score = try_get_letter_score(letter)
+
+        interned = cls.__interned.get((letter, score))
+        if interned is None:
+            interned = cls.__intern(letter, score)
+        return interned
+
+    @classmethod
+    def __intern(cls, letter: str | Letter, score: int) -> Self:
+        """Return the tile of a letter and score, interning it on first use."""
+        if len(cls.__interned) >= MAX_INTERNED_TILES:
+            cls.__interned.clear()
+
+        key = (letter, score)
         if isinstance(letter, str):
             letter = Letter(letter)
 
-        self.__letter = letter
-
-        self.__score = score if score is not None else try_get_letter_score(letter)
+        canonical = (letter, score)
+        interned = cls.__interned.get(canonical)
+        if interned is None:
+            interned = super().__new__(cls)
+            interned.__letter = letter  # noqa: SLF001
+            interned.__score = score  # noqa: SLF001
+            interned.__hash = hash(canonical)  # noqa: SLF001
+            cls.__interned[canonical] = interned
+        cls.__interned[key] = interned
+        return cast(Self, interned)
 
     @property
     def letter(self) -> Letter:
@@ -36,9 +83,18 @@ class LetterTile:
         """Return a string representation of the letter tile."""
         return f"{self.letter}({self.__score})"
 
+    def __reduce__(self) -> tuple[type[Self], tuple[Letter, int]]:
+        """Unpickle to the interned tile."""
+        return type(self), (self.__letter, self.__score)
+
     def __eq__(self, value: object) -> bool:
         """Check if object is equal to this letter tile."""
-        if not isinstance(value, LetterTile):
-            return False
+        if self is value:
+            return True
+        if isinstance(value, LetterTile):
+            return self.__score == value.__score and self.__letter == value.__letter
+        return False
 
-        return self.letter == value.letter and self.score == value.score
+    def __hash__(self) -> int:
+        """Hash the tile by its letter and score, computed once."""
+        return self.__hash
@@ -0,0 +1 @@
+"""Contains the solver that fills a board from a tile pool."""
@@ -0,0 +1,213 @@
+"""Solves boards from asyncio code without blocking the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+import weakref
+from collections.abc import AsyncGenerator, Callable  # noqa: TC003
+
+from bongo_solver import Seconds  # noqa: TC001
+from bongo_solver.board import Board  # noqa: TC001
+from bongo_solver.solver.branch_and_bound import BranchAndBoundSolver
+from bongo_solver.solver.candidate_table import CandidateTableCache  # noqa: TC001
+from bongo_solver.solver.result_cache import ResultCache  # noqa: TC001
+from bongo_solver.solver.search_stats import SearchStats  # noqa: TC001
+from bongo_solver.solver.solution import Solution  # noqa: TC001
+from bongo_solver.tile_pool import TilePool  # noqa: TC001
+
+# Seconds between looks at the progress of a search.
+DEFAULT_INTERVAL = 0.1
+# Searches run at once on an event loop when given no limit. The search
+# threads share the GIL, so running more at once only splits one core.
+DEFAULT_CONCURRENCY = 1
+
+# The limit shared by the searches given none, by event loop.
+_default_limits: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop,
+    asyncio.Semaphore,
+] = weakref.WeakKeyDictionary()
+
+
+class Progress:
+    """The best filling found by a running search and a bound on the best."""
+
+    def __init__(
+        self,
+        incumbent: Solution,
+        upper_bound: int,
+        seconds: float,
+        *,
+        done: bool,
+    ) -> None:
+        """Initialize the progress."""
+        self.__incumbent = incumbent
+        self.__upper_bound = upper_bound
+        self.__seconds = seconds
+        self.__done = done
+
+    @property
+    def incumbent(self) -> Solution:
+        """Return the best filling found so far."""
+        return self.__incumbent
+
+    @property
+    def upper_bound(self) -> int:
+        """Return a bound on the best score of any filling."""
+        return self.__upper_bound
+
+    @property
+    def seconds(self) -> float:
+        """Return the time since the search started."""
+        return self.__seconds
+
+    @property
+    def done(self) -> bool:
+        """Return True if the search has ended and the incumbent is its result."""
+        return self.__done
+
+    def __repr__(self) -> str:
+        """Return a string representation of the progress."""
+        return (
+            f"{self.__class__.__name__}({self.__incumbent.score}, "
+            f"{self.__upper_bound}, {self.__seconds:.3f}, done={self.__done})"
+        )
+
+
+async def solve_progress(  # noqa: PLR0913
+    board: Board,
+    pool: TilePool,
+    time_budget: Seconds | None = None,
+    max_gap: int = 0,
+    cache: CandidateTableCache | None = None,
+    stats: SearchStats | None = None,
+    results: ResultCache | None = None,
+    *,
+    interval: Seconds | None = DEFAULT_INTERVAL,
+    limit: asyncio.Semaphore | None = None,
+) -> AsyncGenerator[Progress, None]:
+    """Yield the progress of a search run in a worker thread, then its result.
+
+    The search is that of Board.solve_anytime. Every interval seconds the
+    progress is yielded if the incumbent or bound changed, and once the
+    search ends a last progress with done set holds its result. With an
+    interval of None only the last is yielded. Cancelling the task
+    iterating, or closing the iterator early, stops the search at its next
+    check of the time. The search waits for the limit and holds it until
+    its thread is done, so one semaphore shared by many requests bounds the
+    searches running at once. Without a limit the searches of the event loop
+    share one of DEFAULT_CONCURRENCY, see default_limit.
+
+    The search runs in a thread and holds the GIL while it runs, so the
+    event loop is slowed but not blocked, and searches running at once share
+    a single core. A larger limit only lets more of them make progress side
+    by side, each more slowly.
+
+    A solution in results for the fingerprint of the board and pool is
+    yielded without a search, and the result of a search is added to them
+    when it is proven best.
+    """
+    start = time.perf_counter()
+    key = board.fingerprint(pool) if results is not None else ""
+    held = results.get(key) if results is not None else None
+    if held is not None:
+        yield Progress(held, held.score, time.perf_counter() - start, done=True)
+        return
+
+    stop = threading.Event()
+    solvers: list[BranchAndBoundSolver] = []
+
+    def search() -> Solution:
+        solver = BranchAndBoundSolver(board, pool, cache, stats)
+        solver.stop_on(stop)
+        solvers.append(solver)
+        return solver.solve_anytime(time_budget, max_gap)
+
+    future = await start_search(search, default_limit() if limit is None else limit)
+    try:
+        last = None
+        while not (await asyncio.wait({future}, timeout=interval))[0]:
+            # The solver is not there while its candidate tables are built.
+            if not solvers:
+                continue
+            incumbent, upper_bound = solvers[0].incumbent, solvers[0].upper_bound
+            if (incumbent.score, upper_bound) != last:
+                last = incumbent.score, upper_bound
+                elapsed = time.perf_counter() - start
+                yield Progress(incumbent, upper_bound, elapsed, done=False)
+    finally:
+        stop.set()
+
+    solution = future.result()
+    upper_bound = solvers[0].upper_bound
+    if results is not None and upper_bound <= solution.score:
+        results.put(key, solution)
+    yield Progress(solution, upper_bound, time.perf_counter() - start, done=True)
+
+
+def default_limit() -> asyncio.Semaphore:
+    """Return the limit shared by the searches of the running loop given none."""
+    loop = asyncio.get_running_loop()
+    limit = _default_limits.get(loop)
+    if limit is None:
+        limit = _default_limits[loop] = asyncio.Semaphore(DEFAULT_CONCURRENCY)
+    return limit
+
+
+async def start_search(
+    search: Callable[[], Solution],
+    limit: asyncio.Semaphore | None,
+) -> asyncio.Future[Solution]:
+    """Run a search in a worker thread once the limit lets it.
+
+    The limit is held until the thread is done, not just until the search is
+    abandoned, so a stopped search still counts until it has stopped.
+    """
+    loop = asyncio.get_running_loop()
+    if limit is None:
+        return loop.run_in_executor(None, search)
+
+    await limit.acquire()
+    try:
+        future = loop.run_in_executor(None, search)
+    except BaseException:
+        limit.release()
+        raise
+    release = limit.release
+    future.add_done_callback(lambda _: release())
+    return future
+
+
+async def solve_async(  # noqa: PLR0913
+    board: Board,
+    pool: TilePool,
+    time_budget: Seconds | None = None,
+    max_gap: int = 0,
+    cache: CandidateTableCache | None = None,
+    stats: SearchStats | None = None,
+    results: ResultCache | None = None,
+    *,
+    limit: asyncio.Semaphore | None = None,
+) -> Solution:
+    """Return the solution of Board.solve_anytime, searched in a worker thread.
+
+    Without a time budget or gap it is the highest scoring filling, as from
+    Board.solve. Cancelling the awaiting task stops the search. See
+    solve_progress for the limit and results.
+    """
+    progresses = [
+        progress
+        async for progress in solve_progress(
+            board,
+            pool,
+            time_budget,
+            max_gap,
+            cache,
+            stats,
+            results,
+            interval=None,
+            limit=limit,
+        )
+    ]
+    return progresses[-1].incumbent
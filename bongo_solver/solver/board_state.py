@@ -0,0 +1,211 @@
+"""Compact integer state of a board and tile pool for the solver."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence  # noqa: TC003
+
+from bongo_solver import nobeartype
+from bongo_solver.board import BOARD_SIZE, Board
+from bongo_solver.dictionary import Dictionary  # noqa: TC001
+from bongo_solver.letter_slot.bonus_letter_slot import BonusLetterSlot
+from bongo_solver.letter_slot.letter_slot import LetterSlot
+from bongo_solver.letter_tile import LetterTile
+from bongo_solver.tile_pool import ALPHABET, TilePool
+from bongo_solver.word.bonus_word import BONUS_WORD_LENGTH
+from bongo_solver.word.word_row import WORD_ROW_LENGTH, WordRow
+
+EMPTY = 0
+# The score of a letter no tile of which the pool or board has held.
+NO_SCORE = -1
+# Letter codes run from 1 for A to 26 for Z, leaving 0 for an empty slot.
+CODES = len(ALPHABET) + 1
+CODE_BITS = 5
+SLOTS = BOARD_SIZE * WORD_ROW_LENGTH
+
+
+def letter_code(letter: str) -> int:
+    """Return the code of an uppercase letter A to Z."""
+    code = ALPHABET.find(letter) + 1
+    if len(letter) != 1 or code == EMPTY:
+        msg = f"Only the letters A to Z have codes, not '{letter}'."
+        raise ValueError(msg)
+    return code
+
+
+class BoardState:
+    """The letters on a board and the tiles left, held in flat integer arrays.
+
+    Slots are numbered row by row, so slot row * 5 + column holds the code of
+    its letter or EMPTY. Alongside sit the multiplier of each slot, the slot
+    of each bonus word letter, and the tile count and score of each letter
+    code. Placing and undoing a tile update one slot and one count in place.
+    The score of a letter is kept once its tiles have all been taken, as in
+    TilePool, so converting a pool and back loses nothing.
+    """
+
+    @classmethod
+    def from_board(cls, board: Board, pool: TilePool) -> BoardState:
+        """Read the tiles on a board and the tiles left in a pool.
+
+        The pool is read from its snapshot, which holds the tile of each
+        letter it has held, even those with no tiles left.
+        """
+        pool_counts, pool_tiles = pool.snapshot()
+        counts = [0, *pool_counts]
+        scores = [NO_SCORE]
+        scores += [tile.score if tile is not None else NO_SCORE for tile in pool_tiles]
+
+        letters = [EMPTY] * SLOTS
+        multipliers = []
+        bonus_path = []
+        for row_ix, row in enumerate(board.rows):
+            bonus_ix = row.get_bonus_ix()
+            if bonus_ix != -1:
+                bonus_path.append(row_ix * WORD_ROW_LENGTH + bonus_ix)
+            for ix, slot in enumerate(row.slots):
+                multipliers.append(slot.multiplier)
+                if slot.letter_tile is not None:
+                    code = letter_code(str(slot.letter_tile.letter))
+                    letters[row_ix * WORD_ROW_LENGTH + ix] = code
+                    scores[code] = slot.letter_tile.score
+
+        return cls(multipliers, bonus_path, counts, scores, letters)
+
+    def __init__(
+        self,
+        multipliers: Sequence[int],
+        bonus_path: Sequence[int],
+        counts: Sequence[int],
+        scores: Sequence[int],
+        letters: Sequence[int] | None = None,
+    ) -> None:
+        """Initialize the state from arrays indexed by slot and letter code."""
+        if letters is None:
+            letters = [EMPTY] * SLOTS
+        if len(multipliers) != SLOTS or len(letters) != SLOTS:
+            msg = f"A board state must have {SLOTS} slots."
+            raise ValueError(msg)
+        if len(counts) != CODES or len(scores) != CODES:
+            msg = f"A board state must have {CODES} letter codes."
+            raise ValueError(msg)
+        if len(bonus_path) != BONUS_WORD_LENGTH:
+            msg = f"A bonus word must contain {BONUS_WORD_LENGTH} slots."
+            raise ValueError(msg)
+        if any(
+            count and score == NO_SCORE
+            for count, score in zip(counts, scores, strict=True)
+        ):
+            msg = "A letter with tiles left must have a score."
+            raise ValueError(msg)
+
+        self.__letters = bytearray(letters)
+        self.__multipliers = bytes(multipliers)
+        self.__bonus_path = tuple(bonus_path)
+        self.__counts = list(counts)
+        self.__scores = list(scores)
+
+    @property
+    def letters(self) -> bytearray:
+        """Return the letter code in each slot."""
+        return self.__letters
+
+    @property
+    def multipliers(self) -> bytes:
+        """Return the multiplier of each slot."""
+        return self.__multipliers
+
+    @property
+    def bonus_path(self) -> tuple[int, ...]:
+        """Return the slots holding the bonus word, top row first."""
+        return self.__bonus_path
+
+    @property
+    def counts(self) -> list[int]:
+        """Return the number of tiles left for each letter code."""
+        return self.__counts
+
+    @property
+    def scores(self) -> list[int]:
+        """Return the tile score of each letter code, NO_SCORE if never held."""
+        return self.__scores
+
+    @nobeartype
+    def place(self, slot: int, code: int) -> None:
+        """Place a tile from the pool in an empty slot."""
+        if self.__letters[slot] != EMPTY:
+            msg = f"Slot {slot} already holds a tile."
+            raise ValueError(msg)
+        if self.__counts[code] == 0:
+            msg = f"No tile left for letter '{ALPHABET[code - 1]}'."
+            raise ValueError(msg)
+
+        self.__letters[slot] = code
+        self.__counts[code] -= 1
+
+    @nobeartype
+    def undo(self, slot: int) -> None:
+        """Return the tile in a slot to the pool."""
+        code = self.__letters[slot]
+        if code == EMPTY:
+            msg = f"Slot {slot} holds no tile."
+            raise ValueError(msg)
+
+        self.__letters[slot] = EMPTY
+        self.__counts[code] += 1
+
+    def packed_row(self, row: int) -> int:
+        """Return the letter codes of a row packed five bits each into an int."""
+        packed = 0
+        start = row * WORD_ROW_LENGTH
+        for code in self.__letters[start : start + WORD_ROW_LENGTH]:
+            packed = packed << CODE_BITS | code
+        return packed
+
+    def row_word(self, row: int) -> str:
+        """Return the word in a row, as Word.word would."""
+        start = row * WORD_ROW_LENGTH
+        return self.__spell(range(start, start + WORD_ROW_LENGTH))
+
+    def bonus_word(self) -> str:
+        """Return the bonus word, as Word.word would."""
+        return self.__spell(self.__bonus_path)
+
+    def __spell(self, slots: Sequence[int]) -> str:
+        """Return the letters in the slots, blanks inside kept as spaces."""
+        return "".join(
+            ALPHABET[self.__letters[slot] - 1] if self.__letters[slot] != EMPTY else " "
+            for slot in slots
+        ).strip()
+
+    def to_board(self, dictionary: Dictionary) -> Board:
+        """Return a board with slots and tiles laid out as in the state."""
+        rows = []
+        for row in range(BOARD_SIZE):
+            slots = []
+            for slot in range(row * WORD_ROW_LENGTH, (row + 1) * WORD_ROW_LENGTH):
+                kind = BonusLetterSlot if slot in self.__bonus_path else LetterSlot
+                letter_slot = kind(self.__multipliers[slot])
+                code = self.__letters[slot]
+                if code != EMPTY:
+                    letter_slot.letter_tile = self.__tile(code)
+                slots.append(letter_slot)
+            rows.append(WordRow(slots, dictionary))
+        return Board(rows, dictionary)
+
+    def to_pool(self) -> TilePool:
+        """Return a pool of the tiles left, keeping the tiles of used up letters."""
+        pool = TilePool()
+        pool.restore(
+            (
+                tuple(self.__counts[1:]),
+                tuple(
+                    self.__tile(code) if self.__scores[code] != NO_SCORE else None
+                    for code in range(1, CODES)
+                ),
+            ),
+        )
+        return pool
+
+    def __tile(self, code: int) -> LetterTile:
+        """Return a tile of a letter code with its score."""
+        return LetterTile(ALPHABET[code - 1], self.__scores[code])
@@ -0,0 +1,160 @@
+"""Bounds the rows left to fill while pricing the tiles they share.
+
+Summing the best word of each row on its own overcounts whenever the rows
+want the same tiles. Charging each word a price per tile it uses and adding
+the price of every tile left back once bounds every filling the tiles can
+spell, whatever the prices: a filling uses no more tiles than there are, so
+it is charged no more than was added back. Prices are tuned once per search
+by subgradient descent, raising those of the letters the rows' best words
+overuse, and the words of each row are then ranked by their priced score.
+"""
+
+from __future__ import annotations
+
+import operator
+import time
+from collections.abc import Sequence  # noqa: TC003
+from itertools import chain
+
+import numpy as np
+import numpy.typing as npt
+
+from bongo_solver import nobeartype
+from bongo_solver.solver.candidate_table import Candidate  # noqa: TC001
+
+# Prices are kept as integers in units of 1 / PRICE_SCALE points, so priced
+# scores are exact and a bound is rounded down only once.
+PRICE_SCALE = 64
+ITERATIONS = 60
+# The first step moves each price by this share of the best row scores per
+# tile for each tile too many or too few, and each step is shorter than the
+# last by DECAY.
+FIRST_STEP = 0.1
+DECAY = 0.93
+# Steps taken without lowering the bound by a point before giving up.
+PATIENCE = 15
+
+
+def letter_prices(
+    rows: Sequence[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]],
+    counts: Sequence[int],
+    iterations: int = ITERATIONS,
+    deadline: float | None = None,
+) -> list[int]:
+    """Return prices per letter index tightening the bound of the rows.
+
+    Each row is given as the optimistic scores and need matrix of its
+    candidates, see candidate_scores and need_matrix. Each step takes the
+    best priced candidate of each row and moves the prices against the tiles
+    left over, so letters used more than there are grow dearer and those left
+    unused cheaper, down to free. The prices with the lowest bound seen are
+    returned, scaled by PRICE_SCALE, once the bound stops falling by a point
+    or once time.perf_counter passes deadline. Any prices bound the rows, so
+    stopping early only loosens the bound.
+    """
+    available = np.array(counts, dtype=np.float64)
+    scores, needs = candidate_arrays(rows, len(counts))
+    row_ixs = np.arange(len(rows))
+
+    prices = np.zeros(len(counts))
+    best_prices, best_bound = prices, np.inf
+    step = FIRST_STEP * float(scores.max(axis=1).sum()) / max(sum(counts), 1)
+    stalled = 0
+    for _ in range(iterations):
+        if deadline is not None and time.perf_counter() > deadline:
+            break
+        priced = scores - needs @ prices
+        best = priced.argmax(axis=1)
+        bound = float(prices @ available + priced[row_ixs, best].sum())
+        stalled = 0 if bound <= best_bound - 1 else stalled + 1
+        if bound < best_bound:
+            best_prices, best_bound = prices, bound
+        excess = needs[row_ixs, best].sum(axis=0) - available
+        if not excess.any() or stalled == PATIENCE:
+            break
+        prices = np.maximum(prices + step * excess, 0)
+        step *= DECAY
+    return [round(price * PRICE_SCALE) for price in best_prices]
+
+
+def candidate_scores(candidates: Sequence[Candidate]) -> npt.NDArray[np.int64]:
+    """Return the optimistic score of each candidate."""
+    return np.fromiter(
+        (candidate.optimistic for candidate in candidates),
+        dtype=np.int64,
+        count=len(candidates),
+    )
+
+
+def need_matrix(
+    candidates: Sequence[Candidate],
+    letters: int,
+) -> npt.NDArray[np.int64]:
+    """Return the count of each letter index each candidate needs.
+
+    The matrix is indexed by candidate and letter. A word placed at several
+    offsets needs the same tiles at each, so each distinct need is filled in
+    once.
+    """
+    distinct: dict[tuple[tuple[int, int], ...], int] = {}
+    rows = np.fromiter(
+        (
+            distinct.setdefault(candidate.needs, len(distinct))
+            for candidate in candidates
+        ),
+        dtype=np.intp,
+        count=len(candidates),
+    )
+    # The letter and count of every need of the distinct needs, in turn.
+    cells = np.fromiter(
+        chain.from_iterable(chain.from_iterable(distinct)),
+        dtype=np.int64,
+    ).reshape(-1, 2)
+    lengths = np.fromiter(map(len, distinct), dtype=np.intp, count=len(distinct))
+    needs = np.zeros((len(distinct), letters), dtype=np.int64)
+    needs[np.repeat(np.arange(len(distinct)), lengths), cells[:, 0]] = cells[:, 1]
+    return needs[rows]
+
+
+def candidate_arrays(
+    rows: Sequence[tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]],
+    letters: int,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Return the optimistic scores and needs of the candidates of each row.
+
+    Scores are indexed by row and candidate, and needs by row, candidate and
+    letter. Rows with fewer candidates are padded with ones scoring -inf.
+    """
+    width = max((len(scores) for scores, _ in rows), default=0)
+    scores = np.full((len(rows), width), -np.inf)
+    needs = np.zeros((len(rows), width, letters))
+    for row, (row_scores, row_needs) in enumerate(rows):
+        scores[row, : len(row_scores)] = row_scores
+        needs[row, : len(row_scores)] = row_needs
+    return scores, needs
+
+
+def priced_scores(
+    scores: npt.NDArray[np.int64],
+    needs: npt.NDArray[np.int64],
+    prices: Sequence[int],
+) -> npt.NDArray[np.int64]:
+    """Return the optimistic scores of candidates less the price of their tiles.
+
+    The scores are scaled by PRICE_SCALE.
+    """
+    return scores * PRICE_SCALE - needs @ np.array(prices, dtype=np.int64)
+
+
+def priced_order(scores: npt.NDArray[np.int64]) -> npt.NDArray[np.intp]:
+    """Return the indexes of candidates by priced score, best first.
+
+    Candidates scoring the same keep their order.
+    """
+    return np.argsort(-scores, kind="stable")
+
+
+@nobeartype
+def tiles_price(prices: Sequence[int], counts: Sequence[int]) -> int:
+    """Return the price of the tiles left, scaled by PRICE_SCALE."""
+    return sum(map(operator.mul, prices, counts))
@@ -0,0 +1,1056 @@
+"""Branch-and-bound search for the highest scoring filling of a board."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import math
+import operator
+import threading  # noqa: TC003
+import time
+from bisect import bisect_right
+from collections.abc import Iterator  # noqa: TC003
+from contextlib import AbstractContextManager, nullcontext
+
+import numpy as np
+import numpy.typing as npt
+
+from bongo_solver import Seconds, nobeartype
+from bongo_solver.board import Board  # noqa: TC001
+from bongo_solver.dictionary import WordKind
+from bongo_solver.solver.bound import (
+    PRICE_SCALE,
+    candidate_scores,
+    letter_prices,
+    need_matrix,
+    priced_order,
+    priced_scores,
+    tiles_price,
+)
+from bongo_solver.solver.candidate_table import (
+    EMPTY_CANDIDATE,
+    Candidate,
+    CandidateTable,
+    CandidateTableCache,
+    pool_signature,
+    row_layout,
+)
+from bongo_solver.solver.placement import Placement
+from bongo_solver.solver.search_stats import PruneReason, SearchStats
+from bongo_solver.solver.shared_best import SharedBest  # noqa: TC001
+from bongo_solver.solver.solution import Solution
+from bongo_solver.solver.spellable import (
+    lowest_bit,
+    ranked_masks,
+    set_bits,
+    spellable,
+    spellable_masks,
+)
+from bongo_solver.solver.transposition import TranspositionTable, zobrist_keys
+from bongo_solver.tile_pool import TilePool  # noqa: TC001
+from bongo_solver.word.bonus_path import BLANK
+from bongo_solver.word.bonus_word import BONUS_WORD_LENGTH
+from bongo_solver.word.word import COMMON_WORD_MULTIPLIER, apply_common_bonus
+from bongo_solver.word_index import WILDCARD
+
+# The positions of the counts kept by a search in its tally.
+TALLY_SIZE = 5
+NODES, BOUND_PRUNES, TILE_PRUNES, BONUS_LOST, TRANSPOSITION_PRUNES = range(
+    TALLY_SIZE,
+)
+
+# An open candidate with the bound on the filling after it, the score, bonus
+# bound and bonus fillings after it and the masks of the candidates open then.
+Child = tuple[int, Candidate, int, int, int, list[int]]
+# The optimistic scores, need matrix and masks of the candidates spellable
+# with each count of each letter, see bound and spellable.spellable_masks.
+RowArrays = tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], list[list[int]]]
+
+
+class SearchTimeoutError(Exception):
+    """Raised inside the search once its time budget has run out or on a stop."""
+
+
+class BranchAndBoundSolver:
+    """Finds the highest scoring filling of a board with branch-and-bound.
+
+    Rows are filled in order from the candidate words the remaining tiles can
+    spell, those with the best bound on the filling after them first. A branch
+    is abandoned as soon as its score plus an upper bound on the remaining rows
+    and the bonus word cannot beat the best filling found so far. The bound is
+    the smallest of the best word each remaining row could still hold on its
+    own, the best pairing of the remaining tiles with the remaining slots and
+    the best words once each tile they share is priced, see bound.
+    Once a state, the rows filled, tiles left and bonus letters placed, has
+    been searched, the best score left from it bounds it wherever it recurs.
+
+    The same search can also stream the k best fillings, pruning against the
+    kth best score found so far instead of the best, or improve on a greedy
+    filling until a deadline, keeping the best filling found and a bound on
+    the best score at every moment.
+    """
+
+    def __init__(
+        self,
+        board: Board,
+        pool: TilePool,
+        cache: CandidateTableCache | None = None,
+        stats: SearchStats | None = None,
+        table: TranspositionTable | None = None,
+    ) -> None:
+        """Initialize the solver for a board and the tiles available to fill it.
+
+        The candidates of each row are taken from the cache when it holds
+        them and added to it otherwise. Without a cache rows laid out alike
+        still share their candidates. Given stats, the solver adds the work
+        of building its tables and of each search to them. The bounds of the
+        states searched are kept in the table, a new one if none is given,
+        for every search of the solver.
+        """
+        self.__dictionary = board.dictionary
+        self.__words = board.dictionary.all_words
+        self.__stats = stats
+        # The nodes, prunes and bonus words lost of the current search,
+        # indexed as NODES and the other positions. They are kept even without
+        # stats as counting costs less than checking whether to count.
+        self.__tally = [0] * TALLY_SIZE
+
+        scores = {str(k): v for k, v in pool.score_by_letter().items()}
+        counts = {str(k): v for k, v in pool.count_by_letter().items()}
+        self.__letters = sorted(scores, key=lambda letter: (-scores[letter], letter))
+        self.__letter_ix = {letter: ix for ix, letter in enumerate(self.__letters)}
+        self.__tile_scores = [scores[letter] for letter in self.__letters]
+        self.__counts = [counts[letter] for letter in self.__letters]
+
+        if cache is None:
+            cache = CandidateTableCache()
+        with self.__phase("index"):
+            tables = self.__candidate_tables(board, pool, cache)
+        self.__all_candidates = [every for every, _ in tables]
+        self.__dominant_candidates = [dominant for _, dominant in tables]
+        # The candidates of each row tried by the current search.
+        self.__candidates = self.__dominant_candidates
+        # Prices of the tiles by letter index for the current search, the
+        # priced score of each row's candidates, those scores ranked best
+        # first and masks of the best ranked candidates, see bound and
+        # spellable.ranked_masks.
+        self.__prices: list[int] = []
+        self.__candidate_priced: list[list[int]] = []
+        self.__priced_scores: list[list[int]] = []
+        self.__priced_tops: list[list[int]] = []
+        # The masks of the candidates spellable with each count of each letter
+        # of each row, in the order of scores and then, after every row, of
+        # priced scores, see spellable.spellable_masks.
+        self.__spellable: list[list[list[int]]] = []
+        # The arrays of the candidates of each row by the id of their list.
+        self.__arrays: dict[int, RowArrays] = {}
+        self.__slot_weights = self.__remaining_slot_weights(board)
+
+        # The fillings of the bonus slots still open after each row, by the
+        # index of the candidate's bonus letter plus one, 0 for a blank slot.
+        bonus_path = board.bonus_path
+        self.__all_bonus_fillings = bonus_path.all_fillings
+        self.__bonus_kinds = bonus_path.kinds
+        self.__bonus_fits = [
+            [bonus_path.fitting(row, BLANK)]
+            + [bonus_path.fitting(row, letter) for letter in self.__letters]
+            if row < BONUS_WORD_LENGTH
+            else [self.__all_bonus_fillings] * (len(self.__letters) + 1)
+            for row in range(len(board.rows))
+        ]
+        # Keys hashing the tiles left of each letter by their count and the
+        # letter in the bonus slot of each row, which tells rows apart too.
+        keys = zobrist_keys(
+            [count + 1 for count in self.__counts]
+            + [len(self.__letters) + 1] * len(board.rows),
+        )
+        self.__tile_keys = keys[: len(self.__letters)]
+        self.__row_keys = keys[len(self.__letters) :]
+        self.__table = TranspositionTable() if table is None else table
+        # The best score of the fillings found under the state being searched.
+        self.__found = -1
+        # The score a filling must beat to be worth finding, which may come
+        # from other solvers searching other branches.
+        self.__threshold = 0
+        # How far a filling may fall short of the best and still be accepted.
+        self.__gap = 0
+        self.__incumbent = self.__solution(0, [EMPTY_CANDIDATE] * len(board.rows))
+        # Bounds on the best score of all fillings and of those not yet tried.
+        self.__root_bound = self.__open_bound = 0
+        self.__shared_best: SharedBest | None = None
+        self.__syncing: SharedBest | None = None
+        self.__first_row = slice(None)
+        # The scores of the best fillings found when searching for several.
+        self.__top: list[int] | None = None
+        self.__top_size = 1
+        self.__deadline: float | None = None
+        self.__stop: threading.Event | None = None
+
+    @property
+    def first_row_size(self) -> int:
+        """Return the number of candidates for the first row."""
+        return len(self.__dominant_candidates[0])
+
+    @property
+    def incumbent(self) -> Solution:
+        """Return the best filling found by the current or last search."""
+        return self.__incumbent
+
+    @property
+    def upper_bound(self) -> int:
+        """Return a proven bound on the best score of the fillings searched.
+
+        The bound is kept up to date while searching, falling to the score of
+        the incumbent, or within the gap allowed of it, once the search ends.
+        """
+        return min(self.__root_bound, max(self.__threshold, self.__open_bound))
+
+    def share_best(self, shared_best: SharedBest) -> None:
+        """Prune against and publish to a best score shared between solvers."""
+        self.__shared_best = shared_best
+
+    def stop_on(self, stop: threading.Event) -> None:
+        """End searches soon after an event is set, as if out of time.
+
+        The event may be set from another thread. solve_anytime and solutions
+        then return what they found so far, while solve raises
+        SearchTimeoutError.
+        """
+        self.__stop = stop
+
+    def solve(self, first_row: slice | None = None) -> Solution:
+        """Search the board and return the highest scoring solution.
+
+        first_row limits the search to a slice of the first row candidates,
+        so disjoint slices split the search between solvers. A solver
+        sharing its best score returns an empty solution when its slice
+        holds nothing better than the shared score.
+        """
+        self.__first_row = slice(None) if first_row is None else first_row
+        empty = [EMPTY_CANDIDATE] * len(self.__dominant_candidates)
+        self.__start_best(self.__solution(0, empty), 0, None)
+        self.__syncing = self.__shared_best
+        self.__checkpoint()
+
+        with self.__phase("search"):
+            for _ in self.__search_all():
+                pass
+        self.__report()
+        return self.__incumbent
+
+    def solve_anytime(
+        self,
+        time_budget: Seconds | None = None,
+        max_gap: int = 0,
+    ) -> Solution:
+        """Return the best filling found before time_budget seconds pass.
+
+        The search starts from a greedy filling of the highest scoring common
+        words and improves on it, best candidates first, until time runs out
+        or no filling can beat it by more than max_gap. A larger gap or a
+        shorter budget returns sooner, with upper_bound telling how far from
+        the best score the result may be. incumbent and upper_bound may also
+        be read from another thread while the search runs.
+        """
+        if max_gap < 0:
+            msg = "The gap allowed must not be negative."
+            raise ValueError(msg)
+
+        start = time.perf_counter()
+        self.__first_row = slice(None)
+        counts = self.__counts.copy()
+        deadline = None if time_budget is None else start + time_budget
+        with self.__phase("search"):
+            self.__start_best(self.__greedy(), max_gap, deadline)
+            try:
+                for _ in self.__search_all():
+                    pass
+            except SearchTimeoutError:
+                # Leaving the search part way leaves its tiles taken.
+                self.__counts[:] = counts
+        self.__report()
+        return self.__incumbent
+
+    def solutions(
+        self,
+        k: int,
+        time_budget: Seconds | None = None,
+    ) -> Iterator[Solution]:
+        """Yield fillings of the board as they join the k best found so far.
+
+        The kth best score found so far bounds the search, so once it
+        completes the k best fillings are the k highest scoring of those
+        yielded. Every placement of a word is tried, so fillings using the
+        same tiles in different slots are told apart. The search stops early
+        once time_budget seconds have passed or when iteration stops.
+        """
+        if k < 1:
+            msg = "The number of solutions must be at least 1."
+            raise ValueError(msg)
+
+        self.__candidates = self.__all_candidates
+        self.__first_row = slice(None)
+        # Not yet holding k fillings, any filling, even an empty one, is kept.
+        self.__threshold = -1
+        self.__syncing = None
+        self.__top, self.__top_size = [], k
+        self.__deadline = None
+        if time_budget is not None:
+            self.__deadline = time.perf_counter() + time_budget
+        self.__tally[:] = [0] * TALLY_SIZE
+        self.__price_rows()
+
+        counts = self.__counts.copy()
+        try:
+            yield from self.__search_all()
+        except SearchTimeoutError:
+            return
+        finally:
+            # Leaving the search part way leaves its tiles taken.
+            self.__counts[:] = counts
+            self.__report()
+
+    def __start_best(
+        self,
+        incumbent: Solution,
+        gap: int,
+        deadline: float | None,
+    ) -> None:
+        """Reset the search for the best filling to start from an incumbent.
+
+        The search, pricing the tiles included, ends at deadline, a
+        time.perf_counter value.
+        """
+        self.__candidates = self.__dominant_candidates
+        self.__incumbent = incumbent
+        self.__gap = gap
+        self.__threshold = incumbent.score + gap
+        self.__syncing = None
+        self.__top = None
+        self.__deadline = deadline
+        self.__tally[:] = [0] * TALLY_SIZE
+        self.__price_rows()
+        opens = self.__root_opens()
+        self.__root_bound = self.__open_bound = self.__rest_bound(0, opens)
+
+    def __greedy(self) -> Solution:
+        """Return a filling of each row in turn with the best common word left.
+
+        Rows where no common word can still be spelled are left empty.
+        """
+        counts = self.__counts.copy()
+        chosen = []
+        for candidates in self.__candidates:
+            for candidate in candidates:
+                if candidate is EMPTY_CANDIDATE or (
+                    self.__dictionary.is_common(candidate.word)
+                    and all(counts[ix] >= count for ix, count in candidate.needs)
+                ):
+                    break
+            for ix, count in candidate.needs:
+                counts[ix] -= count
+            chosen.append(candidate)
+
+        bonus_fillings = self.__all_bonus_fillings
+        for fits, candidate in zip(self.__bonus_fits, chosen, strict=True):
+            bonus_fillings &= fits[candidate.bonus_letter + 1]
+        score = sum(candidate.score for candidate in chosen)
+        score += self.__bonus_score(chosen, bonus_fillings)
+        return self.__solution(score, chosen)
+
+    def __candidate_tables(
+        self,
+        board: Board,
+        pool: TilePool,
+        cache: CandidateTableCache,
+    ) -> list[CandidateTable]:
+        """Return the candidate table of each row, building those not cached.
+
+        The dictionary is only scanned for the words the pool can spell when
+        a table has to be built.
+        """
+        signature = pool_signature(pool)
+        words = None
+        tables = []
+        for row in board.rows:
+            key = (self.__dictionary.version, row_layout(row), signature)
+            table = cache.get(key)
+            if self.__stats is not None:
+                self.__stats.add_cache_lookup(hit=table is not None)
+            if table is None:
+                if words is None:
+                    words = self.__feasible_words(
+                        max(len(other.slots) for other in board.rows),
+                    )
+                every = self.__row_candidates(
+                    [slot.multiplier for slot in row.slots],
+                    row.get_bonus_ix(),
+                    words,
+                )
+                table = (every, self.__without_dominated(every))
+                cache.put(key, table)
+            tables.append(table)
+        return tables
+
+    def __feasible_words(
+        self,
+        max_length: int,
+    ) -> list[tuple[str, tuple[tuple[int, int], ...], bool]]:
+        """Return the words that can be spelled from the pool with their needs."""
+        available = dict(zip(self.__letters, self.__counts, strict=True))
+        feasible = []
+        for length in self.__dictionary.index.lengths:
+            if not 0 < length <= max_length:
+                continue
+            for word in self.__dictionary.matching(WILDCARD * length, available):
+                needs = tuple(
+                    sorted(
+                        (self.__letter_ix[letter], word.count(letter))
+                        for letter in set(word)
+                    ),
+                )
+                feasible.append((word, needs, self.__dictionary.is_common(word)))
+        if self.__stats is not None:
+            self.__stats.add_words_scanned(len(feasible))
+        return feasible
+
+    def __row_candidates(
+        self,
+        multipliers: list[int],
+        bonus_ix: int,
+        words: list[tuple[str, tuple[tuple[int, int], ...], bool]],
+    ) -> list[Candidate]:
+        """Return every placement of the words in a row, best scoring first.
+
+        A row not holding a word scores nothing, but a lone tile in its bonus
+        slot still counts towards the bonus word, so each letter not a word
+        on its own is a candidate there too.
+        """
+        candidates = []
+        for word, needs, is_common in words:
+            letter_scores = [self.__tile_scores[self.__letter_ix[c]] for c in word]
+            for offset in range(len(multipliers) - len(word) + 1):
+                score = sum(
+                    s * m
+                    for s, m in zip(letter_scores, multipliers[offset:], strict=False)
+                )
+                if is_common:
+                    score = apply_common_bonus(score)
+
+                bonus_letter, bonus_score = -1, 0
+                if offset <= bonus_ix < offset + len(word):
+                    bonus_letter = self.__letter_ix[word[bonus_ix - offset]]
+                    bonus_score = (
+                        self.__tile_scores[bonus_letter] * multipliers[bonus_ix]
+                    )
+                optimistic = score + math.ceil(bonus_score * COMMON_WORD_MULTIPLIER)
+
+                candidates.append(
+                    Candidate(
+                        score,
+                        word,
+                        offset,
+                        needs,
+                        bonus_letter,
+                        bonus_score,
+                        optimistic,
+                    ),
+                )
+
+        if bonus_ix >= 0:
+            words_of_one = {word for word, _, _ in words if len(word) == 1}
+            candidates.extend(
+                self.__lone_tile(letter, multipliers[bonus_ix], bonus_ix)
+                for letter in self.__letters
+                if letter not in words_of_one
+            )
+
+        candidates.sort(key=lambda c: (-c.optimistic, -c.score, c.word, c.offset))
+        candidates.append(EMPTY_CANDIDATE)
+        return candidates
+
+    def __lone_tile(self, letter: str, multiplier: int, bonus_ix: int) -> Candidate:
+        """Return the candidate of a lone tile in the bonus slot of a row."""
+        ix = self.__letter_ix[letter]
+        bonus_score = self.__tile_scores[ix] * multiplier
+        return Candidate(
+            0,
+            letter,
+            bonus_ix,
+            ((ix, 1),),
+            ix,
+            bonus_score,
+            math.ceil(bonus_score * COMMON_WORD_MULTIPLIER),
+        )
+
+    @nobeartype
+    def __is_lone_tile(self, candidate: Candidate) -> bool:
+        """Return True if a candidate is a lone tile, not a word."""
+        return bool(candidate.word) and candidate.word not in self.__words
+
+    def __without_dominated(self, candidates: list[Candidate]) -> list[Candidate]:
+        """Return the candidates worth trying when only the best filling counts.
+
+        Of the placements using the same tiles and putting the same letter in
+        the bonus slot only the highest scoring one is kept.
+        """
+        seen = set()
+        kept = []
+        for candidate in candidates[:-1]:
+            key = (candidate.needs, candidate.bonus_letter)
+            if key not in seen:
+                seen.add(key)
+                kept.append(candidate)
+        kept.append(EMPTY_CANDIDATE)
+        return kept
+
+    def __remaining_slot_weights(self, board: Board) -> list[list[int]]:
+        """Return the sums of the highest multipliers of the open slots.
+
+        At each depth, the ith sum is of the i highest multipliers of the
+        slots not yet filled. Bonus slots count twice while the bonus word is
+        still open as a tile placed there scores in both its row and the bonus
+        word.
+        """
+        weights = []
+        for depth in range(len(board.rows) + 1):
+            remaining: list[int] = []
+            for row_ix, row in enumerate(board.rows[depth:], start=depth):
+                bonus_ix = row.get_bonus_ix() if row_ix < BONUS_WORD_LENGTH else -1
+                remaining.extend(
+                    slot.multiplier * (2 if ix == bonus_ix else 1)
+                    for ix, slot in enumerate(row.slots)
+                )
+            weights.append(
+                list(itertools.accumulate(sorted(remaining, reverse=True), initial=0)),
+            )
+        return weights
+
+    def __search_all(self) -> Iterator[Solution]:
+        """Search every row from the top of an empty board."""
+        key = 0
+        for keys, count in zip(self.__tile_keys, self.__counts, strict=True):
+            key ^= keys[count]
+        return self.__search(
+            0,
+            0,
+            0,
+            self.__all_bonus_fillings,
+            [],
+            self.__root_opens(),
+            key,
+        )
+
+    @nobeartype
+    def __search(  # noqa: PLR0913
+        self,
+        depth: int,
+        score: int,
+        bonus_bound: int,
+        bonus_fillings: int,
+        chosen: list[Candidate],
+        opens: list[int],
+        key: int,
+    ) -> Iterator[Solution]:
+        """Fill the rows from depth onward, yielding each filling kept.
+
+        The score is that of the rows chosen so far, including the bonus word
+        once all its rows are chosen. Until then bonus_bound bounds the share
+        of the bonus word taken by the chosen rows, and bonus_fillings holds
+        the words the bonus slots can still spell. Once it is empty the bonus
+        word scores nothing. opens holds a mask of the candidates of each open
+        row the remaining tiles can spell, bit i for the ith candidate, in the
+        order of scores and then, after every row, of priced scores. key
+        hashes the state.
+
+        Once searched, the score left from the state is bounded by the best
+        filling found in it or, failing that, the threshold every branch not
+        searched was pruned against.
+        """
+        if depth == len(self.__candidates):
+            if score > self.__threshold:
+                yield self.__record(score, chosen)
+            return
+
+        found = self.__found
+        self.__found = -1
+        yield from self.__expand(
+            depth,
+            score,
+            bonus_bound,
+            bonus_fillings,
+            chosen,
+            opens,
+            key,
+        )
+        self.__table.store(key, depth, max(self.__found, self.__threshold) - score)
+        self.__found = max(found, self.__found)
+
+    @nobeartype
+    def __expand(  # noqa: PLR0913
+        self,
+        depth: int,
+        score: int,
+        bonus_bound: int,
+        bonus_fillings: int,
+        chosen: list[Candidate],
+        opens: list[int],
+        key: int,
+    ) -> Iterator[Solution]:
+        """Try each open candidate of the row at depth, searching the rest.
+
+        The candidates are tried best bound first, so good fillings are found
+        early and the threshold rises before the weaker candidates are tried.
+        """
+        self.__checkpoint()
+        tally = self.__tally
+        tally[NODES] += 1
+        counts = self.__counts
+        children = self.__children(
+            depth,
+            score,
+            bonus_bound,
+            bonus_fillings,
+            chosen,
+            opens,
+        )
+        # Sorting in reverse keeps the candidates with equal bounds in order.
+        children.sort(key=operator.itemgetter(0), reverse=True)
+        for ix, child in enumerate(children):
+            bound, candidate, new_score, new_bonus_bound, new_fillings, new_opens = (
+                child
+            )
+            # The threshold may have risen since the bound was taken.
+            if bound <= self.__threshold:
+                tally[BOUND_PRUNES] += len(children) - ix
+                break
+
+            needs = candidate.needs
+            for letter_ix, count in needs:
+                counts[letter_ix] -= count
+            chosen.append(candidate)
+
+            new_key = self.__placed_key(key, depth, candidate)
+            # Counted against the table when only its bound prunes.
+            if new_score + self.__table.bound(new_key) <= self.__threshold:
+                tally[TRANSPOSITION_PRUNES] += 1
+            else:
+                yield from self.__search(
+                    depth + 1,
+                    new_score,
+                    new_bonus_bound,
+                    new_fillings,
+                    chosen,
+                    new_opens,
+                    new_key,
+                )
+
+            chosen.pop()
+            for letter_ix, count in needs:
+                counts[letter_ix] += count
+
+    @nobeartype
+    def __children(  # noqa: PLR0913
+        self,
+        depth: int,
+        score: int,
+        bonus_bound: int,
+        bonus_fillings: int,
+        chosen: list[Candidate],
+        opens: list[int],
+    ) -> list[Child]:
+        """Return each open candidate of the row at depth not pruned by a bound.
+
+        Each comes with the bound on the filling after it, the score, bonus
+        bound and bonus fillings after it and the masks of the candidates the
+        tiles left then spell.
+        """
+        tally = self.__tally
+        counts = self.__counts
+        candidates = self.__candidates[depth]
+        candidate_priced = self.__candidate_priced[depth]
+        priced_rest = self.__priced_rest(depth + 1, opens)
+        rest_bound = min(
+            self.__rows_bound(depth + 1, opens),
+            self.__tiles_bound(depth + 1),
+            priced_rest // PRICE_SCALE,
+        )
+        # The least priced score of a candidate worth trying, scaled.
+        least = (self.__threshold - score - bonus_bound + 1) * PRICE_SCALE
+        least -= priced_rest
+        children = []
+        for candidate_ix in self.__open_candidates(depth, opens, least):
+            candidate = candidates[candidate_ix]
+            if (
+                score + bonus_bound + candidate.optimistic + rest_bound
+                <= self.__threshold
+            ):
+                tally[BOUND_PRUNES] += 1
+                break
+
+            # The candidate's priced score with the best priced rows after it.
+            priced = priced_rest + candidate_priced[candidate_ix]
+            if score + bonus_bound + priced // PRICE_SCALE <= self.__threshold:
+                tally[BOUND_PRUNES] += 1
+                continue
+
+            needs = candidate.needs
+            for ix, count in needs:
+                counts[ix] -= count
+            chosen.append(candidate)
+
+            new_score = score + candidate.score
+            new_fillings = (
+                bonus_fillings & self.__bonus_fits[depth][candidate.bonus_letter + 1]
+            )
+            # Counted when the candidate leaves no word for the bonus slots.
+            tally[BONUS_LOST] += bool(bonus_fillings) > bool(new_fillings)
+            # A lone tile only scores in the bonus word, so fillings with one
+            # and no bonus word are left to those without the tile.
+            if (
+                not new_fillings
+                and depth < BONUS_WORD_LENGTH
+                and any(map(self.__is_lone_tile, chosen))
+            ):
+                chosen.pop()
+                for ix, count in needs:
+                    counts[ix] += count
+                continue
+            if depth + 1 == BONUS_WORD_LENGTH:
+                new_score += self.__bonus_score(chosen, new_fillings)
+            # The bonus word has no share left to bound once it is scored or
+            # no word can be spelled in its slots.
+            new_bonus_bound = (
+                bonus_bound + candidate.optimistic - candidate.score
+                if new_fillings and depth + 1 < BONUS_WORD_LENGTH
+                else 0
+            )
+
+            new_opens = opens.copy()
+            floor = self.__threshold - new_score - new_bonus_bound
+            bound = new_score + new_bonus_bound
+            bound += self.__rest_bound_after(depth + 1, new_opens, needs, floor)
+            if bound <= self.__threshold:
+                tally[BOUND_PRUNES] += 1
+            else:
+                children.append(
+                    (
+                        bound,
+                        candidate,
+                        new_score,
+                        new_bonus_bound,
+                        new_fillings,
+                        new_opens,
+                    ),
+                )
+
+            chosen.pop()
+            for ix, count in needs:
+                counts[ix] += count
+        return children
+
+    @nobeartype
+    def __placed_key(self, key: int, depth: int, candidate: Candidate) -> int:
+        """Return the key of a state once a candidate placed at depth is taken.
+
+        The tiles of the candidate are already taken from the counts, as the
+        key is only worked out for states the bounds leave open.
+        """
+        counts = self.__counts
+        tile_keys = self.__tile_keys
+        key ^= self.__row_keys[depth][candidate.bonus_letter + 1]
+        for ix, count in candidate.needs:
+            key ^= tile_keys[ix][counts[ix] + count] ^ tile_keys[ix][counts[ix]]
+        return key
+
+    @nobeartype
+    def __open_candidates(
+        self,
+        depth: int,
+        opens: list[int],
+        least: int,
+    ) -> Iterator[int]:
+        """Yield the indexes of the candidates of a row worth trying, best first.
+
+        Below the first row those the remaining tiles cannot spell are left
+        out, as are most of those with a priced score below least.
+        """
+        if depth == 0:
+            return self.__root_candidates(opens)
+        return set_bits(opens[depth] & self.__priced_top(depth, least))
+
+    def __root_candidates(self, opens: list[int]) -> Iterator[int]:
+        """Yield the first row candidates, bounding the fillings not yet tried.
+
+        Candidates come best bound first, so the fillings left to try can
+        score no more than the bound of the candidate being tried. Every
+        candidate is spelled from the pool, so none is skipped.
+        """
+        rest_bound = self.__rest_bound(1, opens)
+        candidates = self.__candidates[0]
+        for ix in range(len(candidates))[self.__first_row]:
+            self.__open_bound = candidates[ix].optimistic + rest_bound
+            yield ix
+        self.__open_bound = 0
+
+    @nobeartype
+    def __priced_top(self, row: int, least: int) -> int:
+        """Return a mask of the fewest best priced candidates of a row.
+
+        It holds every candidate with a priced score of at least least, and
+        fewer than as many again.
+        """
+        ranked = self.__priced_scores[row]
+        count = bisect_right(ranked, -least, key=operator.neg)
+        return self.__priced_tops[row][(count - 1).bit_length()] if count else 0
+
+    def __record(self, score: int, chosen: list[Candidate]) -> Solution:
+        """Keep a filling beating the threshold and raise the threshold.
+
+        When searching for the best filling it becomes the incumbent and its
+        score is shared, otherwise it joins the best scores found, pushing out
+        the lowest once there are k.
+        """
+        self.__found = max(self.__found, score)
+        if self.__top is None:
+            self.__threshold = score + self.__gap
+            self.__incumbent = self.__solution(score, chosen)
+            if self.__syncing is not None:
+                self.__syncing.offer(score)
+            return self.__incumbent
+
+        if len(self.__top) == self.__top_size:
+            heapq.heapreplace(self.__top, score)
+        else:
+            heapq.heappush(self.__top, score)
+        if len(self.__top) == self.__top_size:
+            self.__threshold = self.__top[0]
+        return self.__solution(score, chosen)
+
+    def __solution(self, score: int, chosen: list[Candidate]) -> Solution:
+        """Return the solution of a filling."""
+        placements = [
+            Placement(word, offset, row_score) if word else None
+            for row_score, word, offset, *_ in chosen
+        ]
+        return Solution(placements, self.__bonus_letters(chosen).strip(), score)
+
+    def __phase(self, name: str) -> AbstractContextManager[None]:
+        """Return a context timing a phase when gathering stats."""
+        if self.__stats is None:
+            return nullcontext()
+        return self.__stats.phase(name)
+
+    def __report(self) -> None:
+        """Add the tally of the last search to the stats, if any."""
+        if self.__stats is None:
+            return
+        tally = self.__tally
+        self.__stats.add_search(
+            tally[NODES],
+            {
+                PruneReason.BOUND: tally[BOUND_PRUNES],
+                PruneReason.TILES: tally[TILE_PRUNES],
+                PruneReason.TRANSPOSITION: tally[TRANSPOSITION_PRUNES],
+            },
+            tally[BONUS_LOST],
+        )
+        tally[:] = [0] * TALLY_SIZE
+
+    @nobeartype
+    def __checkpoint(self) -> None:
+        """Raise the threshold to any higher shared score, stop if out of time."""
+        if self.__syncing is not None:
+            self.__threshold = max(self.__threshold, self.__syncing.value)
+        if self.__deadline is not None and time.perf_counter() > self.__deadline:
+            raise SearchTimeoutError
+        if self.__stop is not None and self.__stop.is_set():
+            raise SearchTimeoutError
+
+    @nobeartype
+    def __narrow(
+        self,
+        depth: int,
+        opens: list[int],
+        needs: tuple[tuple[int, int], ...],
+        start: int,
+    ) -> None:
+        """Drop the candidates no longer spelled from the masks of open rows.
+
+        The masks of the rows from depth onward starting at start in opens
+        are narrowed in place. Only the letters just taken can run short, and
+        tiles are only ever taken on the way down the search, so a candidate
+        dropped stays so for the rest of the branch.
+        """
+        counts = self.__counts
+        masks = self.__spellable
+        for ix in range(start + depth, start + len(self.__candidates)):
+            mask = opens[ix]
+            for letter, _ in needs:
+                mask &= masks[ix][letter][counts[letter]]
+            if not start:
+                self.__tally[TILE_PRUNES] += opens[ix].bit_count() - mask.bit_count()
+            opens[ix] = mask
+
+    @nobeartype
+    def __root_opens(self) -> list[int]:
+        """Return the masks of the candidates of every row the pool spells."""
+        sizes = [len(row) for row in self.__candidates]
+        sizes += [len(row) for row in self.__priced_scores]
+        return [
+            spellable(masks, self.__counts, size)
+            for masks, size in zip(self.__spellable, sizes, strict=True)
+        ]
+
+    def __price_rows(self) -> None:
+        """Price the tiles for the candidates of the search, rank and index them.
+
+        Pricing stops at the deadline of the search. Rows laid out alike
+        share their candidates, and so their rankings and masks.
+        """
+        rows = [self.__row_arrays(candidates) for candidates in self.__candidates]
+        self.__prices = letter_prices(
+            [(scores, needs) for scores, needs, _ in rows],
+            self.__counts,
+            deadline=self.__deadline,
+        )
+        indexes = {}
+        for candidates, (scores, needs, _) in zip(self.__candidates, rows, strict=True):
+            if id(candidates) in indexes:
+                continue
+            priced = priced_scores(scores, needs, self.__prices)
+            order = priced_order(priced)
+            indexes[id(candidates)] = (
+                priced.tolist(),
+                priced[order].tolist(),
+                ranked_masks(order),
+                spellable_masks(needs[order], self.__counts),
+            )
+        priced_rows = [indexes[id(candidates)] for candidates in self.__candidates]
+        self.__candidate_priced = [row[0] for row in priced_rows]
+        self.__priced_scores = [row[1] for row in priced_rows]
+        self.__priced_tops = [row[2] for row in priced_rows]
+        self.__spellable = [masks for _, _, masks in rows]
+        self.__spellable += [row[3] for row in priced_rows]
+
+    def __row_arrays(self, candidates: list[Candidate]) -> RowArrays:
+        """Return the optimistic scores, need matrix and masks of candidates.
+
+        They do not depend on the prices, so they are built on first use and
+        kept for every search of the solver.
+        """
+        arrays = self.__arrays.get(id(candidates))
+        if arrays is None:
+            needs = need_matrix(candidates, len(self.__counts))
+            arrays = (
+                candidate_scores(candidates),
+                needs,
+                spellable_masks(needs, self.__counts),
+            )
+            self.__arrays[id(candidates)] = arrays
+        return arrays
+
+    @nobeartype
+    def __rest_bound(self, depth: int, opens: list[int]) -> int:
+        """Return the least of the bounds on the rows from depth onward."""
+        return min(
+            self.__rows_bound(depth, opens),
+            self.__tiles_bound(depth),
+            self.__priced_bound(depth, opens),
+        )
+
+    @nobeartype
+    def __rest_bound_after(
+        self,
+        depth: int,
+        opens: list[int],
+        needs: tuple[tuple[int, int], ...],
+        floor: int,
+    ) -> int:
+        """Return a bound on the rows from depth onward after taking needs.
+
+        The masks of opens are first narrowed to the candidates spelled after
+        taking the tiles of needs. The bounds are taken tightest first as a
+        rule, stopping at one not above floor, and the masks of the order of
+        priced scores are only narrowed for the priced bound.
+        """
+        self.__narrow(depth, opens, needs, 0)
+        rows_bound = self.__rows_bound(depth, opens)
+        if rows_bound <= floor:
+            return rows_bound
+        bound = min(rows_bound, self.__tiles_bound(depth))
+        if bound <= floor:
+            return bound
+        self.__narrow(depth, opens, needs, len(self.__candidates))
+        return min(bound, self.__priced_bound(depth, opens))
+
+    @nobeartype
+    def __rows_bound(self, depth: int, opens: list[int]) -> int:
+        """Return the sum of the best feasible row scores from depth onward."""
+        return sum(
+            self.__candidates[row][lowest_bit(opens[row])].optimistic
+            for row in range(depth, len(self.__candidates))
+        )
+
+    @nobeartype
+    def __priced_bound(self, depth: int, opens: list[int]) -> int:
+        """Return the price of the remaining tiles plus the best priced rows.
+
+        With each row's best priced candidate still feasible this bounds the
+        rows from depth onward whatever tiles they share.
+        """
+        return self.__priced_rest(depth, opens) // PRICE_SCALE
+
+    @nobeartype
+    def __priced_rest(self, depth: int, opens: list[int]) -> int:
+        """Return the priced bound from depth onward scaled by PRICE_SCALE."""
+        rows = len(self.__candidates)
+        return tiles_price(self.__prices, self.__counts) + sum(
+            self.__priced_scores[row][lowest_bit(opens[rows + row])]
+            for row in range(depth, rows)
+        )
+
+    @nobeartype
+    def __tiles_bound(self, depth: int) -> int:
+        """Return the best pairing of the remaining tiles with the open slots.
+
+        Tiles are ordered by score, so the highest scoring tiles are paired
+        with the highest multipliers. Every word is assumed to be common, with
+        slack for rounding each row and the bonus word.
+        """
+        weights = self.__slot_weights[depth]
+        slots = len(weights) - 1
+        total = 0
+        slot = 0
+        for tile_score, count in zip(self.__tile_scores, self.__counts, strict=True):
+            if slot + count >= slots:
+                total += tile_score * (weights[slots] - weights[slot])
+                break
+            total += tile_score * (weights[slot + count] - weights[slot])
+            slot += count
+        rounding = (len(self.__candidates) - depth + 1) / 2
+        return math.floor(total * COMMON_WORD_MULTIPLIER + rounding)
+
+    @nobeartype
+    def __bonus_letters(self, chosen: list[Candidate]) -> str:
+        """Return the bonus slot contents of the chosen rows, blanks as spaces."""
+        return "".join(
+            self.__letters[candidate.bonus_letter]
+            if candidate.bonus_letter >= 0
+            else BLANK
+            for candidate in chosen[:BONUS_WORD_LENGTH]
+        )
+
+    @nobeartype
+    def __bonus_score(self, chosen: list[Candidate], bonus_fillings: int) -> int:
+        """Return the score of the bonus word spelled by the chosen rows.
+
+        With every bonus slot decided at most the one filling they spell is
+        left, and none when they spell no word.
+        """
+        if not bonus_fillings:
+            return 0
+        score = sum(candidate.bonus_score for candidate in chosen[:BONUS_WORD_LENGTH])
+        if self.__bonus_kinds[bonus_fillings.bit_length() - 1] is WordKind.COMMON:
+            return apply_common_bonus(score)
+        return score
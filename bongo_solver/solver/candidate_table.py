@@ -0,0 +1,189 @@
+"""Caches the ranked candidate placements of rows between solves."""
+
+from __future__ import annotations
+
+import json
+import os
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from bongo_solver import nobeartype
+from bongo_solver.tile_pool import TilePool  # noqa: TC001
+from bongo_solver.tokenizer import RowLayout
+from bongo_solver.word.word_row import WordRow  # noqa: TC001
+
+
+@nobeartype
+class Candidate(NamedTuple):
+    """A candidate filling of a row, a word placed at an offset."""
+
+    score: int
+    word: str
+    offset: int
+    # The count of each letter the word needs, by letter index.
+    needs: tuple[tuple[int, int], ...]
+    # The index of the letter placed in the bonus slot, -1 if none.
+    bonus_letter: int
+    bonus_score: int
+    # The score with the share of the bonus word the bonus letter may earn.
+    optimistic: int
+
+
+EMPTY_CANDIDATE = Candidate(0, "", 0, (), -1, 0, 0)
+
+# Every placement of a row, best first, and the placements kept from them
+# when only the best filling of the board counts.
+CandidateTable = tuple[list[Candidate], list[Candidate]]
+
+# The count and score of each letter of a pool, in alphabetical order.
+PoolSignature = tuple[tuple[str, int, int], ...]
+# The dictionary version, row layout and pool signature a table is built for.
+TableKey = tuple[str, RowLayout, PoolSignature]
+
+FORMAT_VERSION = 6
+DEFAULT_MAX_TABLES = 64
+
+
+def candidate_from_json(fields: list[Any]) -> Candidate:
+    """Return a candidate written as a JSON list of its fields."""
+    score, word, offset, needs, bonus_letter, bonus_score, optimistic = fields
+    candidate = Candidate(
+        score,
+        word,
+        offset,
+        tuple((ix, count) for ix, count in needs),
+        bonus_letter,
+        bonus_score,
+        optimistic,
+    )
+    return EMPTY_CANDIDATE if candidate == EMPTY_CANDIDATE else candidate
+
+
+def table_to_json(key: TableKey, table: CandidateTable) -> list[Any]:
+    """Return a table and its key as JSON data, for table_from_json.
+
+    The candidates kept when only the best filling counts are written as
+    their indexes among every candidate.
+    """
+    every, dominant = table
+    indexes = {id(candidate): ix for ix, candidate in enumerate(every)}
+    return [key, every, [indexes[id(candidate)] for candidate in dominant]]
+
+
+def table_from_json(data: list[Any]) -> tuple[TableKey, CandidateTable]:
+    """Return the table and key written as JSON data by table_to_json."""
+    (version, (multipliers, bonus_ix), signature), every, dominant = data
+    key = (
+        version,
+        (tuple(multipliers), bonus_ix),
+        tuple((letter, count, score) for letter, count, score in signature),
+    )
+    candidates = [candidate_from_json(fields) for fields in every]
+    return key, (candidates, [candidates[ix] for ix in dominant])
+
+
+def row_layout(row: WordRow) -> RowLayout:
+    """Return the layout of a row's slots."""
+    return tuple(slot.multiplier for slot in row.slots), row.get_bonus_ix()
+
+
+def pool_signature(pool: TilePool) -> PoolSignature:
+    """Return the letters of a pool with their counts and scores."""
+    scores = pool.score_by_letter()
+    return tuple(
+        sorted(
+            (str(letter), count, scores[letter])
+            for letter, count in pool.count_by_letter().items()
+        ),
+    )
+
+
+class CandidateTableCache:
+    """The candidate tables of row layouts and pools most recently used.
+
+    A table depends only on the layout of its row, the letters of the pool
+    and the dictionary, so rows laid out alike share it, whether on one board
+    or on the boards of different days. Given a path, the cache starts with
+    the tables saved there as JSON, if any, and save writes them back.
+    """
+
+    def __init__(
+        self,
+        max_tables: int = DEFAULT_MAX_TABLES,
+        path: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache, loading the tables saved at the path."""
+        if max_tables < 1:
+            msg = "A candidate table cache must hold at least 1 table."
+            raise ValueError(msg)
+
+        self.__max_tables = max_tables
+        self.__path = Path(path) if path is not None else None
+        self.__tables: OrderedDict[TableKey, CandidateTable] = OrderedDict()
+        if self.__path is not None and self.__path.exists():
+            self.__load(self.__path)
+
+    @property
+    def max_tables(self) -> int:
+        """Return the number of tables kept before the least recent is evicted."""
+        return self.__max_tables
+
+    @property
+    def path(self) -> Path | None:
+        """Return the file the tables are saved to, if any."""
+        return self.__path
+
+    def __len__(self) -> int:
+        """Return the number of tables held."""
+        return len(self.__tables)
+
+    def __contains__(self, key: TableKey) -> bool:
+        """Return True if a table is held for the key."""
+        return key in self.__tables
+
+    def get(self, key: TableKey) -> CandidateTable | None:
+        """Return the table of a key, marking it as recently used."""
+        table = self.__tables.get(key)
+        if table is not None:
+            self.__tables.move_to_end(key)
+        return table
+
+    def put(self, key: TableKey, table: CandidateTable) -> None:
+        """Hold a table, evicting the least recently used beyond the limit."""
+        self.__tables[key] = table
+        self.__tables.move_to_end(key)
+        while len(self.__tables) > self.__max_tables:
+            self.__tables.popitem(last=False)
+
+    def save(self) -> None:
+        """Write the tables to the path of the cache.
+
+        The tables are written to a temporary file of this process first, so
+        a reader never finds the file half written, even while other worker
+        processes save to the same path.
+        """
+        if self.__path is None:
+            msg = "A candidate table cache without a path cannot be saved."
+            raise ValueError(msg)
+
+        tables = [table_to_json(key, table) for key, table in self.__tables.items()]
+        partial = self.__path.with_name(f"{self.__path.name}.{os.getpid()}.tmp")
+        partial.write_text(json.dumps({"version": FORMAT_VERSION, "tables": tables}))
+        partial.replace(self.__path)
+
+    def __load(self, path: Path) -> None:
+        """Hold the most recently used tables saved at a path."""
+        try:
+            data = json.loads(path.read_bytes())
+        except ValueError as e:
+            msg = f"The candidate table cache {path} is not valid JSON."
+            raise ValueError(msg) from e
+        version = data.get("version") if isinstance(data, dict) else None
+        if version != FORMAT_VERSION:
+            msg = f"Unsupported candidate table cache version {version}."
+            raise ValueError(msg)
+
+        self.__tables.update(
+            table_from_json(table) for table in data["tables"][-self.__max_tables :]
+        )
@@ -0,0 +1,103 @@
+"""Splits the search of a board across processes."""
+
+from __future__ import annotations
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+from bongo_solver.board import Board  # noqa: TC001
+from bongo_solver.solver.branch_and_bound import BranchAndBoundSolver
+from bongo_solver.solver.candidate_table import CandidateTableCache  # noqa: TC001
+from bongo_solver.solver.shared_best import SharedBest
+from bongo_solver.solver.solution import Solution
+from bongo_solver.solver.worker_state import keep_worker_state, worker_state
+from bongo_solver.tile_pool import TilePool  # noqa: TC001
+
+# Slices of the first row handed out per worker, so that workers finishing
+# early can take more work.
+TASKS_PER_WORKER = 16
+
+# The index of a slice of the first row, the best filling found in it and a
+# bound on the score of the fillings it holds.
+SliceResult = tuple[int, Solution, int]
+
+
+def init_worker(solver: BranchAndBoundSolver, shared_best: SharedBest) -> None:
+    """Keep the solver shipped to a worker and share the best score with it."""
+    solver.share_best(shared_best)
+    keep_worker_state(solver=solver)
+
+
+def solve_slice(task: tuple[int, slice]) -> SliceResult:
+    """Search a slice of the first row candidates in a worker.
+
+    task holds the index of the slice and the slice itself.
+    """
+    index, first_row = task
+    solver: BranchAndBoundSolver = worker_state("solver")
+    solution = solver.solve(first_row)
+    return index, solution, solver.upper_bound
+
+
+def first_row_slices(size: int, workers: int) -> list[slice]:
+    """Split the first row candidates into slices, best candidates first."""
+    step = max(1, math.ceil(size / (workers * TASKS_PER_WORKER)))
+    return [slice(start, start + step) for start in range(0, size, step)]
+
+
+def solve_parallel(
+    board: Board,
+    pool: TilePool,
+    workers: int,
+    cache: CandidateTableCache | None = None,
+) -> Solution:
+    """Return the highest scoring filling of a board searched by processes.
+
+    The candidates for the first row are split into slices searched by a
+    pool of worker processes. The solver, with the dictionary and the
+    candidate tables, is sent to each worker once when it starts, and the
+    workers prune against the best score any of them has found. Of the
+    fillings tied for the best score, that of the first slice holding one
+    is returned, see first_best.
+    """
+    solver = BranchAndBoundSolver(board, pool, cache)
+    shared_best = SharedBest()
+    slices = first_row_slices(solver.first_row_size, workers)
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=init_worker,
+        initargs=(solver, shared_best),
+    ) as executor:
+        results = list(executor.map(solve_slice, enumerate(slices)))
+
+    return first_best(solver, slices, results)
+
+
+def first_best(
+    solver: BranchAndBoundSolver,
+    slices: list[slice],
+    results: list[SliceResult],
+) -> Solution:
+    """Return the best filling of the first slice of results holding one.
+
+    Workers prune against the best score any of them has found, so an
+    earlier slice may have pruned a filling tied with the best once another
+    worker found the best score. Only the slices before the first holding
+    the best whose bound allows a tie are searched again, in turn, for a
+    filling scoring at least the best, so the filling returned does not
+    depend on timing.
+    """
+    first, winner, _ = max(results, key=lambda result: (result[1].score, -result[0]))
+    score = winner.score
+    pruned = sorted(ix for ix, _, bound in results if ix < first and bound >= score)
+    if not pruned:
+        return winner
+
+    floor = SharedBest()
+    floor.offer(score - 1)
+    solver.share_best(floor)
+    for ix in pruned:
+        solution = solver.solve(slices[ix])
+        if solution.score == score:
+            return solution
+    return winner
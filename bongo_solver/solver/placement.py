@@ -0,0 +1,61 @@
+"""Contains the Placement class."""
+
+from __future__ import annotations
+
+
+class Placement:
+    """A word placed in a row starting at a given slot.
+
+    A lone tile in the bonus slot of a row, not a word on its own, is placed
+    as a one letter word scoring nothing in its row.
+    """
+
+    def __init__(self, word: str, offset: int, score: int) -> None:
+        """Initialize the placement."""
+        self.__word = word
+        self.__offset = offset
+        self.__score = score
+
+    @property
+    def word(self) -> str:
+        """Return the placed word."""
+        return self.__word
+
+    @property
+    def offset(self) -> int:
+        """Return the index of the slot holding the first letter."""
+        return self.__offset
+
+    @property
+    def score(self) -> int:
+        """Return the score of the row with the word placed."""
+        return self.__score
+
+    def letter_at(self, index: int) -> str | None:
+        """Return the letter placed in the slot at the given index."""
+        position = index - self.__offset
+        if 0 <= position < len(self.__word):
+            return self.__word[position]
+        return None
+
+    def __repr__(self) -> str:
+        """Return a string representation of the placement."""
+        return (
+            f"{self.__class__.__name__}('{self.__word}', {self.__offset}, "
+            f"{self.__score})"
+        )
+
+    def __eq__(self, other: object) -> bool:
+        """Check if other object is the same placement."""
+        if not isinstance(other, Placement):
+            return False
+
+        return (
+            self.word == other.word
+            and self.offset == other.offset
+            and self.score == other.score
+        )
+
+    def __hash__(self) -> int:
+        """Hash the placement."""
+        return hash((self.__word, self.__offset, self.__score))
@@ -0,0 +1,170 @@
+"""Keeps the solutions of boards already solved, across runs."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from types import TracebackType  # noqa: TC003
+from typing import Self
+
+from bongo_solver.solver.placement import Placement
+from bongo_solver.solver.solution import Solution
+
+FORMAT_VERSION = 1
+DEFAULT_MAX_RESULTS = 10_000
+# Seconds a connection waits for another process writing the same file.
+LOCK_TIMEOUT = 30.0
+IN_MEMORY = ":memory:"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    fingerprint TEXT PRIMARY KEY,
+    solution TEXT NOT NULL,
+    used INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_by_use ON results (used);
+"""
+# Each lookup and store numbers a result as used after every other.
+MARK_USED = """
+UPDATE results SET used = (SELECT COALESCE(MAX(used), 0) + 1 FROM results)
+WHERE fingerprint = ?
+"""
+STORE = """
+INSERT OR REPLACE INTO results (fingerprint, solution, used)
+VALUES (?, ?, (SELECT COALESCE(MAX(used), 0) + 1 FROM results))
+"""
+EVICT = """
+DELETE FROM results WHERE fingerprint IN (
+    SELECT fingerprint FROM results ORDER BY used DESC LIMIT -1 OFFSET ?
+)
+"""
+
+
+def solution_to_json(solution: Solution) -> str:
+    """Return a solution as JSON, for solution_from_json."""
+    placements = [
+        [placement.word, placement.offset, placement.score]
+        if placement is not None
+        else None
+        for placement in solution.placements
+    ]
+    return json.dumps([placements, solution.bonus_word, solution.score])
+
+
+def solution_from_json(text: str) -> Solution:
+    """Return the solution written as JSON by solution_to_json."""
+    placements, bonus_word, score = json.loads(text)
+    return Solution(
+        [
+            Placement(*placement) if placement is not None else None
+            for placement in placements
+        ],
+        bonus_word,
+        score,
+    )
+
+
+class ResultCache:
+    """The best solutions of the boards and pools most recently solved.
+
+    Solutions are kept by the fingerprint of their board and pool in a
+    SQLite database, so they outlive the run and may be shared by processes
+    solving at once. Each lookup and store marks a result as used, and beyond
+    max_results the least recently used are dropped. Without a path the
+    results are kept in memory only. The cache may be used from any thread.
+    """
+
+    def __init__(
+        self,
+        max_results: int = DEFAULT_MAX_RESULTS,
+        path: str | Path | None = None,
+    ) -> None:
+        """Initialize the cache, opening or creating the database at the path."""
+        if max_results < 1:
+            msg = "A result cache must hold at least 1 result."
+            raise ValueError(msg)
+
+        self.__max_results = max_results
+        self.__path = Path(path) if path is not None else None
+        self.__lock = threading.Lock()
+        self.__connection = sqlite3.connect(
+            self.__path if self.__path is not None else IN_MEMORY,
+            timeout=LOCK_TIMEOUT,
+            check_same_thread=False,
+        )
+        (version,) = self.__connection.execute("PRAGMA user_version").fetchone()
+        if version not in (0, FORMAT_VERSION):
+            self.__connection.close()
+            msg = f"Unsupported result cache version {version}."
+            raise ValueError(msg)
+
+        # Write-ahead logging lets readers go on while another process writes.
+        self.__connection.execute("PRAGMA journal_mode = WAL")
+        with self.__connection:
+            self.__connection.executescript(SCHEMA)
+            self.__connection.execute(f"PRAGMA user_version = {FORMAT_VERSION}")
+
+    @property
+    def max_results(self) -> int:
+        """Return the number of results kept before the least recent is dropped."""
+        return self.__max_results
+
+    @property
+    def path(self) -> Path | None:
+        """Return the database file the results are kept in, if any."""
+        return self.__path
+
+    def __len__(self) -> int:
+        """Return the number of results held."""
+        with self.__lock:
+            (count,) = self.__connection.execute(
+                "SELECT COUNT(*) FROM results",
+            ).fetchone()
+        return int(count)
+
+    def __contains__(self, key: str) -> bool:
+        """Return True if a result is held for the fingerprint."""
+        with self.__lock:
+            row = self.__connection.execute(
+                "SELECT 1 FROM results WHERE fingerprint = ?",
+                (key,),
+            ).fetchone()
+        return row is not None
+
+    def get(self, key: str) -> Solution | None:
+        """Return the solution of a fingerprint, marking it as recently used."""
+        with self.__lock, self.__connection:
+            row = self.__connection.execute(
+                "SELECT solution FROM results WHERE fingerprint = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self.__connection.execute(MARK_USED, (key,))
+        return solution_from_json(row[0])
+
+    def put(self, key: str, solution: Solution) -> None:
+        """Hold a solution, dropping the least recently used beyond the limit."""
+        with self.__lock, self.__connection:
+            self.__connection.execute(STORE, (key, solution_to_json(solution)))
+            self.__connection.execute(EVICT, (self.__max_results,))
+
+    def close(self) -> None:
+        """Close the database."""
+        with self.__lock:
+            self.__connection.close()
+
+    def __enter__(self) -> Self:
+        """Return the cache, to be closed on leaving the block."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the database."""
+        self.close()
@@ -0,0 +1,138 @@
+"""Counts the work done by a search and times its phases."""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections.abc import Iterator, Mapping  # noqa: TC003
+from contextlib import contextmanager
+from enum import Enum
+from typing import Any
+
+LOGGER = logging.getLogger(__name__)
+
+
+class PruneReason(Enum):
+    """Why the search did not try a candidate or a branch."""
+
+    # The branch could not beat the best score found so far.
+    BOUND = "bound"
+    # Too few of the candidate's tiles were left.
+    TILES = "tiles"
+    # The same state reached by another branch held no better filling.
+    TRANSPOSITION = "transposition"
+
+
+class SearchStats:
+    """The nodes searched, prunes, cache use and phase timings of a solve.
+
+    Besides the prunes, the candidates tried that left no word spellable in
+    the bonus slots are counted. They are still searched, but without the
+    share of the bound kept for the bonus word.
+
+    A solver given stats adds to them, so the same stats may gather the work
+    of several solves. Phases are timed by wall clock: parse for reading the
+    board and pool, index for building the candidate tables of the rows and
+    search for the search itself.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the stats with nothing counted."""
+        self.__nodes = 0
+        self.__prunes = dict.fromkeys(PruneReason, 0)
+        self.__bonus_lost = 0
+        self.__cache_hits = 0
+        self.__cache_misses = 0
+        self.__words_scanned = 0
+        self.__seconds: dict[str, float] = {}
+
+    @property
+    def nodes(self) -> int:
+        """Return the number of partial fillings expanded."""
+        return self.__nodes
+
+    @property
+    def prunes(self) -> dict[PruneReason, int]:
+        """Return the number of candidates and branches pruned by reason."""
+        return self.__prunes.copy()
+
+    @property
+    def bonus_lost(self) -> int:
+        """Return the number of candidates tried that left no bonus word."""
+        return self.__bonus_lost
+
+    @property
+    def cache_hits(self) -> int:
+        """Return the number of row candidate tables found in the cache."""
+        return self.__cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Return the number of row candidate tables built."""
+        return self.__cache_misses
+
+    @property
+    def words_scanned(self) -> int:
+        """Return the number of dictionary words the pool could spell."""
+        return self.__words_scanned
+
+    @property
+    def seconds(self) -> dict[str, float]:
+        """Return the wall time spent in each phase."""
+        return self.__seconds.copy()
+
+    def add_search(
+        self,
+        nodes: int,
+        prunes: Mapping[PruneReason, int],
+        bonus_lost: int = 0,
+    ) -> None:
+        """Count the nodes expanded, the prunes and bonus words lost of a search."""
+        self.__nodes += nodes
+        self.__bonus_lost += bonus_lost
+        for reason, count in prunes.items():
+            self.__prunes[reason] += count
+
+    def add_cache_lookup(self, *, hit: bool) -> None:
+        """Count a lookup of a row candidate table in the cache."""
+        if hit:
+            self.__cache_hits += 1
+        else:
+            self.__cache_misses += 1
+
+    def add_words_scanned(self, words: int) -> None:
+        """Count the words found by a scan of the dictionary."""
+        self.__words_scanned += words
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Add the time spent in the block to a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.__seconds[name] = self.__seconds.get(name, 0.0) + elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the stats as plain values, ready to write as JSON."""
+        return {
+            "nodes": self.__nodes,
+            "prunes": {reason.value: count for reason, count in self.__prunes.items()},
+            "bonus_lost": self.__bonus_lost,
+            "cache_hits": self.__cache_hits,
+            "cache_misses": self.__cache_misses,
+            "words_scanned": self.__words_scanned,
+            "seconds": self.__seconds.copy(),
+        }
+
+    def log(self, logger: logging.Logger = LOGGER, level: int = logging.INFO) -> None:
+        """Log the stats as one JSON message, also kept in the record's extra."""
+        stats = self.to_dict()
+        logger.log(
+            level,
+            "search stats %s",
+            json.dumps(stats),
+            extra={"search_stats": stats},
+        )
@@ -0,0 +1,36 @@
+"""A best score shared between solver processes."""
+
+from __future__ import annotations
+
+import multiprocessing
+from multiprocessing.context import BaseContext  # noqa: TC003
+
+from bongo_solver import nobeartype
+
+
+class SharedBest:
+    """The best score found by any of several solver processes.
+
+    The score sits in shared memory without a lock, so reading it on every
+    search node is cheap. Raising it takes a lock so that a higher score
+    offered by one process is never overwritten by a lower one.
+    """
+
+    def __init__(self, context: BaseContext | None = None) -> None:
+        """Initialize the shared score at zero."""
+        if context is None:
+            context = multiprocessing.get_context()
+        self.__value = context.RawValue("q", 0)
+        self.__lock = context.Lock()
+
+    @property
+    @nobeartype
+    def value(self) -> int:
+        """Return the best score offered so far."""
+        return self.__value.value
+
+    @nobeartype
+    def offer(self, score: int) -> None:
+        """Raise the best score to the given score if it is higher."""
+        with self.__lock:
+            self.__value.value = max(self.__value.value, score)
@@ -0,0 +1,49 @@
+"""Contains the Solution class."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence  # noqa: TC003
+
+from bongo_solver.solver.placement import Placement  # noqa: TC001
+
+
+class Solution:
+    """An assignment of words to the rows of a board and the score it earns."""
+
+    def __init__(
+        self,
+        placements: Sequence[Placement | None],
+        bonus_word: str,
+        score: int,
+    ) -> None:
+        """Initialize the solution."""
+        self.__placements = tuple(placements)
+        self.__bonus_word = bonus_word
+        self.__score = score
+
+    @property
+    def placements(self) -> tuple[Placement | None, ...]:
+        """Return the placement for each row, None for rows left empty."""
+        return self.__placements
+
+    @property
+    def words(self) -> list[str]:
+        """Return the word placed in each row."""
+        return [p.word if p is not None else "" for p in self.__placements]
+
+    @property
+    def bonus_word(self) -> str:
+        """Return the word spelled by the bonus slots."""
+        return self.__bonus_word
+
+    @property
+    def score(self) -> int:
+        """Return the total score of the solution."""
+        return self.__score
+
+    def __repr__(self) -> str:
+        """Return a string representation of the solution."""
+        return (
+            f"{self.__class__.__name__}({self.words}, '{self.__bonus_word}', "
+            f"{self.__score})"
+        )
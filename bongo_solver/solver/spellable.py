@@ -0,0 +1,81 @@
+"""Indexes candidates by the tiles they need as bit masks.
+
+Bit i of a mask stands for the ith candidate of a row, so the candidates the
+tiles left can spell are found by ANDing one mask per letter, without
+visiting those that cannot be spelled. Checking each candidate's letter
+counts against the tiles left, even packed into one int, still visits every
+candidate at every node; a mask drops all those a letter no longer spells
+in one step, and the masks of a row are built in one vectorized comparison
+of its need matrix against each count of each letter.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence  # noqa: TC003
+
+import numpy as np
+import numpy.typing as npt
+
+from bongo_solver import nobeartype
+
+
+def spellable_masks(
+    needs: npt.NDArray[np.int64],
+    counts: Sequence[int],
+) -> list[list[int]]:
+    """Return masks of the candidates spellable with each count of each letter.
+
+    needs holds the count of each letter index each candidate needs, by
+    candidate and letter. Bit i of masks[letter][count] is set when the ith
+    candidate needs at most count tiles of the letter, for every count up to
+    that in counts.
+    """
+    return [
+        [bit_mask(needs[:, letter] <= count) for count in range(letter_count + 1)]
+        for letter, letter_count in enumerate(counts)
+    ]
+
+
+def ranked_masks(order: npt.NDArray[np.intp]) -> list[int]:
+    """Return masks of the best ranked candidates.
+
+    order holds the indexes of the candidates, best first. Bit i of masks[j]
+    is set when the ith candidate is among the first 2**j of the order, and
+    the last mask holds every candidate.
+    """
+    size = len(order)
+    if not size:
+        return []
+    ranks = np.empty(size, dtype=np.intp)
+    ranks[order] = np.arange(size)
+    tops = [1 << j for j in range((size - 1).bit_length())] + [size]
+    return [bit_mask(ranks < top) for top in tops]
+
+
+def bit_mask(flags: npt.NDArray[np.bool_]) -> int:
+    """Return the mask with bit i set when flags[i] is."""
+    return int.from_bytes(np.packbits(flags, bitorder="little").tobytes(), "little")
+
+
+@nobeartype
+def spellable(masks: list[list[int]], counts: Sequence[int], size: int) -> int:
+    """Return the mask of the size candidates the counts of each letter spell."""
+    spelled = (1 << size) - 1
+    for letter_masks, count in zip(masks, counts, strict=True):
+        spelled &= letter_masks[count]
+    return spelled
+
+
+@nobeartype
+def lowest_bit(mask: int) -> int:
+    """Return the index of the lowest set bit of a mask, -1 if none is set."""
+    return (mask & -mask).bit_length() - 1
+
+
+@nobeartype
+def set_bits(mask: int) -> Iterator[int]:
+    """Yield the indexes of the set bits of a mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
@@ -0,0 +1,91 @@
+"""Remembers bounds on the score left from search states already searched."""
+
+from __future__ import annotations
+
+import random
+import sys
+from collections.abc import Sequence  # noqa: TC003
+
+from bongo_solver import nobeartype
+
+DEFAULT_MAX_ENTRIES = 1 << 16
+# The bound of a state not held, which prunes nothing.
+UNBOUNDED = sys.maxsize
+KEY_BITS = 64
+# Keys are drawn from a fixed seed so that searches are repeatable.
+ZOBRIST_SEED = 0x5EED
+EMPTY_KEY = -1
+
+
+def zobrist_keys(sizes: Sequence[int]) -> list[list[int]]:
+    """Return a list of random keys of each size, for hashing states by XOR."""
+    generator = random.Random(ZOBRIST_SEED)  # noqa: S311
+    return [[generator.getrandbits(KEY_BITS) for _ in range(size)] for size in sizes]
+
+
+class TranspositionTable:
+    """Upper bounds on the best score left from states of a search.
+
+    Filling the rows in another order can reach the same state, the same
+    rows filled with the same tiles left and the same letters in the bonus
+    slots, from which the best score left is the same. A state is known by a
+    Zobrist hash, the XOR of a random key for each of its parts, and held in
+    the slot picked by the low bits of its key. When two states share a
+    slot the one nearer the top of the search is kept, as its bound spares
+    the larger subtree. Keys of 64 bits make a wrong match unlikely enough to
+    ignore.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """Initialize an empty table of at most max_entries states.
+
+        The number of slots is the largest power of two within max_entries.
+        """
+        if max_entries < 1:
+            msg = "A transposition table must hold at least 1 state."
+            raise ValueError(msg)
+
+        size = 1 << (max_entries.bit_length() - 1)
+        self.__mask = size - 1
+        self.__keys = [EMPTY_KEY] * size
+        self.__bounds = [0] * size
+        self.__depths = [0] * size
+        self.__held = 0
+
+    @property
+    def max_entries(self) -> int:
+        """Return the number of states the table can hold."""
+        return len(self.__keys)
+
+    def __len__(self) -> int:
+        """Return the number of states held."""
+        return self.__held
+
+    @nobeartype
+    def bound(self, key: int) -> int:
+        """Return the bound on the score left from a state, UNBOUNDED if not held."""
+        slot = key & self.__mask
+        if self.__keys[slot] == key:
+            return self.__bounds[slot]
+        return UNBOUNDED
+
+    @nobeartype
+    def store(self, key: int, depth: int, bound: int) -> None:
+        """Hold a bound on the score left from a state at a depth of the search.
+
+        A state held already keeps the tighter of its bounds. A state at a
+        depth below the one held in its slot is not held.
+        """
+        slot = key & self.__mask
+        held_key = self.__keys[slot]
+        if held_key == key:
+            self.__bounds[slot] = min(self.__bounds[slot], bound)
+            return
+        if held_key == EMPTY_KEY:
+            self.__held += 1
+        elif self.__depths[slot] < depth:
+            return
+
+        self.__keys[slot] = key
+        self.__bounds[slot] = bound
+        self.__depths[slot] = depth
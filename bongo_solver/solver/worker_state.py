@@ -0,0 +1,39 @@
+"""Keeps the objects a worker process is started with for the tasks it runs.
+
+A process pool's initializer hands each worker what every task needs, such
+as a dictionary or a solver, so it is sent once per worker rather than once
+per task. The initializer keeps them here by name and the tasks look them
+up. Work a worker leaves for the end, such as closing a database connection,
+is done when the worker process exits.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable  # noqa: TC003
+from multiprocessing.util import Finalize
+from typing import Any
+
+# Finalizers given a priority are run by multiprocessing as a worker process
+# exits, while those without one only run when collected.
+EXIT_PRIORITY = 0
+
+# The objects kept for the tasks of the current worker process, by name.
+_state: dict[str, Any] = {}
+
+
+def keep_worker_state(**values: Any) -> None:  # noqa: ANN401
+    """Keep objects by name for every task the current worker process runs."""
+    _state.update(values)
+
+
+def worker_state(name: str) -> Any:  # noqa: ANN401
+    """Return an object kept for the tasks of the current worker process."""
+    return _state[name]
+
+
+def call_at_worker_exit(callback: Callable[[], object]) -> None:
+    """Call a function when the current worker process exits.
+
+    Functions are called in the reverse of the order they were given.
+    """
+    Finalize(None, callback, exitpriority=EXIT_PRIORITY)
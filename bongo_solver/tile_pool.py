@@ -2,17 +2,33 @@
 
 from __future__ import annotations
 
-import re
+import string
 
+from bongo_solver import nobeartype
 from bongo_solver.letter import Letter  # noqa: TC001
+from bongo_solver.tokenizer import tokenize_pool
 from bongo_solver.type_helpers.letter_like import coerce_to_letter
 
 from .letter_tile import LetterTile
 
-tile_quantity_patern = re.compile(r"([A-Za-z])\((\d+)\)\s?(\d?)")
-
 VALIDATE_SCORES = True
 
+ALPHABET = string.ascii_uppercase
+LETTER_IX = {letter: ix for ix, letter in enumerate(ALPHABET)}
+
+# The tile count and tile of each letter A to Z, as returned by snapshot.
+TilePoolSnapshot = tuple[tuple[int, ...], tuple[LetterTile | None, ...]]
+
+
+@nobeartype
+def letter_index(letter: Letter) -> int:
+    """Return the index of a letter A to Z in the pool arrays."""
+    ix = LETTER_IX.get(letter.letter)
+    if ix is None:
+        msg = f"A tile pool only holds the letters A to Z, not '{letter}'."
+        raise ValueError(msg)
+    return ix
+
 
 def validate_scores(letter_dict: dict[Letter, list[LetterTile]]) -> bool:
     """Check that the scores of the tiles are consistent."""
@@ -23,98 +39,138 @@ def validate_scores(letter_dict: dict[Letter, list[LetterTile]]) -> bool:
 
 
 class TilePool:
-    """Contains a finite set of letter tiles."""
+    """Contains a finite set of letter tiles.
+
+    The pool keeps a count per letter A to Z and the tile of each letter it
+    holds, so taking, adding and counting tiles are constant time. All the
+    tiles of a letter held are equal, so one tile stands for them all.
+    """
 
     @classmethod
     def from_str(cls, tile_str: str) -> TilePool:
-        """Convert a string containing a tile pool configuration."""
-        tiles = []
-        for match in tile_quantity_patern.finditer(tile_str):
-            letter = match.group(1)
-            score = int(match.group(2))
-            quantity = match.group(3)
-            quantity = int(quantity) if quantity else None
-
+        """Convert a string containing a tile pool configuration.
+
+        The counts and tiles of the pool are filled in as the runs of tiles
+        are read, without a list of every tile.
+        """
+        counts = [0] * len(ALPHABET)
+        tiles: list[LetterTile | None] = [None] * len(ALPHABET)
+        for letter, score, quantity in tokenize_pool(tile_str):
             tile = LetterTile(letter, score)
+            if not quantity:
+                continue
 
-            if quantity is None:
-                tiles.append(tile)
-            else:
-                tiles.extend([tile] * quantity)
+            ix = letter_index(tile.letter)
+            if counts[ix] and tiles[ix] != tile and VALIDATE_SCORES:
+                msg = "Scores of tiles are inconsistent."
+                raise ValueError(msg)
+            if not counts[ix]:
+                tiles[ix] = tile
+            counts[ix] += quantity
 
-        return cls(tiles)
+        pool = cls()
+        pool.restore((tuple(counts), tuple(tiles)))
+        return pool
 
     def __init__(self, tiles: list[LetterTile] | None = None) -> None:
         """Initialize the tile pool."""
         if tiles is None:
             tiles = []
-        self.__letter_dict: dict[Letter, list[LetterTile]] = {}
+        letter_dict: dict[Letter, list[LetterTile]] = {}
         for tile in tiles:
-            if tile.letter in self.__letter_dict:
-                self.__letter_dict[tile.letter].append(tile)
-            else:
-                self.__letter_dict[tile.letter] = [tile]
+            letter_dict.setdefault(tile.letter, []).append(tile)
 
-        if VALIDATE_SCORES and not validate_scores(self.__letter_dict):
+        if VALIDATE_SCORES and not validate_scores(letter_dict):
             msg = "Scores of tiles are inconsistent."
             raise ValueError(msg)
 
+        self.__counts = [0] * len(ALPHABET)
+        self.__tiles: list[LetterTile | None] = [None] * len(ALPHABET)
+        self.__size = len(tiles)
+        for letter, letter_tiles in letter_dict.items():
+            ix = letter_index(letter)
+            self.__counts[ix] = len(letter_tiles)
+            self.__tiles[ix] = letter_tiles[0]
+
     def __getitem__(self, item: str | Letter | LetterTile) -> list[LetterTile]:
         """Get a tile from the pool."""
-        item = coerce_to_letter(item)
-
-        return self.__letter_dict.get(item, [])
+        ix = letter_index(coerce_to_letter(item))
+        tile = self.__tiles[ix]
+        return [tile] * self.__counts[ix] if tile is not None else []
 
     def __contains__(self, item: str | LetterTile | Letter) -> bool:
         """Check if the pool contains a letter tile."""
-        return bool(self[item])
+        return self.__counts[letter_index(coerce_to_letter(item))] > 0
 
     def __len__(self) -> int:
         """Return the number of tiles in the pool."""
-        return sum(len(tiles) for tiles in self.__letter_dict.values())
+        return self.__size
 
     def count_by_letter(self) -> dict[Letter, int]:
         """Return the count of each letter in the pool."""
-        return {letter: len(tiles) for letter, tiles in self.__letter_dict.items()}
+        return {
+            tile.letter: count
+            for tile, count in zip(self.__tiles, self.__counts, strict=True)
+            if tile is not None and count
+        }
 
     def score_by_letter(self) -> dict[Letter, int]:
         """Return the score of each letter in the pool."""
-        return {letter: tiles[0].score for letter, tiles in self.__letter_dict.items()}
+        return {
+            tile.letter: tile.score
+            for tile, count in zip(self.__tiles, self.__counts, strict=True)
+            if tile is not None and count
+        }
 
     def count_of(self, letter: str | Letter) -> int:
         """Return the count of a letter in the pool."""
-        return len(self[letter])
+        return self.__counts[letter_index(coerce_to_letter(letter))]
 
     def score_of(self, letter: str | Letter) -> int | None:
         """Return the score of a letter in the pool."""
-        letters = self[letter]
-        if not letters:
+        ix = letter_index(coerce_to_letter(letter))
+        tile = self.__tiles[ix]
+        if tile is None or not self.__counts[ix]:
             return None
 
-        return letters[0].score
+        return tile.score
 
     def take(self, letter: str | Letter) -> LetterTile | None:
         """Take a letter from the pool."""
-        letter = coerce_to_letter(letter)
-        tiles = self[letter]
-
-        if not tiles:
+        ix = letter_index(coerce_to_letter(letter))
+        if not self.__counts[ix]:
             return None
 
-        tile = tiles.pop()
-
-        if not tiles:
-            del self.__letter_dict[letter]
-
-        return tile
+        self.__counts[ix] -= 1
+        self.__size -= 1
+        return self.__tiles[ix]
 
     def add(self, tile: LetterTile) -> None:
         """Add a tile to the pool."""
-        if tile.letter in self.__letter_dict:
-            tiles = self.__letter_dict[tile.letter]
-            if VALIDATE_SCORES and not all(t.score == tile.score for t in tiles):
+        ix = letter_index(tile.letter)
+        if self.__counts[ix] and self.__tiles[ix] != tile:
+            if VALIDATE_SCORES:
                 msg = "New tile score does not match existing tiles."
                 raise ValueError(msg)
-            tiles.append(tile)
         else:
-            self.__letter_dict[tile.letter] = [tile]
+            self.__tiles[ix] = tile
+
+        self.__counts[ix] += 1
+        self.__size += 1
+
+    def snapshot(self) -> TilePoolSnapshot:
+        """Return the contents of the pool for a later restore."""
+        return tuple(self.__counts), tuple(self.__tiles)
+
+    def restore(self, snapshot: TilePoolSnapshot) -> None:
+        """Reset the pool to the contents of a snapshot."""
+        counts, tiles = snapshot
+        self.__counts[:] = counts
+        self.__tiles[:] = tiles
+        self.__size = sum(counts)
+
+    def copy(self) -> TilePool:
+        """Return an independent pool holding the same tiles."""
+        pool = TilePool()
+        pool.restore(self.snapshot())
+        return pool
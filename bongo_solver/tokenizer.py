@@ -0,0 +1,83 @@
+"""Reads board and tile pool strings in one pass each.
+
+A board string holds five rows of five slot symbols in brackets, such as
+"[ B  2]", where a digit is a multiplier, B a bonus slot and a space a plain
+slot. A tile pool string holds a letter with its score in parentheses and an
+optional count after it, such as "A(5)3E(5)". Text around these is ignored.
+"""
+
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+
+ROW_PATTERN = re.compile(r"\[(.)(.)(.)(.)(.)\]")
+TILE_PATTERN = re.compile(r"([A-Za-z])\((\d+)\)\s?(\d?)")
+ROWS = 5
+ROW_CACHE_SIZE = 1024
+
+# The multiplier of each slot symbol and whether it marks a bonus slot.
+SLOT_SYMBOLS: dict[str, tuple[int, bool]] = {
+    " ": (1, False),
+    "B": (1, True),
+    "b": (1, True),
+    **{digit: (int(digit), False) for digit in "0123456789"},
+}
+
+# The slot multipliers of a row and the index of its bonus slot, -1 if none.
+RowLayout = tuple[tuple[int, ...], int]
+# A run of tiles as its letter, the score of each tile and their number.
+TileRun = tuple[str, int, int]
+
+
+def tokenize_board(board_str: str) -> list[RowLayout]:
+    """Return the layout of each row of a board string.
+
+    The string is scanned once for rows, whose symbols are looked up in a
+    table, and errors are raised as Board.from_str raised them.
+    """
+    rows = ROW_PATTERN.findall(board_str)
+    if len(rows) != ROWS:
+        msg = "Insufficient board configuration in board_str."
+        raise ValueError(msg)
+
+    return [parse_row(symbols) for symbols in rows]
+
+
+@lru_cache(maxsize=ROW_CACHE_SIZE)
+def parse_row(symbols: tuple[str, ...]) -> RowLayout:
+    """Return the layout of a row from the symbol of each of its slots.
+
+    Boards share few distinct rows, so layouts are kept by their symbols.
+    """
+    slots = [SLOT_SYMBOLS.get(symbol) or parse_digit(symbol) for symbol in symbols]
+    bonus_ixs = [ix for ix, (_, is_bonus) in enumerate(slots) if is_bonus]
+    if len(bonus_ixs) > 1:
+        msg = "A word row can only contain one bonus slot."
+        raise ValueError(msg)
+
+    multipliers = tuple(multiplier for multiplier, _ in slots)
+    return multipliers, bonus_ixs[0] if bonus_ixs else -1
+
+
+def parse_digit(symbol: str) -> tuple[int, bool]:
+    """Return the multiplier of a symbol missing from SLOT_SYMBOLS.
+
+    Decimal digits of other scripts are multipliers too, as they were matched
+    by the regex of rows before.
+    """
+    if not symbol.isdecimal():
+        msg = "Imporoperly formated WordRow string."
+        raise ValueError(msg)
+    return int(symbol), False
+
+
+def tokenize_pool(tile_str: str) -> list[TileRun]:
+    """Return the runs of tiles of a tile pool string, in order.
+
+    A run without a count holds one tile.
+    """
+    return [
+        (letter, int(score), int(count) if count else 1)
+        for letter, score, count in TILE_PATTERN.findall(tile_str)
+    ]
@@ -0,0 +1,133 @@
+"""Contains the BonusPath class for checking bonus words by table lookup."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence  # noqa: TC003
+from weakref import WeakKeyDictionary
+
+from bongo_solver.dictionary import Dictionary, WordKind
+from bongo_solver.word.bonus_word import BONUS_WORD_LENGTH
+from bongo_solver.word_index import WILDCARD
+
+BLANK = " "
+
+# A slot as (row index, column index) on the board.
+SlotCoordinates = tuple[int, int]
+# The fillings of the slots, the kind of each filling's word, the number of
+# each filling and the bitsets of the fillings by position and letter.
+FillingIndex = tuple[
+    tuple[str, ...],
+    tuple[WordKind | None, ...],
+    dict[str, int],
+    list[dict[str, int]],
+]
+
+# The filling index of each dictionary, shared by the boards using it.
+_filling_indexes: WeakKeyDictionary[Dictionary, FillingIndex] = WeakKeyDictionary()
+
+
+def filling_index(dictionary: Dictionary) -> FillingIndex:
+    """Return the fillings of bonus slots by words of a dictionary, indexed.
+
+    The index is built once per dictionary and kept while the dictionary is.
+    """
+    index = _filling_indexes.get(dictionary)
+    if index is not None:
+        return index
+
+    fillings = []
+    words = []
+    for length in dictionary.index.lengths:
+        if length > BONUS_WORD_LENGTH:
+            continue
+        for word in dictionary.index.words_of_length(length):
+            for offset in range(BONUS_WORD_LENGTH - length + 1):
+                padding = BLANK * (BONUS_WORD_LENGTH - length - offset)
+                fillings.append(BLANK * offset + word + padding)
+                words.append(word)
+
+    fits: list[dict[str, int]] = [{} for _ in range(BONUS_WORD_LENGTH)]
+    for bit, filling in enumerate(fillings):
+        flag = 1 << bit
+        for at_position, letter in zip(fits, filling, strict=True):
+            at_position[letter] = at_position.get(letter, 0) | flag
+
+    index = (
+        tuple(fillings),
+        tuple(dictionary.kinds_of(words)),
+        {filling: ix for ix, filling in enumerate(fillings)},
+        fits,
+    )
+    _filling_indexes[dictionary] = index
+    return index
+
+
+class BonusPath:
+    """The slots of a bonus word and every way a word can fill them.
+
+    A bonus word is read from its slots with blank slots at either end
+    dropped, so a word of up to four letters fills the slots at each offset
+    leaving blanks around it. These fillings are numbered, and for each
+    position a bitset per letter, or blank, holds the fillings with it there.
+    Whether the letters placed so far still allow a bonus word that scores is
+    then a few bitwise ands, and the kind of a complete bonus word a lookup.
+    """
+
+    def __init__(
+        self,
+        slots: Sequence[SlotCoordinates],
+        dictionary: Dictionary,
+    ) -> None:
+        """Initialize the path with its slots and the fillings of a dictionary."""
+        if len(slots) != BONUS_WORD_LENGTH:
+            msg = f"A bonus word must contain {BONUS_WORD_LENGTH} slots."
+            raise ValueError(msg)
+
+        self.__slots = tuple(slots)
+        (
+            self.__fillings,
+            self.__kinds,
+            self.__filling_ix,
+            self.__fits,
+        ) = filling_index(dictionary)
+
+    @property
+    def slots(self) -> tuple[SlotCoordinates, ...]:
+        """Return the (row, column) of each slot, top row first."""
+        return self.__slots
+
+    @property
+    def fillings(self) -> tuple[str, ...]:
+        """Return the slot contents spelling a word, blanks as spaces."""
+        return self.__fillings
+
+    @property
+    def kinds(self) -> tuple[WordKind | None, ...]:
+        """Return whether the word of each filling is common or valid."""
+        return self.__kinds
+
+    @property
+    def all_fillings(self) -> int:
+        """Return the bitset of every filling."""
+        return (1 << len(self.__fillings)) - 1
+
+    def fitting(self, position: int, letter: str) -> int:
+        """Return the bitset of the fillings with a letter, or blank, at a position."""
+        return self.__fits[position].get(letter, 0)
+
+    def can_spell(self, pattern: str) -> bool:
+        """Return True if the slot contents could still spell a word.
+
+        The pattern gives one character per slot: a letter, a space for a
+        slot left blank, or ? for a slot not yet decided.
+        """
+        mask = self.all_fillings
+        for position, letter in enumerate(pattern):
+            if letter != WILDCARD:
+                mask &= self.fitting(position, letter)
+        return mask != 0
+
+    def kind_of(self, letters: str) -> WordKind | None:
+        """Return the kind of the word spelled by the slot contents, if any."""
+        ix = self.__filling_ix.get(letters)
+        return self.__kinds[ix] if ix is not None else None
@@ -6,15 +6,28 @@ from collections.abc import Sequence  # noqa: TC003
 from typing import TYPE_CHECKING, Any, Self
 
 from bongo_solver import nobeartype
-from bongo_solver.dictionary import Dictionary  # noqa: TC001
+from bongo_solver.dictionary import Dictionary, WordKind
 
 if TYPE_CHECKING:  # pragma: no cover
     from bongo_solver.letter_slot.letter_slot import LetterSlot
     from bongo_solver.letter_tile import LetterTile
 
+COMMON_WORD_MULTIPLIER = 1.3
+
+
+def apply_common_bonus(score: int) -> int:
+    """Return the score of a common word given the sum of its slot scores."""
+    return round(score * COMMON_WORD_MULTIPLIER)
+
 
 class Word:
-    """A word made up of letter slots."""
+    """A word made up of letter slots.
+
+    The word keeps the sum of its slot scores and the number of filled slots
+    up to date as tiles are placed, each placement telling it the change.
+    The letters and the dictionary check are redone only when the word is
+    read after a change, and a word with no tiles is never looked up.
+    """
 
     @nobeartype
     def __new__(cls, *args: tuple[Any, ...], **kwargs: dict[str, Any]) -> Self:  # noqa: ARG003
@@ -28,6 +41,15 @@ class Word:
         """Initialize the word."""
         self.__slots = slots
         self.__dictionary = dictionary
+        self.__raw_score = 0
+        self.__filled = 0
+        self.__is_dirty = True
+        self.__word = ""
+        self.__kind: WordKind | None = None
+        for slot in slots:
+            self.__raw_score += slot.score
+            self.__filled += not slot.is_empty
+            slot.watch(self)
 
     @property
     def slots(self) -> Sequence[LetterSlot]:
@@ -40,24 +62,58 @@ class Word:
         return self.__dictionary
 
     @property
-    def score(self) -> int:
-        """Return the score of the word row."""
-        score = sum(slot.score for slot in self.__slots)
+    def raw_score(self) -> int:
+        """Return the sum of the slot scores, whether or not the word is valid."""
+        return self.__raw_score
 
-        if self.__dictionary.is_common(self.word):
-            return round(score * 1.3)
-        if self.word in self.__dictionary:
-            return score
+    @property
+    def filled(self) -> int:
+        """Return the number of slots holding a tile."""
+        return self.__filled
 
-        return 0
+    @property
+    def score(self) -> int:
+        """Return the score of the word row."""
+        if self.__is_dirty:
+            self.__refresh()
+        if self.__kind is None:
+            return 0
+        if self.__kind is WordKind.COMMON:
+            return apply_common_bonus(self.__raw_score)
+        return self.__raw_score
 
     @property
     def word(self) -> str:
         """Return the word represented by the word row."""
-        return "".join(
+        if self.__is_dirty:
+            self.__refresh()
+        return self.__word
+
+    @nobeartype
+    def slot_changed(self, score_change: int, filled_change: int) -> None:
+        """Update the running totals after the tile in a slot changed."""
+        self.__raw_score += score_change
+        self.__filled += filled_change
+        self.__is_dirty = True
+
+    def __refresh(self) -> None:
+        """Read the word from the slots and look up its kind."""
+        self.__word = "".join(
             str(slot.letter_tile.letter) if not slot.is_empty else " "  # type: ignore[union-attr]
             for slot in self.__slots
         ).strip()
+        self.__kind = self.__dictionary.kind_of(self.__word) if self.__filled else None
+        self.__is_dirty = False
+
+    @property
+    def is_prefix(self) -> bool:
+        """Return True if the placed letters begin at least one word.
+
+        Letters separated by an empty slot never begin a word, so a search
+        filling slots in order can drop the branch as soon as this is False.
+        """
+        word = self.word
+        return " " not in word and self.__dictionary.has_prefix(word)
 
     def __getitem__(self, index: int) -> LetterSlot:
         """Return the slot at the given index."""
@@ -5,14 +5,23 @@ from __future__ import annotations
 import re
 from collections.abc import Sequence  # noqa: TC003
 
-from bongo_solver.dictionary import Dictionary  # noqa: TC001
+import numpy as np
+import numpy.typing as npt
+
+from bongo_solver.dictionary import Dictionary, WordKind
 from bongo_solver.letter_slot.bonus_letter_slot import BonusLetterSlot
-from bongo_solver.letter_slot.letter_slot import LetterSlot  # noqa: TC001
+from bongo_solver.letter_slot.letter_slot import LetterSlot
 from bongo_solver.letter_slot.parse_slot_from_symbol import parse_slot_from_symbol
+from bongo_solver.tile_pool import TilePool  # noqa: TC001
 
-from .word import Word
+from .word import COMMON_WORD_MULTIPLIER, Word
 
 WORD_ROW_LENGTH = 5
+# Candidate words are encoded one byte per letter, so scores are looked up
+# in a table indexed by the byte value.
+BYTE_VALUES = 256
+# The factor applied to the raw score of a word by its dictionary kind.
+KIND_FACTORS = {None: 0.0, WordKind.VALID: 1.0, WordKind.COMMON: COMMON_WORD_MULTIPLIER}
 
 STR_SLOT_SYMBOL_REGEX = r"(\d\*?|[Bb ])"
 STR_ROW_REGEX = rf"\[{STR_SLOT_SYMBOL_REGEX*WORD_ROW_LENGTH}\]"
@@ -34,24 +43,78 @@ class WordRow(Word):
 
         return cls(slots, dictionary)
 
+    @classmethod
+    def from_layout(
+        cls,
+        multipliers: Sequence[int],
+        bonus_ix: int,
+        dictionary: Dictionary,
+    ) -> WordRow:
+        """Return an empty row of slots with multipliers and a bonus slot.
+
+        A bonus_ix of -1 gives a row without a bonus slot.
+        """
+        slots = [
+            BonusLetterSlot(multiplier) if ix == bonus_ix else LetterSlot(multiplier)
+            for ix, multiplier in enumerate(multipliers)
+        ]
+        return cls(slots, dictionary)
+
     def __init__(self, slots: Sequence[LetterSlot], dictionary: Dictionary) -> None:
         """Initialize the word row."""
         if len(slots) != WORD_ROW_LENGTH:
             msg = f"A word row must contain {WORD_ROW_LENGTH} slots."
             raise ValueError(msg)
-        if sum(isinstance(slot, BonusLetterSlot) for slot in slots) > 1:
+        bonus_ixs = [
+            ix for ix, slot in enumerate(slots) if isinstance(slot, BonusLetterSlot)
+        ]
+        if len(bonus_ixs) > 1:
             msg = "A word row can only contain one bonus slot."
             raise ValueError(msg)
 
         super().__init__(slots, dictionary)
+        self.__bonus_ix = bonus_ixs[0] if bonus_ixs else -1
 
     def get_bonus_ix(self) -> int:
         """Return the index of the bonus slot."""
-        return next(
-            (
-                ix
-                for ix, slot in enumerate(self.slots)
-                if isinstance(slot, BonusLetterSlot)
-            ),
-            -1,
+        return self.__bonus_ix
+
+    def score_candidates(
+        self,
+        words: Sequence[str],
+        pool: TilePool,
+        offset: int = 0,
+    ) -> npt.NDArray[np.int64]:
+        """Return the score of each word if placed in the row from an offset.
+
+        The words are encoded as a matrix of letter bytes, looked up in the
+        tile scores of the pool and multiplied by the slot multipliers in one
+        pass, so thousands of candidates are ranked at once. Letters missing
+        from the pool score nothing; whether the pool holds enough tiles to
+        spell a word is not checked.
+        """
+        if offset < 0:
+            msg = "The offset must not be negative."
+            raise ValueError(msg)
+
+        tile_scores = np.zeros(BYTE_VALUES, dtype=np.int64)
+        for letter, score in pool.score_by_letter().items():
+            tile_scores[ord(str(letter))] = score
+        multipliers = np.array([slot.multiplier for slot in self.slots], np.int64)
+
+        padding = " " * offset
+        text = "".join((padding + word).ljust(WORD_ROW_LENGTH) for word in words)
+        letters = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+        if len(letters) != len(words) * WORD_ROW_LENGTH:
+            msg = f"Words placed from offset {offset} must fit in the row."
+            raise ValueError(msg)
+        raw = tile_scores[letters.reshape(len(words), WORD_ROW_LENGTH)] @ multipliers
+
+        kinds = self.dictionary.kinds_of(words)
+        factors = np.fromiter(
+            map(KIND_FACTORS.__getitem__, kinds),
+            dtype=np.float64,
+            count=len(words),
         )
+        # rint rounds half to even like round, so scores agree with Word.score.
+        return np.rint(raw * factors).astype(np.int64)
@@ -0,0 +1,158 @@
+"""Contains the WordIndex class for constrained word lookups."""
+
+from __future__ import annotations
+
+import struct
+from collections import Counter
+from collections.abc import Iterable, Mapping  # noqa: TC003
+from itertools import compress
+
+WILDCARD = "?"
+
+# A serialized bitset as (word length, kind, position or count, letter, size).
+BITSET_HEADER = struct.Struct("<BBBBI")
+POSITION_BITSET = 0
+EXCEEDS_BITSET = 1
+
+
+class WordIndex:
+    """Bitset index of words by length, letter position and letter counts.
+
+    Words of each length are numbered in sorted order, and every set of words
+    is a Python int with one bit per word number. A query then intersects a
+    few of these bitsets rather than scanning the words.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str],
+        bitsets: bytes | memoryview | None = None,
+    ) -> None:
+        """Build the index over a collection of words.
+
+        Bitsets written by to_bytes for the same words may be given to load
+        them rather than build them.
+        """
+        by_length: dict[int, list[str]] = {}
+        for word in sorted(set(words)):
+            by_length.setdefault(len(word), []).append(word)
+
+        self.__by_length = by_length
+        # Words with a letter at a position, per length.
+        self.__positions: dict[int, list[dict[str, int]]] = {}
+        # Words with more than k of a letter at index k, per length.
+        self.__exceeds: dict[int, dict[str, list[int]]] = {}
+        if bitsets is None:
+            self.__build()
+        else:
+            self.__load(bitsets)
+
+    def __build(self) -> None:
+        """Set the bit of each word in the bitsets it belongs to."""
+        for length, bucket in self.__by_length.items():
+            positions: list[dict[str, int]] = [{} for _ in range(length)]
+            exceeds: dict[str, list[int]] = {}
+            for bit, word in enumerate(bucket):
+                flag = 1 << bit
+                for at_position, letter in zip(positions, word, strict=True):
+                    at_position[letter] = at_position.get(letter, 0) | flag
+                for letter, count in Counter(word).items():
+                    masks = exceeds.setdefault(letter, [])
+                    masks.extend([0] * (count - len(masks)))
+                    for k in range(count):
+                        masks[k] |= flag
+            self.__positions[length] = positions
+            self.__exceeds[length] = exceeds
+
+    def __load(self, data: bytes | memoryview) -> None:
+        """Read the bitsets from data written by to_bytes."""
+        for length in self.__by_length:
+            self.__positions[length] = [{} for _ in range(length)]
+            self.__exceeds[length] = {}
+
+        offset = 0
+        while offset < len(data):
+            length, kind, slot, letter, size = BITSET_HEADER.unpack_from(data, offset)
+            offset += BITSET_HEADER.size
+            mask = int.from_bytes(data[offset : offset + size], "little")
+            offset += size
+            if kind == POSITION_BITSET:
+                self.__positions[length][slot][chr(letter)] = mask
+            else:
+                masks = self.__exceeds[length].setdefault(chr(letter), [])
+                masks.extend([0] * (slot + 1 - len(masks)))
+                masks[slot] = mask
+
+    def to_bytes(self) -> bytes:
+        """Return the bitsets of the index as bytes, words excluded."""
+        chunks: list[bytes] = []
+        for length, positions in self.__positions.items():
+            for position, by_letter in enumerate(positions):
+                chunks.extend(
+                    self.__pack(length, POSITION_BITSET, position, letter, mask)
+                    for letter, mask in by_letter.items()
+                )
+            for letter, by_count in self.__exceeds[length].items():
+                chunks.extend(
+                    self.__pack(length, EXCEEDS_BITSET, count, letter, mask)
+                    for count, mask in enumerate(by_count)
+                )
+        return b"".join(chunks)
+
+    @staticmethod
+    def __pack(length: int, kind: int, slot: int, letter: str, mask: int) -> bytes:
+        """Return one bitset with its header."""
+        data = mask.to_bytes((mask.bit_length() + 7) // 8, "little")
+        return BITSET_HEADER.pack(length, kind, slot, ord(letter), len(data)) + data
+
+    @property
+    def lengths(self) -> list[int]:
+        """Return the word lengths present in the index, shortest first."""
+        return sorted(self.__by_length)
+
+    def words_of_length(self, length: int) -> list[str]:
+        """Return the words of a length in sorted order."""
+        return list(self.__by_length.get(length, []))
+
+    def matching(
+        self,
+        pattern: str,
+        letters: Mapping[str, int] | None = None,
+    ) -> list[str]:
+        """Return the words fitting a pattern, optionally spelled from letters.
+
+        The pattern gives one character per position, with ? matching any
+        letter. When letters maps letters to the number available, only words
+        using no more of each letter are returned.
+        """
+        pattern = pattern.upper()
+        bucket = self.__by_length.get(len(pattern))
+        if not bucket:
+            return []
+
+        mask = (1 << len(bucket)) - 1
+        positions = self.__positions[len(pattern)]
+        for position, letter in enumerate(pattern):
+            if letter != WILDCARD:
+                mask &= positions[position].get(letter, 0)
+
+        if letters is not None and mask:
+            mask &= ~self.__too_many(len(pattern), letters)
+
+        return self.__words_in(bucket, mask)
+
+    def __too_many(self, length: int, letters: Mapping[str, int]) -> int:
+        """Return the words of a length needing more of a letter than given."""
+        available = {str(letter).upper(): count for letter, count in letters.items()}
+        mask = 0
+        for letter, masks in self.__exceeds[length].items():
+            count = available.get(letter, 0)
+            if count < len(masks):
+                mask |= masks[max(count, 0)]
+        return mask
+
+    @staticmethod
+    def __words_in(bucket: list[str], mask: int) -> list[str]:
+        """Return the words of a bucket whose bits are set in the mask."""
+        bits = bin(mask)[:1:-1]
+        return list(compress(bucket, map("1".__eq__, bits)))
@@ -0,0 +1,179 @@
+"""Contains the WordTrie class for prefix lookups."""
+
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from collections.abc import Iterable  # noqa: TC003
+from typing import Literal
+
+ROOT = 0
+NO_NODE = -1
+
+# The node and edge counts heading a serialized trie.
+SIZES_HEADER = struct.Struct("<II")
+
+
+class WordTrie:
+    """A prefix tree of words stored in flat arrays.
+
+    Nodes are numbered breadth first so the children of a node are adjacent.
+    Each node records where its children start and how many there are, each
+    child edge records its letter (one character of a string) and target
+    node, and a byte per node flags whether a word ends there.
+    """
+
+    def __init__(
+        self,
+        words: Iterable[str] = (),
+        arrays: bytes | memoryview | None = None,
+    ) -> None:
+        """Build the trie over a collection of words.
+
+        Arrays written by to_bytes may be given instead of words to load them.
+        On little-endian hosts the loaded arrays are views into the data
+        rather than copies, so a trie loaded from a memory map shares its
+        pages.
+        """
+        if arrays is None:
+            self.__build(words)
+        else:
+            self.__load(arrays)
+
+    def __build(self, words: Iterable[str]) -> None:
+        """Lay out the nodes of a trie over the words in the arrays."""
+        nested: list[dict[str, int]] = [{}]
+        ends = [False]
+        for word in sorted(set(words)):
+            node = ROOT
+            for letter in word:
+                child = nested[node].get(letter)
+                if child is None:
+                    child = len(nested)
+                    nested[node][letter] = child
+                    nested.append({})
+                    ends.append(False)
+                node = child
+            ends[node] = True
+
+        child_start = array("i")
+        child_count = array("B")
+        terminal = array("B")
+        edge_letters: list[str] = []
+        edge_targets = array("i")
+
+        # Renumber breadth first so each node's children sit side by side.
+        order = [ROOT]
+        for old in order:
+            child_start.append(len(edge_letters))
+            child_count.append(len(nested[old]))
+            terminal.append(ends[old])
+            for letter, child in sorted(nested[old].items()):
+                edge_letters.append(letter)
+                edge_targets.append(len(order))
+                order.append(child)
+
+        self.__child_start = memoryview(child_start)
+        self.__child_count = memoryview(child_count)
+        self.__terminal = memoryview(terminal)
+        self.__edge_targets = memoryview(edge_targets)
+        self.__edge_letters = "".join(edge_letters)
+
+    def __load(self, data: bytes | memoryview) -> None:
+        """Point the arrays at the data written by to_bytes."""
+        nodes, edges = SIZES_HEADER.unpack_from(data)
+        view = memoryview(data)
+        offset = SIZES_HEADER.size
+
+        def take(count: int, code: Literal["i", "B"]) -> memoryview:
+            nonlocal offset
+            size = count * array(code).itemsize
+            chunk = view[offset : offset + size]
+            offset += size
+            if sys.byteorder == "little":
+                return chunk.cast(code)
+            swapped = array(code, chunk.tobytes())
+            swapped.byteswap()
+            return memoryview(swapped)
+
+        self.__child_start = take(nodes, "i")
+        self.__edge_targets = take(edges, "i")
+        self.__child_count = take(nodes, "B")
+        self.__terminal = take(nodes, "B")
+        self.__edge_letters = take(edges, "B").tobytes().decode("ascii")
+
+    def to_bytes(self) -> bytes:
+        """Return the arrays of the trie as little-endian bytes."""
+        chunks = [SIZES_HEADER.pack(len(self.__terminal), len(self.__edge_letters))]
+        for values in (self.__child_start, self.__edge_targets):
+            words = array("i", values)
+            if sys.byteorder != "little":
+                words.byteswap()
+            chunks.append(words.tobytes())
+        chunks.append(self.__child_count.tobytes())
+        chunks.append(self.__terminal.tobytes())
+        chunks.append(self.__edge_letters.encode("ascii"))
+        return b"".join(chunks)
+
+    def __len__(self) -> int:
+        """Return the number of nodes in the trie."""
+        return len(self.__terminal)
+
+    def step(self, node: int, letter: str) -> int:
+        """Return the node reached by following a letter, NO_NODE if absent."""
+        start = self.__child_start[node]
+        ix = self.__edge_letters.find(letter, start, start + self.__child_count[node])
+        return NO_NODE if ix == -1 else self.__edge_targets[ix]
+
+    def is_word(self, node: int) -> bool:
+        """Return True if a word ends at the node."""
+        return bool(self.__terminal[node])
+
+    def find(self, prefix: str) -> int:
+        """Return the node reached by a prefix, NO_NODE if no word starts so."""
+        node = ROOT
+        for letter in prefix.upper():
+            node = self.step(node, letter)
+            if node == NO_NODE:
+                break
+        return node
+
+    def has_prefix(self, prefix: str) -> bool:
+        """Return True if at least one word starts with the prefix."""
+        return self.find(prefix) != NO_NODE
+
+    def children(self, prefix: str) -> list[str]:
+        """Return the letters that can follow the prefix, in order."""
+        node = self.find(prefix)
+        if node == NO_NODE:
+            return []
+
+        start = self.__child_start[node]
+        end = start + self.__child_count[node]
+        return list(self.__edge_letters[start:end])
+
+    def complete_words(self, prefix: str) -> list[str]:
+        """Return the words starting with the prefix, in order."""
+        prefix = prefix.upper()
+        node = self.find(prefix)
+        if node == NO_NODE:
+            return []
+
+        words = []
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if self.__terminal[node]:
+                words.append(word)
+            start = self.__child_start[node]
+            stack.extend(
+                (self.__edge_targets[ix], word + self.__edge_letters[ix])
+                for ix in reversed(range(start, start + self.__child_count[node]))
+            )
+        return words
+
+    def __contains__(self, word: str) -> bool:
+        """Return True if the word is in the trie."""
+        node = self.find(word)
+        return node != NO_NODE and self.is_word(node)
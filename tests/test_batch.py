@@ -0,0 +1,217 @@
+"""Tests for solving batches of puzzles."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bongo_solver.batch import (
+    Puzzle,
+    PuzzleResult,
+    read_puzzles,
+    solve_many,
+    solve_puzzle,
+)
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.candidate_table import CandidateTableCache
+from bongo_solver.solver.result_cache import ResultCache
+from bongo_solver.solver.solution import Solution
+
+BOARD = "[B    ][B    ][B    ][B    ][  3  ]"
+
+
+@pytest.fixture
+def dictionary() -> Dictionary:
+    """Return a dictionary of a few words."""
+    return Dictionary(["CAT"], ["ACT", "AT"])
+
+
+def puzzle(pool: str) -> Puzzle:
+    """Return a puzzle on the test board."""
+    return Puzzle(BOARD, pool, {"board": BOARD, "pool": pool})
+
+
+def solution_of(result: PuzzleResult) -> Solution:
+    """Return the solution of a result that must have one."""
+    assert result.error is None
+    assert result.solution is not None
+    return result.solution
+
+
+def test_read_puzzles__keeps_fields_and_skips_blanks() -> None:
+    """Test that each non-blank line becomes a puzzle with its fields."""
+    lines = [
+        json.dumps({"id": 1, "board": BOARD, "pool": "C(1)"}),
+        "  ",
+        json.dumps({"board": BOARD, "pool": "A(1)"}),
+    ]
+
+    puzzles = list(read_puzzles(lines))
+
+    assert [p.pool for p in puzzles] == ["C(1)", "A(1)"]
+    assert puzzles[0].board == BOARD
+    assert puzzles[0].fields["id"] == 1
+
+
+@pytest.mark.parametrize(
+    ("line", "error", "fields"),
+    [
+        ("{", "Line 2 is not valid JSON.", {}),
+        (
+            '{"id": 4, "board": "[     ]"}',
+            "Line 2 must have 'board' and 'pool' strings.",
+            {"id": 4, "board": "[     ]"},
+        ),
+        ('["board", "pool"]', "Line 2 must have 'board' and 'pool' strings.", {}),
+    ],
+)
+def test_read_puzzles__invalid__error_puzzle(
+    line: str,
+    error: str,
+    fields: dict[str, object],
+) -> None:
+    """Test that a malformed line gives a puzzle holding its error."""
+    valid = json.dumps({"board": BOARD, "pool": "A(1)"})
+
+    puzzles = list(read_puzzles([valid, line, valid]))
+
+    assert [p.error for p in puzzles] == [None, error, None]
+    assert puzzles[1].fields == fields
+
+
+def test_solve_puzzle__error_puzzle__error_result(dictionary: Dictionary) -> None:
+    """Test that a puzzle holding an error is reported without solving."""
+    result = solve_puzzle(Puzzle("", "", {"id": 1}, "Line 1 is bad."), dictionary)
+
+    assert result.solution is None
+    assert json.loads(result.to_json()) == {
+        "id": 1,
+        "error": "Line 1 is bad.",
+        "seconds": 0.0,
+    }
+
+
+def test_solve_puzzle__solves_and_times(dictionary: Dictionary) -> None:
+    """Test that a puzzle is solved and its time recorded."""
+    result = solve_puzzle(puzzle("C(1)A(2)T(3)"), dictionary)
+
+    assert solution_of(result).words[4] == "CAT"
+    assert result.seconds >= 0
+    assert json.loads(result.to_json())["score"] == solution_of(result).score
+
+
+def test_solve_puzzle__invalid_board__error_result(dictionary: Dictionary) -> None:
+    """Test that a puzzle that cannot be solved gives its error, not a raise."""
+    result = solve_puzzle(Puzzle("[B", "C(1)", {"id": 7}), dictionary)
+
+    assert result.solution is None
+    assert result.error == "Insufficient board configuration in board_str."
+    fields = json.loads(result.to_json())
+    assert fields["id"] == 7
+    assert fields["error"] == result.error
+    assert "score" not in fields
+
+
+def test_puzzle_result__solution_and_error__raises() -> None:
+    """Test that a result holds exactly one of a solution and an error."""
+    with pytest.raises(ValueError, match="either a solution or an error"):
+        PuzzleResult(puzzle(""), None, 0.0)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many__results_in_input_order(
+    dictionary: Dictionary,
+    workers: int,
+) -> None:
+    """Test that results come back in the order the puzzles were given."""
+    pools = ["C(1)A(2)T(3)", "A(1)T(1)", "", "T(9)A(9)C(9)"]
+
+    results = list(solve_many(map(puzzle, pools), dictionary, workers))
+
+    assert [r.puzzle.pool for r in results] == pools
+    assert [solution_of(r).score for r in results] == [
+        solution_of(solve_puzzle(puzzle(pool), dictionary)).score for pool in pools
+    ]
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many__failed_puzzle__rest_still_solved(
+    dictionary: Dictionary,
+    tmp_path: Path,
+    workers: int,
+) -> None:
+    """Test that a puzzle that fails is reported and the batch goes on."""
+    puzzles = [
+        puzzle("C(1)A(2)T(3)"),
+        Puzzle("[B", "", {}),
+        *read_puzzles(["{"]),
+        puzzle("A(1)T(1)"),
+    ]
+    path = tmp_path / "results.sqlite"
+
+    results = list(solve_many(puzzles, dictionary, workers, path))
+
+    assert [r.error is None for r in results] == [True, False, False, True]
+    assert results[2].error == "Line 1 is not valid JSON."
+    assert solution_of(results[3]).score > 0
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many__result_path__kept_across_runs(
+    dictionary: Dictionary,
+    tmp_path: Path,
+    workers: int,
+) -> None:
+    """Test that solutions are kept at the result path for later runs."""
+    path = tmp_path / "results.sqlite"
+    pools = ["C(1)A(2)T(3)", "A(1)T(1)"]
+
+    first = list(solve_many(map(puzzle, pools), dictionary, workers, path))
+    second = list(solve_many(map(puzzle, pools), dictionary, workers, path))
+
+    assert [solution_of(r).words for r in second] == [
+        solution_of(r).words for r in first
+    ]
+    with ResultCache(path=path) as results:
+        assert len(results) == len(pools)
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_solve_many__table_path__tables_saved(
+    dictionary: Dictionary,
+    tmp_path: Path,
+    workers: int,
+) -> None:
+    """Test that the candidate tables of a run are saved at the table path."""
+    path = tmp_path / "tables.json"
+    pools = ["C(1)A(2)T(3)", "A(1)T(1)"]
+
+    results = list(solve_many(map(puzzle, pools), dictionary, workers, table_path=path))
+
+    assert len(results) == len(pools)
+    assert len(CandidateTableCache(path=path)) > 0
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_solve_many__no_workers__raises(dictionary: Dictionary) -> None:
+    """Test that at least one worker is required."""
+    with pytest.raises(ValueError, match="at least 1"):
+        list(solve_many([], dictionary, workers=0))
+
+
+def test_solve_puzzle__gather_stats__stats_in_json(dictionary: Dictionary) -> None:
+    """Test that gathered stats are kept in the result and its JSON."""
+    result = solve_puzzle(puzzle("C(1)A(2)T(3)"), dictionary, gather_stats=True)
+
+    assert result.stats is not None
+    stats = json.loads(result.to_json())["stats"]
+    assert stats["nodes"] == result.stats.nodes > 0
+    assert set(stats["seconds"]) == {"parse", "index", "search"}
+
+
+def test_solve_puzzle__no_stats__none_in_json(dictionary: Dictionary) -> None:
+    """Test that stats are only gathered when asked for."""
+    result = solve_puzzle(puzzle("C(1)A(2)T(3)"), dictionary)
+
+    assert result.stats is None
+    assert "stats" not in json.loads(result.to_json())
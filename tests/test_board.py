@@ -10,6 +10,11 @@ import pytest
 from bongo_solver.board import Board, try_get_bonus_word
 from bongo_solver.dictionary import Dictionary
 from bongo_solver.letter_slot.bonus_letter_slot import BonusLetterSlot
+from bongo_solver.solver.placement import Placement
+from bongo_solver.solver.result_cache import ResultCache
+from bongo_solver.solver.search_stats import SearchStats
+from bongo_solver.solver.solution import Solution
+from bongo_solver.tile_pool import TilePool
 from bongo_solver.word.bonus_word import BonusWord
 from bongo_solver.word.word_row import WordRow
 
@@ -97,22 +102,25 @@ ROW = f"[{CONTENTS}]"
 
 
 @pytest.fixture
-def mock_word_row__from_str() -> Generator[MagicMock, None, None]:
-    """Patch the WordRow.from_str method with a MagicMock."""
+def mock_word_row__from_layout() -> Generator[MagicMock, None, None]:
+    """Patch the WordRow.from_layout method with a MagicMock."""
     mock = MagicMock(WordRow)
 
     with patch(
-        "bongo_solver.board.WordRow.from_str",
+        "bongo_solver.board.WordRow.from_layout",
         return_value=mock,
-    ) as mock_from_str:
-        yield mock_from_str
+    ) as mock_from_layout:
+        yield mock_from_layout
 
 
 @pytest.mark.parametrize(
     "str_board",
     ["", ROW, "".join([ROW] * 4), "\n".join([ROW] * 4)],
 )
-def test_from_str__invalid(mock_word_row__from_str: MagicMock, str_board: str) -> None:
+def test_from_str__invalid(
+    mock_word_row__from_layout: MagicMock,
+    str_board: str,
+) -> None:
     """Test that from_str raises a ValueError when the board string is invalid."""
     mock_dictionary = MagicMock(Dictionary)
     with pytest.raises(
@@ -121,7 +129,7 @@ def test_from_str__invalid(mock_word_row__from_str: MagicMock, str_board: str) -
     ):
         Board.from_str(str_board, mock_dictionary)
 
-    mock_word_row__from_str.assert_not_called()
+    mock_word_row__from_layout.assert_not_called()
 
 
 @pytest.fixture
@@ -139,16 +147,17 @@ def mock_try_get_bonus_word() -> Generator[MagicMock, None, None]:
     "str_board",
     ["".join([ROW] * 5), "\n".join([ROW] * 5)],
 )
-def test_from_str__valid__calls_from_str(
-    mock_word_row__from_str: MagicMock,
+def test_from_str__valid__calls_from_layout(
+    mock_word_row__from_layout: MagicMock,
     mock_try_get_bonus_word: MagicMock,
     str_board: str,
 ) -> None:
-    """Test that from_str raises a ValueError when the board string is invalid."""
+    """Test that from_str builds each row from its layout."""
     mock_dictionary = MagicMock(Dictionary)
     Board.from_str(str_board, mock_dictionary)
 
-    assert mock_word_row__from_str.call_count == 5
+    assert mock_word_row__from_layout.call_count == 5
+    mock_word_row__from_layout.assert_called_with((1, 1, 1, 1, 1), -1, mock_dictionary)
     mock_try_get_bonus_word.assert_called_once()
 
 
@@ -188,3 +197,199 @@ def test_init__valid(mock_try_get_bonus_word: MagicMock) -> None:
 
     assert board
     mock_try_get_bonus_word.assert_called_once()
+
+
+def test_score__sums_rows_and_bonus_word(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that the board score is the row scores plus the bonus word score."""
+    mock_dictionary = MagicMock(Dictionary)
+    rows = [MagicMock(WordRow) for _ in range(5)]
+    for ix, row in enumerate(rows):
+        row.score = ix
+    mock_try_get_bonus_word.return_value.score = 100
+
+    board = Board(rows, mock_dictionary)  # type: ignore[arg-type]
+
+    assert board.score == 110
+
+
+def test_solve__uses_solver(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that solve runs the branch-and-bound solver on the board."""
+    mock_dictionary = MagicMock(Dictionary)
+    board = Board([MagicMock(WordRow) for _ in range(5)], mock_dictionary)
+    pool = TilePool()
+
+    with patch(
+        "bongo_solver.solver.branch_and_bound.BranchAndBoundSolver",
+    ) as mock_solver:
+        mock_solver.return_value.solve.return_value = MagicMock(Solution)
+        result = board.solve(pool)
+
+    mock_solver.assert_called_once_with(board, pool, None, None)
+    assert result == mock_solver.return_value.solve.return_value
+
+
+def test_solve__workers__solves_in_parallel(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that solve with several workers runs the parallel solver."""
+    mock_dictionary = MagicMock(Dictionary)
+    board = Board([MagicMock(WordRow) for _ in range(5)], mock_dictionary)
+    pool = TilePool()
+
+    with patch("bongo_solver.solver.parallel.solve_parallel") as mock_solve:
+        mock_solve.return_value = MagicMock(Solution)
+        result = board.solve(pool, workers=4)
+
+    mock_solve.assert_called_once_with(board, pool, 4, None)
+    assert result == mock_solve.return_value
+
+
+def test_solve__workers_and_stats__raises(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that stats cannot be gathered from several workers."""
+    board = Board([MagicMock(WordRow) for _ in range(5)], MagicMock(Dictionary))
+
+    with pytest.raises(ValueError, match="single worker"):
+        board.solve(TilePool(), workers=2, stats=SearchStats())
+
+
+def test_solve__no_workers__raises(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that at least one worker is required."""
+    board = Board([MagicMock(WordRow) for _ in range(5)], MagicMock(Dictionary))
+
+    with pytest.raises(ValueError, match="at least 1"):
+        board.solve(TilePool(), workers=0)
+
+
+def test_solve_anytime__uses_solver(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that solve_anytime runs the solver with the budget and gap."""
+    board = Board([MagicMock(WordRow) for _ in range(5)], MagicMock(Dictionary))
+    pool = TilePool()
+
+    with patch(
+        "bongo_solver.solver.branch_and_bound.BranchAndBoundSolver",
+    ) as mock_solver:
+        mock_solver.return_value.solve_anytime.return_value = MagicMock(Solution)
+        result = board.solve_anytime(pool, 0.05, max_gap=10)
+
+    mock_solver.assert_called_once_with(board, pool, None, None)
+    mock_solver.return_value.solve_anytime.assert_called_once_with(0.05, 10)
+    assert result == mock_solver.return_value.solve_anytime.return_value
+
+
+def test_bonus_path__slots_of_bonus_word() -> None:
+    """Test that the bonus path holds the bonus slots and is built once."""
+    board = Board.from_str("[ B   ][  B  ][   B ][  B  ][     ]", Dictionary([], []))
+
+    bonus_path = board.bonus_path
+
+    assert bonus_path is board.bonus_path
+    assert bonus_path.slots == ((0, 1), (1, 2), (2, 3), (3, 2))
+
+
+def test_fingerprint__same_contents__same() -> None:
+    """Test that boards and pools holding the same share a fingerprint."""
+    dictionary = Dictionary([], ["CAT", "AT"])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][  3  ]", dictionary)
+    other = Board.from_str("[b    ]\n[b    ]\n[b    ]\n[b    ]\n[  3  ]", dictionary)
+
+    fingerprint = board.fingerprint(TilePool.from_str("C(1)A(2)2T(3)"))
+
+    assert fingerprint == other.fingerprint(TilePool.from_str("T(3)A(2)C(1)A(2)"))
+    assert fingerprint != board.fingerprint(TilePool.from_str("C(1)A(2)2T(4)"))
+    assert fingerprint != Board.from_str(
+        "[B    ][B    ][B    ][B    ][  3  ]",
+        Dictionary([], ["CAT"]),
+    ).fingerprint(TilePool.from_str("C(1)A(2)2T(3)"))
+
+
+def test_solve__results__search_skipped_on_repeat() -> None:
+    """Test that a solution held in the results is returned without a search."""
+    board = Board.from_str(
+        "[B    ][B    ][B    ][B    ][  3  ]",
+        Dictionary([], ["CAT"]),
+    )
+    pool = TilePool.from_str("C(1)A(2)T(3)")
+    results = ResultCache()
+    solved = board.solve(pool, results=results)
+
+    with patch(
+        "bongo_solver.solver.branch_and_bound.BranchAndBoundSolver",
+    ) as mock_solver:
+        repeated = board.solve(pool, results=results)
+
+    mock_solver.assert_not_called()
+    assert board.fingerprint(pool) in results
+    assert repeated.words == solved.words
+    assert repeated.score == solved.score
+
+
+def test_top_solutions__returns_best_first() -> None:
+    """Test that the k best fillings are returned highest scoring first."""
+    dictionary = Dictionary([], ["CAT", "AT"])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][  3  ]", dictionary)
+
+    solutions = board.top_solutions(TilePool.from_str("C(1)A(2)T(3)"), 3)
+
+    assert [solution.score for solution in solutions] == [12, 11, 10]
+    assert solutions[0].placements[4] == Placement("CAT", 0, 12)
+
+
+def test_solve_anytime__int_budget__solves() -> None:
+    """Test that a budget of whole seconds is accepted as well as a float."""
+    dictionary = Dictionary([], ["CAT", "AT"])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][  3  ]", dictionary)
+
+    solution = board.solve_anytime(TilePool.from_str("C(1)A(2)T(3)"), 5)
+
+    assert solution.score == 12
+
+
+def test_top_solutions__no_k__raises(mock_try_get_bonus_word: MagicMock) -> None:
+    """Test that at least one solution is required."""
+    board = Board([MagicMock(WordRow) for _ in range(5)], MagicMock(Dictionary))
+
+    with pytest.raises(ValueError, match="at least 1"):
+        board.top_solutions(TilePool(), 0)
+
+
+def test_fill__places_tiles() -> None:
+    """Test that fill takes tiles from the pool and places them on the board."""
+    dictionary = Dictionary(["CAT"], [])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][     ]", dictionary)
+    pool = TilePool.from_str("C(1)A(1)T(1)")
+    solution = Solution([None, Placement("CAT", 1, 4), None, None, None], "", 4)
+
+    board.fill(solution, pool)
+
+    assert board.rows[1].word == "CAT"
+    assert board.rows[1][0].is_empty
+    assert len(pool) == 0
+    assert board.score == 4
+
+
+def test_fill__missing_tile__raises() -> None:
+    """Test that fill raises when the pool lacks a tile the solution needs."""
+    dictionary = Dictionary(["CAT"], [])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][     ]", dictionary)
+    pool = TilePool.from_str("C(1)A(1)")
+    solution = Solution([Placement("CAT", 0, 4), None, None, None, None], "", 4)
+
+    with pytest.raises(ValueError, match="Tile pool has no tile left for letter 'T'."):
+        board.fill(solution, pool)
+
+
+def test_fill__missing_tile__board_and_pool_unchanged() -> None:
+    """Test that a solution that cannot be placed leaves no tile placed or taken."""
+    dictionary = Dictionary(["CAT", "AT"], [])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][     ]", dictionary)
+    pool = TilePool.from_str("C(1)A(1)T(1)")
+    solution = Solution(
+        [Placement("CAT", 0, 4), Placement("AT", 0, 3), None, None, None],
+        "",
+        7,
+    )
+
+    with pytest.raises(ValueError, match="no tile left"):
+        board.fill(solution, pool)
+
+    assert all(slot.is_empty for row in board.rows for slot in row.slots)
+    assert len(pool) == 3
+    assert board.score == 0
@@ -0,0 +1,81 @@
+"""Tests for the command line interface."""
+
+import json
+from pathlib import Path
+
+from bongo_solver.cli import main
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.candidate_table import CandidateTableCache
+
+
+def test_compile_dictionary__writes_loadable_file(tmp_path: Path) -> None:
+    """Test that compile-dictionary writes a file from_compiled can load."""
+    (tmp_path / "common_words.txt").write_text("CAT\n")
+    (tmp_path / "valid_words.txt").write_text("CAT\nDOG\n")
+    output = tmp_path / "dictionary.bin"
+
+    code = main(["compile-dictionary", str(tmp_path), str(output)])
+
+    assert code == 0
+    loaded = Dictionary.from_compiled(output)
+    assert loaded.common_words == {"CAT"}
+    assert loaded.valid_words == {"DOG"}
+
+
+def test_batch__writes_result_per_puzzle(tmp_path: Path) -> None:
+    """Test that batch solves each puzzle line and writes a result line."""
+    (tmp_path / "common_words.txt").write_text("CAT\n")
+    (tmp_path / "valid_words.txt").write_text("ACT\n")
+    board = "[B    ][B    ][B    ][B    ][  3  ]"
+    puzzles = tmp_path / "puzzles.jsonl"
+    puzzles.write_text(
+        "\n".join(
+            json.dumps({"id": day, "board": board, "pool": "C(1)A(2)T(3)"})
+            for day in ("mon", "tue")
+        ),
+    )
+    output = tmp_path / "results.jsonl"
+
+    code = main(["batch", str(puzzles), "-d", str(tmp_path), "-o", str(output)])
+
+    assert code == 0
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["id"] for r in results] == ["mon", "tue"]
+    assert results[0]["words"] == ["", "", "", "", "CAT"]
+    assert "seconds" in results[0]
+
+
+def test_batch__table_cache__tables_saved(tmp_path: Path) -> None:
+    """Test that batch saves the candidate tables at the table cache path."""
+    (tmp_path / "common_words.txt").write_text("CAT\n")
+    (tmp_path / "valid_words.txt").write_text("ACT\n")
+    board = "[B    ][B    ][B    ][B    ][  3  ]"
+    puzzles = tmp_path / "puzzles.jsonl"
+    puzzles.write_text(json.dumps({"board": board, "pool": "C(1)A(2)T(3)"}))
+    tables = tmp_path / "tables.json"
+    args = ["batch", str(puzzles), "-d", str(tmp_path), "-o", str(tmp_path / "out")]
+
+    code = main([*args, "--table-cache", str(tables)])
+
+    assert code == 0
+    assert len(CandidateTableCache(path=tables)) > 0
+
+
+def test_batch__failed_puzzle__error_line(tmp_path: Path) -> None:
+    """Test that lines that cannot be solved write their error and not words."""
+    (tmp_path / "common_words.txt").write_text("CAT\n")
+    (tmp_path / "valid_words.txt").write_text("ACT\n")
+    board = "[B    ][B    ][B    ][B    ][  3  ]"
+    puzzles = tmp_path / "puzzles.jsonl"
+    good = json.dumps({"id": "good", "board": board, "pool": "C(1)A(2)T(3)"})
+    bad = json.dumps({"id": "bad", "board": "[B", "pool": "C(1)"})
+    puzzles.write_text(f"{bad}\n{{\n{good}")
+    output = tmp_path / "results.jsonl"
+
+    code = main(["batch", str(puzzles), "-d", str(tmp_path), "-o", str(output)])
+
+    assert code == 0
+    results = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r.get("id") for r in results] == ["bad", None, "good"]
+    assert all("error" in r and "words" not in r for r in results[:2])
+    assert results[2]["words"] == ["", "", "", "", "CAT"]
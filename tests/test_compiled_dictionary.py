@@ -0,0 +1,42 @@
+"""Tests for reading and writing compiled dictionary sections."""
+
+from pathlib import Path
+
+import pytest
+
+from bongo_solver.compiled_dictionary import read_sections, write_sections
+
+
+def test_read_sections__round_trips(tmp_path: Path) -> None:
+    """Test that sections of any size are read back as written."""
+    path = tmp_path / "dictionary.bin"
+    sections = [b"CAT", b"", b"12345678", b"\x00\x01"]
+
+    write_sections(path, sections)
+
+    assert [bytes(section) for section in read_sections(path)] == sections
+
+
+def test_write_sections__wrong_count__raises(tmp_path: Path) -> None:
+    """Test that the number of sections is checked."""
+    with pytest.raises(ValueError, match="Expected 4 sections"):
+        write_sections(tmp_path / "dictionary.bin", [b"CAT"])
+
+
+def test_read_sections__not_compiled__raises(tmp_path: Path) -> None:
+    """Test that a file without the magic bytes is rejected."""
+    path = tmp_path / "words.txt"
+    path.write_bytes(b"CAT\nDOG\n" * 10)
+
+    with pytest.raises(ValueError, match="not a compiled dictionary"):
+        read_sections(path)
+
+
+def test_read_sections__truncated__raises(tmp_path: Path) -> None:
+    """Test that a file cut short is rejected."""
+    path = tmp_path / "dictionary.bin"
+    write_sections(path, [b"CAT", b"DOG", b"", b""])
+    path.write_bytes(path.read_bytes()[:-8])
+
+    with pytest.raises(ValueError, match="truncated"):
+        read_sections(path)
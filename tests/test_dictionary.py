@@ -3,7 +3,7 @@
 from pathlib import Path
 from unittest.mock import MagicMock, call, mock_open, patch
 
-from bongo_solver.dictionary import Dictionary, load_word_file
+from bongo_solver.dictionary import Dictionary, WordKind, load_word_file
 
 
 def test_load_word_file__path__opens() -> None:
@@ -125,3 +125,88 @@ def test_from_directory() -> None:
             Path(directory) / "common_words.txt",
             Path(directory) / "valid_words.txt",
         )
+
+
+def test_index__is_built_once() -> None:
+    """Test that the index covers all words and is reused."""
+    dictionary = Dictionary(["CAT"], ["ACT", "CAST"])
+
+    index = dictionary.index
+
+    assert index is dictionary.index
+    assert index.words_of_length(3) == ["ACT", "CAT"]
+    assert index.words_of_length(4) == ["CAST"]
+
+
+def test_matching() -> None:
+    """Test that matching returns the words fitting a pattern and letters."""
+    dictionary = Dictionary(["CAT"], ["ACT", "CAST", "TACT"])
+
+    assert dictionary.matching("?A?") == ["CAT"]
+    assert dictionary.matching("????", {"C": 1, "A": 1, "S": 1, "T": 1}) == ["CAST"]
+
+
+def test_kind_of() -> None:
+    """Test that kind_of tells common, valid and unknown words apart."""
+    dictionary = Dictionary(["a"], ["a", "b"])
+    assert dictionary.kind_of("a") is WordKind.COMMON
+    assert dictionary.kind_of("b") is WordKind.VALID
+    assert dictionary.kind_of("c") is None
+
+
+def test_all_words__is_cached() -> None:
+    """Test that all_words is computed once rather than on every access."""
+    dictionary = Dictionary(["a"], ["b"])
+    assert dictionary.all_words is dictionary.all_words
+
+
+def test_version__equal_words__equal_version() -> None:
+    """Test that the version depends on the words alone."""
+    dictionary = Dictionary(["CAT"], ["ACT", "CAST"])
+
+    assert dictionary.version == Dictionary(["CAT"], ["CAST", "ACT"]).version
+    assert dictionary.version != Dictionary(["CAT", "ACT"], ["CAST"]).version
+    assert dictionary.version != Dictionary(["CAT"], ["ACT"]).version
+
+
+def test_trie__is_built_once() -> None:
+    """Test that the trie covers all words and is reused."""
+    dictionary = Dictionary(["CAT"], ["CATS"])
+
+    trie = dictionary.trie
+
+    assert trie is dictionary.trie
+    assert trie.complete_words("") == ["CAT", "CATS"]
+
+
+def test_has_prefix() -> None:
+    """Test that has_prefix finds the starts of words."""
+    dictionary = Dictionary(["CAT"], ["DOG"])
+    assert dictionary.has_prefix("CA")
+    assert dictionary.has_prefix("DOG")
+    assert not dictionary.has_prefix("CO")
+
+
+def test_from_compiled__round_trips(tmp_path: Path) -> None:
+    """Test that a compiled dictionary loads the same words, index and trie."""
+    dictionary = Dictionary(["CAT"], ["CAT", "CAST", "TACT"])
+    path = tmp_path / "dictionary.bin"
+
+    dictionary.compile(path)
+    loaded = Dictionary.from_compiled(path)
+
+    assert loaded.common_words == {"CAT"}
+    assert loaded.valid_words == {"CAST", "TACT"}
+    assert loaded.kind_of("CAT") is WordKind.COMMON
+    assert loaded.matching("????", {"C": 1, "A": 1, "S": 1, "T": 1}) == ["CAST"]
+    assert loaded.trie.complete_words("CA") == ["CAST", "CAT"]
+
+
+def test_kinds_of() -> None:
+    """Test that kinds_of looks up a batch of words in order."""
+    dictionary = Dictionary(["a"], ["b"])
+    assert dictionary.kinds_of(["b", "c", "a"]) == [
+        WordKind.VALID,
+        None,
+        WordKind.COMMON,
+    ]
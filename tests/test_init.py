@@ -0,0 +1,45 @@
+"""Tests for the package initialization."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+import bongo_solver
+from bongo_solver.letter_scores import try_get_letter_score
+
+# Prints whether a function was wrapped by beartype when imported.
+PROBE = (
+    "from bongo_solver.letter_scores import try_get_letter_score as f; "
+    "print(hasattr(f, '__wrapped__'))"
+)
+
+
+def run_probe(typecheck: str) -> str:
+    """Return the probe output from an interpreter with type checking set."""
+    env = {**os.environ, bongo_solver.TYPECHECK_ENV_VAR: typecheck}
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", PROBE],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout.strip()
+
+
+def test_typecheck__matches_instrumentation() -> None:
+    """Test that TYPECHECK tells whether the modules were instrumented."""
+    assert hasattr(try_get_letter_score, "__wrapped__") == bongo_solver.TYPECHECK
+
+
+@pytest.mark.parametrize("value", ["0", "false", "No", "OFF"])
+def test_typecheck__disabled__not_checked(value: str) -> None:
+    """Test that the environment variable turns type checking off."""
+    assert run_probe(value) == "False"
+
+
+@pytest.mark.parametrize("value", ["1", "true", ""])
+def test_typecheck__enabled__checked(value: str) -> None:
+    """Test that other values leave type checking on."""
+    assert run_probe(value) == "True"
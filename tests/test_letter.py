@@ -1,5 +1,7 @@
 """Tests for the Letter class."""
 
+import pickle
+
 import pytest
 from beartype.roar import BeartypeCallHintParamViolation
 
@@ -74,3 +76,43 @@ def test_repr__returns_string_representation() -> None:
     """Test that the __repr__ method returns a string representation."""
     letter = Letter("A")
     assert repr(letter) == "Letter('A')"
+
+
+def test_new__same_letter__is_interned() -> None:
+    """Test that a letter is constructed once whatever its case."""
+    assert Letter("a") is Letter("A")
+    assert Letter("b") is not Letter("A")
+
+
+def test_new__table_full__starts_afresh_with_equal_letters(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the letters interned are bounded, with old and new equal."""
+    monkeypatch.setattr("bongo_solver.letter.MAX_INTERNED_LETTERS", 4)
+    letter = Letter("Q")
+
+    for other in "BCDEFGH":
+        Letter(other)
+    again = Letter("Q")
+
+    assert again is not letter
+    assert again == letter
+    assert hash(again) == hash(letter)
+
+
+def test_hash__matches_str() -> None:
+    """Test that letters hash as their uppercase string."""
+    assert hash(Letter("a")) == hash("A")
+
+
+def test_letter__is_read_only() -> None:
+    """Test that a letter cannot be changed once interned."""
+    letter = Letter("A")
+    with pytest.raises(AttributeError):
+        letter.letter = "B"  # type: ignore[misc]
+
+
+def test_pickle__returns_interned() -> None:
+    """Test that unpickling returns the interned letter."""
+    letter = Letter("A")
+    assert pickle.loads(pickle.dumps(letter)) is letter  # noqa: S301
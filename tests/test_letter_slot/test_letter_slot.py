@@ -128,3 +128,29 @@ def test_is_multiplier__not_multiplier() -> None:
     """Test that is_multiplier returns False when the slot is not a multiplier."""
     slot = LetterSlot()
     assert slot.is_multiplier is False
+
+
+@pytest.mark.parametrize(
+    ("old_tile", "new_tile", "expected_changes"),
+    [
+        (None, LetterTile("A", 3), (6, 1)),
+        (LetterTile("A", 3), LetterTile("B", 5), (4, 0)),
+        (LetterTile("A", 3), None, (-6, -1)),
+    ],
+)
+def test_letter_tile__watched__tells_words(
+    old_tile: LetterTile | None,
+    new_tile: LetterTile | None,
+    expected_changes: tuple[int, int],
+) -> None:
+    """Test that placing a tile tells each watching word the score change."""
+    slot = LetterSlot(multiplier=2)
+    slot.letter_tile = old_tile
+    words = [MagicMock(), MagicMock()]
+    for word in words:
+        slot.watch(word)
+
+    slot.letter_tile = new_tile
+
+    for word in words:
+        word.slot_changed.assert_called_once_with(*expected_changes)
@@ -1,5 +1,6 @@
 """Contains tests for the LetterTile class."""
 
+import pickle
 from unittest.mock import MagicMock
 
 import pytest
@@ -81,3 +82,41 @@ def test_eq__diff_letters_same_score__returns_false(
     tile2 = LetterTile("B")
 
     assert tile1 != tile2
+
+
+def test_new__same_letter_and_score__is_interned() -> None:
+    """Test that tiles of the same letter and score are one object."""
+    tile = LetterTile("a", 3)
+
+    assert LetterTile("A", 3) is tile
+    assert LetterTile(Letter("A"), 3) is tile
+    assert LetterTile("A", 4) is not tile
+
+
+def test_new__table_full__starts_afresh_with_equal_tiles(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that the tiles interned are bounded, with old and new tiles equal."""
+    monkeypatch.setattr("bongo_solver.letter_tile.MAX_INTERNED_TILES", 4)
+    tile = LetterTile("A", 100)
+
+    for score in range(101, 110):
+        LetterTile("A", score)
+    again = LetterTile("A", 100)
+
+    assert again is not tile
+    assert again == tile
+    assert hash(again) == hash(tile)
+    assert again != LetterTile("A", 101)
+
+
+def test_hash__usable_as_key() -> None:
+    """Test that interned tiles can key a dict."""
+    counts = {LetterTile("A", 3): 1}
+    assert counts[LetterTile("A", 3)] == 1
+
+
+def test_pickle__returns_interned() -> None:
+    """Test that unpickling returns the interned tile."""
+    tile = LetterTile("A", 3)
+    assert pickle.loads(pickle.dumps(tile)) is tile  # noqa: S301
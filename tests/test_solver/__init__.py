@@ -0,0 +1 @@
+"""Contains tests for the solver module."""
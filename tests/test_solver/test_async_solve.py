@@ -0,0 +1,235 @@
+"""Tests for solving boards from asyncio code."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from bongo_solver.board import Board
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.async_solve import (
+    DEFAULT_CONCURRENCY,
+    Progress,
+    solve_async,
+    solve_progress,
+)
+from bongo_solver.solver.result_cache import ResultCache
+from bongo_solver.solver.solution import Solution
+from bongo_solver.tile_pool import TilePool
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Generator
+
+BOARD = "[B    ][B    ][B    ][B    ][  3  ]"
+POOL = "C(1)A(2)T(3)"
+
+
+@pytest.fixture
+def board() -> Board:
+    """Return a board with a few words to place."""
+    return Board.from_str(BOARD, Dictionary(["CAT"], ["ACT", "AT"]))
+
+
+class StallingSolver:
+    """A solver whose search runs until it is stopped, counting those running."""
+
+    running = 0
+    most_running = 0
+    stopped = 0
+    changed = threading.Condition()
+
+    def __init__(self, *_: object) -> None:
+        """Initialize the solver with a first filling found."""
+        self.incumbent = Solution([None] * 5, "", 1)
+        self.upper_bound = 10
+        self.stop = threading.Event()
+
+    def stop_on(self, stop: threading.Event) -> None:
+        """Keep the stop event."""
+        self.stop = stop
+
+    def solve_anytime(self, *_: object) -> Solution:
+        """Wait for the stop event, or a second, and return the filling found."""
+        with self.changed:
+            StallingSolver.running += 1
+            StallingSolver.most_running = max(self.most_running, self.running)
+        self.stop.wait(timeout=1.0)
+        with self.changed:
+            StallingSolver.running -= 1
+            StallingSolver.stopped += self.stop.is_set()
+            self.changed.notify_all()
+        return self.incumbent
+
+    @classmethod
+    async def wait_for(cls, predicate: Callable[[], bool]) -> None:
+        """Wait in a thread, up to a second, for the counts to satisfy a predicate."""
+
+        def wait() -> None:
+            with cls.changed:
+                cls.changed.wait_for(predicate, timeout=1.0)
+
+        await asyncio.to_thread(wait)
+
+
+@pytest.fixture
+def stalling_solver() -> Generator[type[StallingSolver], None, None]:
+    """Patch the solver run by the async functions with a stalling one."""
+    StallingSolver.running = StallingSolver.most_running = StallingSolver.stopped = 0
+    with patch(
+        "bongo_solver.solver.async_solve.BranchAndBoundSolver",
+        StallingSolver,
+    ):
+        yield StallingSolver
+
+
+def run(coroutine: Coroutine[object, object, object]) -> object:
+    """Run a coroutine on a new event loop."""
+    return asyncio.run(coroutine)
+
+
+def test_solve_async__same_as_solve(board: Board) -> None:
+    """Test that the async solve finds the best filling."""
+    solution = run(solve_async(board, TilePool.from_str(POOL)))
+
+    assert isinstance(solution, Solution)
+    assert solution.score == board.solve(TilePool.from_str(POOL)).score
+
+
+def test_solve_async__int_budget__same_as_solve(board: Board) -> None:
+    """Test that budgets and intervals of whole seconds are accepted."""
+
+    async def collect() -> list[Progress]:
+        return [
+            progress
+            async for progress in solve_progress(
+                board,
+                TilePool.from_str(POOL),
+                60,
+                interval=1,
+            )
+        ]
+
+    progresses = run(collect())
+
+    assert isinstance(progresses, list)
+    assert progresses[-1].incumbent.score == board.solve(TilePool.from_str(POOL)).score
+
+
+def test_solve_progress__ends_with_result(board: Board) -> None:
+    """Test that the last progress is done and holds a proven best filling."""
+
+    async def collect() -> list[Progress]:
+        return [p async for p in solve_progress(board, TilePool.from_str(POOL))]
+
+    progresses = run(collect())
+
+    assert isinstance(progresses, list)
+    assert progresses[-1].done
+    assert not any(progress.done for progress in progresses[:-1])
+    assert progresses[-1].upper_bound == progresses[-1].incumbent.score
+
+
+def test_solve_progress__running__yields_incumbent(
+    board: Board,
+    stalling_solver: type[StallingSolver],
+) -> None:
+    """Test that a running search reports its incumbent and stops on close."""
+
+    async def first() -> Progress:
+        progresses = solve_progress(board, TilePool(), interval=0.01)
+        progress = await progresses.__anext__()
+        await progresses.aclose()
+        await stalling_solver.wait_for(lambda: stalling_solver.stopped == 1)
+        return progress
+
+    progress = run(first())
+
+    assert isinstance(progress, Progress)
+    assert not progress.done
+    assert progress.incumbent.score == 1
+    assert progress.upper_bound == 10
+    assert stalling_solver.stopped == 1
+
+
+def test_solve_async__cancelled__search_stopped(
+    board: Board,
+    stalling_solver: type[StallingSolver],
+) -> None:
+    """Test that cancelling the awaiting task stops the search thread."""
+
+    async def cancel() -> None:
+        task = asyncio.ensure_future(solve_async(board, TilePool()))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await stalling_solver.wait_for(lambda: stalling_solver.stopped == 1)
+
+    run(cancel())
+
+    assert stalling_solver.stopped == 1
+
+
+def test_solve_async__limit__bounds_running_searches(
+    board: Board,
+    stalling_solver: type[StallingSolver],
+) -> None:
+    """Test that searches sharing a limit do not run more at once than it allows."""
+
+    async def solve_some() -> None:
+        limit = asyncio.Semaphore(2)
+        tasks = [
+            asyncio.ensure_future(solve_async(board, TilePool(), limit=limit))
+            for _ in range(4)
+        ]
+        await asyncio.sleep(0.1)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await stalling_solver.wait_for(lambda: stalling_solver.stopped == 2)
+
+    run(solve_some())
+
+    assert stalling_solver.most_running == 2
+    assert stalling_solver.running == 0
+
+
+def test_solve_async__no_limit__one_search_at_a_time(
+    board: Board,
+    stalling_solver: type[StallingSolver],
+) -> None:
+    """Test that searches given no limit run one at a time on a loop."""
+
+    async def solve_some() -> None:
+        tasks = [
+            asyncio.ensure_future(solve_async(board, TilePool())) for _ in range(3)
+        ]
+        await asyncio.sleep(0.1)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await stalling_solver.wait_for(lambda: stalling_solver.stopped == 1)
+
+    run(solve_some())
+
+    assert stalling_solver.most_running == DEFAULT_CONCURRENCY == 1
+    assert stalling_solver.running == 0
+
+
+def test_solve_async__results__held_solution_returned(board: Board) -> None:
+    """Test that a solution held in the results is returned without a search."""
+    pool = TilePool.from_str(POOL)
+    results = ResultCache()
+    solved = run(solve_async(board, pool, results=results))
+
+    with patch("bongo_solver.solver.async_solve.BranchAndBoundSolver") as mock_solver:
+        repeated = run(solve_async(board, pool, results=results))
+
+    mock_solver.assert_not_called()
+    assert isinstance(solved, Solution)
+    assert isinstance(repeated, Solution)
+    assert repeated.words == solved.words
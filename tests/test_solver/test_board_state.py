@@ -0,0 +1,171 @@
+"""Tests for the BoardState class."""
+
+import pytest
+
+from bongo_solver.board import Board
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.letter_tile import LetterTile
+from bongo_solver.solver.board_state import EMPTY, NO_SCORE, BoardState, letter_code
+from bongo_solver.tile_pool import TilePool
+
+BOARD = "[2 B  ]\n[  B 3]\n[ B2  ]\n[  B  ]\n[ 2   ]"
+
+
+@pytest.fixture
+def dictionary() -> Dictionary:
+    """Return a dictionary of a few words."""
+    return Dictionary(["CAT"], ["TACT"])
+
+
+@pytest.fixture
+def board(dictionary: Dictionary) -> Board:
+    """Return a board with CAT in the first row."""
+    board = Board.from_str(BOARD, dictionary)
+    for ix, letter in enumerate("CAT"):
+        board.rows[0][ix] = LetterTile(letter, 3)
+    return board
+
+
+def test_letter_code() -> None:
+    """Test that letters are coded from 1 with 0 left for empty slots."""
+    assert letter_code("A") == 1
+    assert letter_code("Z") == 26
+
+
+@pytest.mark.parametrize("letter", ["a", "", "AB", "É", " "])
+def test_letter_code__not_letter__raises(letter: str) -> None:
+    """Test that only single uppercase letters A to Z have codes."""
+    with pytest.raises(ValueError, match="Only the letters A to Z"):
+        letter_code(letter)
+
+
+def test_from_board(board: Board) -> None:
+    """Test that the slots, bonus path and pool are read into arrays."""
+    state = BoardState.from_board(board, TilePool.from_str("T(3)2Q(10)"))
+
+    assert list(state.letters[:5]) == [3, 1, 20, EMPTY, EMPTY]
+    assert state.multipliers[:5] == bytes([2, 1, 1, 1, 1])
+    assert state.bonus_path == (2, 7, 11, 17)
+    assert state.counts[letter_code("T")] == 2
+    assert state.counts[letter_code("Q")] == 1
+    assert state.scores[letter_code("C")] == 3
+    assert state.row_word(0) == "CAT"
+    assert state.bonus_word() == "T"
+
+
+def test_to_board__round_trips(board: Board, dictionary: Dictionary) -> None:
+    """Test that a board converts to a state and back unchanged."""
+    state = BoardState.from_board(board, TilePool())
+
+    assert str(state.to_board(dictionary)) == str(board)
+    assert state.to_board(dictionary).score == board.score
+
+
+def test_to_pool__round_trips() -> None:
+    """Test that a pool converts to a state and back unchanged."""
+    pool = TilePool.from_str("A(5)3E(5)2K(50)")
+    state = BoardState([1] * 25, [0, 5, 10, 15], [0] * 27, [0] * 27)
+    state = BoardState.from_board(state.to_board(Dictionary([], [])), pool)
+
+    result = state.to_pool()
+
+    assert result.count_by_letter() == pool.count_by_letter()
+    assert result.score_by_letter() == pool.score_by_letter()
+
+
+def test_to_pool__used_up_letter__score_kept() -> None:
+    """Test that a letter whose tiles were all taken keeps its score."""
+    pool = TilePool.from_str("A(2)S(4)")
+    pool.take("S")
+    state = BoardState([1] * 25, [0, 5, 10, 15], [0] * 27, [0] * 27)
+    state = BoardState.from_board(state.to_board(Dictionary([], [])), pool)
+
+    result = state.to_pool()
+
+    assert state.scores[letter_code("S")] == 4
+    assert state.scores[letter_code("B")] == NO_SCORE
+    assert result.snapshot() == pool.snapshot()
+
+
+def test_place_and_undo(board: Board) -> None:
+    """Test that placing and undoing a tile moves it between pool and slot."""
+    state = BoardState.from_board(board, TilePool.from_str("S(1)"))
+    code = letter_code("S")
+
+    state.place(3, code)
+
+    assert state.row_word(0) == "CATS"
+    assert state.counts[code] == 0
+
+    state.undo(3)
+
+    assert state.row_word(0) == "CAT"
+    assert state.counts[code] == 1
+
+
+def test_place__full_slot__raises(board: Board) -> None:
+    """Test that a tile cannot be placed on another."""
+    state = BoardState.from_board(board, TilePool.from_str("S(1)"))
+
+    with pytest.raises(ValueError, match="already holds"):
+        state.place(0, letter_code("S"))
+
+
+def test_place__no_tile__raises(board: Board) -> None:
+    """Test that a letter with no tiles left cannot be placed."""
+    state = BoardState.from_board(board, TilePool())
+
+    with pytest.raises(ValueError, match="No tile left for letter 'S'"):
+        state.place(3, letter_code("S"))
+
+
+def test_undo__empty_slot__raises(board: Board) -> None:
+    """Test that an empty slot cannot be undone."""
+    state = BoardState.from_board(board, TilePool())
+
+    with pytest.raises(ValueError, match="holds no tile"):
+        state.undo(4)
+
+
+def test_row_word__keeps_inner_blanks(board: Board) -> None:
+    """Test that blanks between letters are kept as in Word.word."""
+    state = BoardState.from_board(board, TilePool.from_str("S(1)"))
+    state.undo(1)
+
+    assert state.row_word(0) == "C T"
+
+
+def test_packed_row(board: Board) -> None:
+    """Test that the codes of a row are packed five bits each."""
+    state = BoardState.from_board(board, TilePool())
+
+    assert state.packed_row(0) == (3 << 20) | (1 << 15) | (20 << 10)
+    assert state.packed_row(1) == 0
+
+
+@pytest.mark.parametrize(
+    ("multipliers", "bonus_path", "counts", "match"),
+    [
+        ([1] * 24, [0, 5, 10, 15], [0] * 27, "25 slots"),
+        ([1] * 25, [0, 5, 10, 15], [0] * 26, "27 letter codes"),
+        ([1] * 25, [0, 5, 10], [0] * 27, "4 slots"),
+    ],
+)
+def test_init__wrong_sizes__raises(
+    multipliers: list[int],
+    bonus_path: list[int],
+    counts: list[int],
+    match: str,
+) -> None:
+    """Test that arrays of the wrong size are rejected."""
+    with pytest.raises(ValueError, match=match):
+        BoardState(multipliers, bonus_path, counts, [0] * 27)
+
+
+def test_init__tiles_without_score__raises() -> None:
+    """Test that a letter with tiles left must have a score."""
+    counts = [0] * 27
+    counts[letter_code("A")] = 1
+
+    with pytest.raises(ValueError, match="must have a score"):
+        BoardState([1] * 25, [0, 5, 10, 15], counts, [NO_SCORE] * 27)
@@ -0,0 +1,136 @@
+"""Tests for the bound of the rows left with priced tiles."""
+
+import random
+from itertools import product
+
+import numpy as np
+import pytest
+
+from bongo_solver.solver.bound import (
+    PRICE_SCALE,
+    candidate_scores,
+    letter_prices,
+    need_matrix,
+    priced_order,
+    priced_scores,
+    tiles_price,
+)
+from bongo_solver.solver.candidate_table import EMPTY_CANDIDATE, Candidate
+
+
+def candidate(score: int, needs: tuple[tuple[int, int], ...]) -> Candidate:
+    """Return a candidate with a score and the tiles it needs by letter index."""
+    return Candidate(score, "W", 0, needs, -1, 0, score)
+
+
+def prices_of(rows: list[list[Candidate]], counts: list[int]) -> list[int]:
+    """Return the prices tuned for the rows and counts."""
+    arrays = [(candidate_scores(row), need_matrix(row, len(counts))) for row in rows]
+    return letter_prices(arrays, counts)
+
+
+def row_priced_scores(row: list[Candidate], prices: list[int]) -> list[int]:
+    """Return the priced score of each candidate of a row."""
+    needs = need_matrix(row, len(prices))
+    return priced_scores(candidate_scores(row), needs, prices).tolist()
+
+
+def priced_bound(
+    rows: list[list[Candidate]],
+    counts: list[int],
+    prices: list[int],
+) -> int:
+    """Return the priced bound of the rows with none of their tiles taken."""
+    total = tiles_price(prices, counts)
+    total += sum(max(row_priced_scores(row, prices)) for row in rows)
+    return total // PRICE_SCALE
+
+
+def best_filling(rows: list[list[Candidate]], counts: list[int]) -> int:
+    """Return the best score of a candidate per row the tiles can spell."""
+    best = 0
+    for chosen in product(*rows):
+        used = [0] * len(counts)
+        for row_candidate in chosen:
+            for ix, count in row_candidate.needs:
+                used[ix] += count
+        if all(u <= c for u, c in zip(used, counts, strict=True)):
+            best = max(best, sum(row_candidate.optimistic for row_candidate in chosen))
+    return best
+
+
+def test_letter_prices__shared_tile__bounds_one_use() -> None:
+    """Test that rows wanting the only tile of a letter are bounded by one use."""
+    rows = [[candidate(10, ((0, 1),)), EMPTY_CANDIDATE]] * 3
+
+    prices = prices_of(rows, [1])
+
+    assert 10 <= priced_bound(rows, [1], prices) < 15
+
+
+def test_letter_prices__tiles_to_spare__free() -> None:
+    """Test that letters no row wants more of than there are cost nothing."""
+    rows = [[candidate(10, ((0, 1),)), EMPTY_CANDIDATE]] * 2
+
+    assert prices_of(rows, [3]) == [0]
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_priced_bound__any_prices__bounds_best_filling(seed: int) -> None:
+    """Test that the bound holds whatever the prices, tuned or not."""
+    rng = random.Random(seed)  # noqa: S311
+    counts = [rng.randint(0, 2) for _ in range(3)]
+    rows = [
+        [
+            *(
+                candidate(
+                    rng.randint(1, 30),
+                    tuple((ix, rng.randint(1, 2)) for ix in rng.sample(range(3), 2)),
+                )
+                for _ in range(4)
+            ),
+            EMPTY_CANDIDATE,
+        ]
+        for _ in range(3)
+    ]
+    best = best_filling(rows, counts)
+
+    for prices in [
+        prices_of(rows, counts),
+        [rng.randint(0, 900) for _ in range(3)],
+    ]:
+        assert priced_bound(rows, counts, prices) >= best
+
+
+def test_priced_scores__tiles_charged() -> None:
+    """Test that each candidate is charged the price of the tiles it needs."""
+    cheap = candidate(10, ((1, 1),))
+    dear = candidate(20, ((0, 2),))
+
+    scores = row_priced_scores([dear, cheap, EMPTY_CANDIDATE], [7 * 64, 1])
+
+    assert scores == [6 * 64, 10 * 64 - 1, 0]
+
+
+def test_priced_order__best_first_ties_in_order() -> None:
+    """Test that candidates come best priced first, ties in their order."""
+    assert priced_order(np.array([6, 10, -2, 0, 0])).tolist() == [1, 0, 3, 4, 2]
+
+
+def test_letter_prices__deadline_passed__free() -> None:
+    """Test that no step is taken once the deadline has passed."""
+    rows = [[candidate(10, ((0, 1),)), EMPTY_CANDIDATE]] * 3
+    arrays = [(candidate_scores(row), need_matrix(row, 1)) for row in rows]
+
+    assert letter_prices(arrays, [1], deadline=0.0) == [0]
+
+
+def test_need_matrix__count_of_each_letter() -> None:
+    """Test that each candidate's row holds the count of each letter it needs."""
+    rows = [
+        candidate(5, ((0, 2), (2, 1))),
+        EMPTY_CANDIDATE,
+        candidate(5, ((0, 2), (2, 1))),
+    ]
+
+    assert need_matrix(rows, 3).tolist() == [[2, 0, 1], [0, 0, 0], [2, 0, 1]]
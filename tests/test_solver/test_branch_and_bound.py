@@ -0,0 +1,482 @@
+"""Tests for the BranchAndBoundSolver class."""
+
+from __future__ import annotations
+
+import threading
+from collections import Counter
+from itertools import islice
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bongo_solver.board import Board
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.branch_and_bound import (
+    BranchAndBoundSolver,
+    SearchTimeoutError,
+)
+from bongo_solver.solver.candidate_table import CandidateTableCache, row_layout
+from bongo_solver.solver.placement import Placement
+from bongo_solver.solver.search_stats import PruneReason, SearchStats
+from bongo_solver.solver.solution import Solution
+from bongo_solver.solver.transposition import TranspositionTable
+from bongo_solver.tile_pool import TilePool
+from bongo_solver.word.bonus_word import BONUS_WORD_LENGTH
+
+PLAIN_BOARD = "[B    ][B    ][B    ][B    ][     ]"
+MULTIPLIER_BOARD = "[ 2B  ][  B 3][ B2  ][  B  ][ 2   ]"
+
+
+def filling_scores(board_str: str, pool_str: str, dictionary: Dictionary) -> list[int]:
+    """Return the score of every filling of the rows, highest first.
+
+    Each row holds a word, a lone tile in its bonus slot or nothing. Lone
+    tiles score only in the bonus word, so fillings holding one without a
+    bonus word are left out.
+    """
+    board = Board.from_str(board_str, dictionary)
+    pool = TilePool.from_str(pool_str)
+    counts = Counter({str(k): v for k, v in pool.count_by_letter().items()})
+    placements: list[Placement | None] = [None]
+    placements += [
+        Placement(word, offset, 0)
+        for word in dictionary.all_words
+        for offset in range(6 - len(word))
+    ]
+    row_placements = [
+        placements
+        + [
+            Placement(letter, row.get_bonus_ix(), 0)
+            for letter in counts
+            if row.get_bonus_ix() >= 0 and letter not in dictionary.all_words
+        ]
+        for row in board.rows
+    ]
+
+    scores = []
+
+    def fill(rows: list[Placement | None], remaining: Counter[str]) -> None:
+        if len(rows) == BONUS_WORD_LENGTH and any(
+            p and p.word not in dictionary.all_words for p in rows
+        ):
+            bonus = "".join(
+                (p and p.letter_at(row.get_bonus_ix())) or " "
+                for p, row in zip(rows, board.rows, strict=False)
+            )
+            if bonus.strip() not in dictionary.all_words:
+                return
+        if len(rows) == len(board.rows):
+            board.fill(Solution(rows, "", 0), TilePool.from_str(pool_str))
+            lone = any(p and p.word not in dictionary.all_words for p in rows)
+            if board.bonus_word.score or not lone:
+                scores.append(board.score)
+            for row in board.rows:
+                for ix in range(len(row.slots)):
+                    row[ix] = None
+            return
+        for placement in row_placements[len(rows)]:
+            needed = Counter(placement.word) if placement else Counter()
+            if all(remaining[letter] >= n for letter, n in needed.items()):
+                fill([*rows, placement], remaining - needed)
+
+    fill([], counts)
+    return sorted(scores, reverse=True)
+
+
+def brute_force_score(board_str: str, pool_str: str, dictionary: Dictionary) -> int:
+    """Return the best board score by trying every filling of the rows."""
+    return filling_scores(board_str, pool_str, dictionary)[0]
+
+
+def test_solve__empty_pool__empty_solution() -> None:
+    """Test that an empty pool leaves every row empty."""
+    dictionary = Dictionary(["CAT"], [])
+    board = Board.from_str(PLAIN_BOARD, dictionary)
+
+    solution = BranchAndBoundSolver(board, TilePool()).solve()
+
+    assert solution.score == 0
+    assert solution.placements == (None,) * 5
+
+
+def test_solve__single_word__uses_multiplier() -> None:
+    """Test that a lone word is placed over the highest multiplier."""
+    dictionary = Dictionary([], ["CAT"])
+    board = Board.from_str("[B    ][B    ][B    ][B    ][  3  ]", dictionary)
+
+    solution = BranchAndBoundSolver(board, TilePool.from_str("C(1)A(2)T(3)")).solve()
+
+    assert solution.score == 1 + 2 + 3 * 3
+    assert solution.placements[4] == Placement("CAT", 0, 12)
+
+
+def test_solve__bonus_word__is_scored() -> None:
+    """Test that spelling the bonus word adds its score."""
+    dictionary = Dictionary(["AT"], ["TA"])
+    board = Board.from_str(PLAIN_BOARD, dictionary)
+
+    solution = BranchAndBoundSolver(board, TilePool.from_str("A(1)2T(2)2")).solve()
+
+    assert solution.bonus_word in {"AT", "TA"}
+    assert solution.score == 11
+
+
+@pytest.mark.parametrize(
+    ("common", "valid", "pool_str"),
+    [
+        (["CAT", "ACT"], ["TAC", "AT"], "C(3)A(1)2T(2)"),
+        (["TEA", "EAT", "ATE"], ["ETA", "TA", "AE"], "T(2)2E(1)2A(1)"),
+        (["SEA", "SET"], ["TEAS", "EAST", "ES"], "S(4)2E(1)2A(1)T(2)"),
+        # Counts of many field widths, with words needing a letter repeated.
+        (["TOOT", "TOT"], ["OTTO", "TO", "OO"], "T(1)9O(2)3T(1)2"),
+        # Rows competing for the few tiles worth most, priced by the bound.
+        (["ZAX", "ZA"], ["AX", "XI", "ZAXES"], "Z(10)A(1)2X(8)I(1)E(1)S(1)"),
+    ],
+)
+def test_solve__matches_brute_force(
+    common: list[str],
+    valid: list[str],
+    pool_str: str,
+) -> None:
+    """Test that the solver finds the best possible score."""
+    dictionary = Dictionary(common, valid)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+
+    solution = BranchAndBoundSolver(board, TilePool.from_str(pool_str)).solve()
+
+    assert solution.score == brute_force_score(MULTIPLIER_BOARD, pool_str, dictionary)
+
+
+def test_solve__lone_tiles_in_bonus_slots__bonus_word_scored() -> None:
+    """Test that rows holding only a bonus tile can spell the bonus word."""
+    dictionary = Dictionary(["CATS"], ["SAT"])
+    pool_str = "C(1)A(1)2T(1)2S(1)2"
+    board = Board.from_str(PLAIN_BOARD, dictionary)
+    pool = TilePool.from_str(pool_str)
+
+    solution = BranchAndBoundSolver(board, pool).solve()
+    board.fill(solution, pool)
+
+    assert solution.score == brute_force_score(PLAIN_BOARD, pool_str, dictionary)
+    assert solution.words == ["CATS", "A", "T", "S", ""]
+    assert board.score == solution.score == 10
+
+
+def test_solve__score_matches_filled_board() -> None:
+    """Test that filling the board with the solution gives the solution score."""
+    dictionary = Dictionary(["SEA", "SET", "AT"], ["TEAS", "EAST", "ES"])
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    pool = TilePool.from_str("S(4)2E(1)2A(1)2T(2)2")
+
+    solution = BranchAndBoundSolver(board, pool).solve()
+    board.fill(solution, pool)
+
+    assert board.score == solution.score
+    assert board.bonus_word.word == solution.bonus_word
+
+
+@pytest.mark.parametrize("k", [1, 5, 40])
+def test_solutions__k_best__match_brute_force(k: int) -> None:
+    """Test that the k best solutions yielded are the k best fillings."""
+    dictionary = Dictionary(["SEA", "SET"], ["TEAS", "EAST", "ES"])
+    pool_str = "S(4)2E(1)2A(1)T(2)"
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+
+    solutions = BranchAndBoundSolver(board, TilePool.from_str(pool_str)).solutions(k)
+
+    scores = sorted((solution.score for solution in solutions), reverse=True)
+    assert scores[:k] == filling_scores(MULTIPLIER_BOARD, pool_str, dictionary)[:k]
+
+
+def test_solutions__fillings__are_distinct() -> None:
+    """Test that no filling is yielded twice."""
+    dictionary = Dictionary(["SEA", "SET"], ["TEAS", "EAST", "ES"])
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    pool = TilePool.from_str("S(4)2E(1)2A(1)T(2)")
+
+    solutions = list(BranchAndBoundSolver(board, pool).solutions(1000))
+
+    assert len({solution.placements for solution in solutions}) == len(solutions)
+
+
+def test_solutions__stopped_early__solver_reusable() -> None:
+    """Test that stopping iteration leaves the solver able to search again."""
+    dictionary = Dictionary(["SEA", "SET"], ["TEAS", "EAST", "ES"])
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    pool_str = "S(4)2E(1)2A(1)T(2)"
+    solver = BranchAndBoundSolver(board, TilePool.from_str(pool_str))
+
+    first = list(islice(solver.solutions(10), 2))
+
+    assert len(first) == 2
+    assert solver.solve().score == brute_force_score(
+        MULTIPLIER_BOARD,
+        pool_str,
+        dictionary,
+    )
+
+
+def test_solutions__time_budget_spent__stops() -> None:
+    """Test that the search stops once its time budget has run out."""
+    dictionary = Dictionary(["SEA", "SET"], ["TEAS", "EAST", "ES"])
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str("S(4)2E(1)2A(1)T(2)"))
+
+    assert list(solver.solutions(10, time_budget=0.0)) == []
+
+
+def test_solutions__no_k__raises() -> None:
+    """Test that at least one solution must be kept."""
+    board = Board.from_str(PLAIN_BOARD, Dictionary(["CAT"], []))
+
+    with pytest.raises(ValueError, match="at least 1"):
+        next(BranchAndBoundSolver(board, TilePool()).solutions(0))
+
+
+ANYTIME_COMMON = ["SEA", "SET"]
+ANYTIME_VALID = ["TEAS", "EAST", "ES"]
+ANYTIME_POOL = "S(4)2E(1)2A(1)T(2)"
+
+PROJECT_DIR = Path(__file__).parent.parent.parent
+FULL_SIZE_BOARD = "[ B  2][  B  ][ 3 B ][  B  ][2    ]"
+FULL_SIZE_POOL = (
+    "A(5)3E(5)3S(5)2R(7)2O(7)2I(9)2T(10)2N(20)2L(8)2D(12)U(15)P(35)H(40)C(40)"
+)
+FULL_SIZE_SCORE = 682
+# Seconds, well over the time taken with runtime type checks on.
+FULL_SIZE_BUDGET = 60
+SMALL_BUDGET = 0.05
+# Reads of a FakeClock within SMALL_BUDGET, well short of a full pricing.
+TICKS_IN_BUDGET = 4
+
+
+class FakeClock:
+    """A perf_counter starting at 0 that moves on by tick at every read."""
+
+    def __init__(self, tick: float, deadline: float) -> None:
+        """Initialize the clock, counting the reads after deadline."""
+        self.__tick = tick
+        self.__deadline = deadline
+        self.__now = -tick
+        self.late = 0
+
+    def __call__(self) -> float:
+        """Return the time, a tick later than at the last read."""
+        self.__now += self.__tick
+        self.late += self.__now > self.__deadline
+        return self.__now
+
+
+def test_solve_anytime__no_budget__finds_best() -> None:
+    """Test that an unlimited search proves the best filling."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL))
+
+    solution = solver.solve_anytime()
+
+    best = brute_force_score(MULTIPLIER_BOARD, ANYTIME_POOL, dictionary)
+    assert solution.score == best
+    assert solver.incumbent is solution
+    assert solver.upper_bound == best
+
+
+def test_solve_anytime__full_size_pool__proved_within_budget() -> None:
+    """Test that the best filling of 25 tiles is proved within a time bound."""
+    dictionary = Dictionary.from_directory(PROJECT_DIR)
+    board = Board.from_str(FULL_SIZE_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(FULL_SIZE_POOL))
+
+    solution = solver.solve_anytime(time_budget=FULL_SIZE_BUDGET)
+
+    assert solution.score == FULL_SIZE_SCORE
+    assert solver.upper_bound == FULL_SIZE_SCORE
+
+
+def test_solve_anytime__small_budget__pricing_stops_at_deadline() -> None:
+    """Test that pricing the tiles counts against a small time budget."""
+    dictionary = Dictionary.from_directory(PROJECT_DIR)
+    board = Board.from_str(FULL_SIZE_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(FULL_SIZE_POOL))
+    clock = FakeClock(SMALL_BUDGET / TICKS_IN_BUDGET, SMALL_BUDGET)
+
+    with patch("time.perf_counter", clock):
+        solution = solver.solve_anytime(time_budget=SMALL_BUDGET)
+
+    # One read past the deadline stops the pricing and the next the search.
+    assert clock.late == 2
+    assert 0 < solution.score <= FULL_SIZE_SCORE <= solver.upper_bound
+
+
+def test_solutions__int_budget__match_brute_force() -> None:
+    """Test that a budget of whole seconds is accepted as well as a float."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL))
+
+    best = max(solution.score for solution in solver.solutions(1, time_budget=60))
+
+    assert best == brute_force_score(MULTIPLIER_BOARD, ANYTIME_POOL, dictionary)
+
+
+def test_solve_anytime__no_time__returns_greedy_filling() -> None:
+    """Test that a spent budget returns the greedy filling of common words."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL))
+
+    solution = solver.solve_anytime(time_budget=0.0)
+
+    best = brute_force_score(MULTIPLIER_BOARD, ANYTIME_POOL, dictionary)
+    assert 0 < solution.score <= best <= solver.upper_bound
+    assert all(word in {"", *ANYTIME_COMMON} for word in solution.words)
+    board.fill(solution, TilePool.from_str(ANYTIME_POOL))
+    assert board.score == solution.score
+
+
+def test_solve_anytime__max_gap__within_gap_of_best() -> None:
+    """Test that allowing a gap returns a filling no further than that from best."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL))
+
+    solution = solver.solve_anytime(max_gap=20)
+
+    best = brute_force_score(MULTIPLIER_BOARD, ANYTIME_POOL, dictionary)
+    assert best - 20 <= solution.score <= best <= solver.upper_bound
+    assert solver.upper_bound <= solution.score + 20
+
+
+def test_solve_anytime__stopped__solver_reusable() -> None:
+    """Test that running out of time leaves the solver able to search again."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL))
+
+    solver.solve_anytime(time_budget=0.0)
+
+    assert solver.solve().score == brute_force_score(
+        MULTIPLIER_BOARD,
+        ANYTIME_POOL,
+        dictionary,
+    )
+
+
+def test_stop_on__set__search_ends() -> None:
+    """Test that a set stop event ends searches as if out of time."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL))
+    stop = threading.Event()
+    solver.stop_on(stop)
+    stop.set()
+
+    solution = solver.solve_anytime()
+
+    assert all(word in {"", *ANYTIME_COMMON} for word in solution.words)
+    assert solution.score <= solver.upper_bound
+    with pytest.raises(SearchTimeoutError):
+        solver.solve()
+
+
+def test_solve_anytime__negative_gap__raises() -> None:
+    """Test that the gap allowed must not be negative."""
+    board = Board.from_str(PLAIN_BOARD, Dictionary(["CAT"], []))
+
+    with pytest.raises(ValueError, match="must not be negative"):
+        BranchAndBoundSolver(board, TilePool()).solve_anytime(max_gap=-1)
+
+
+def test_init__cache__tables_reused() -> None:
+    """Test that a second solver takes its candidates from the cache."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    cache = CandidateTableCache()
+    expected = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL), cache)
+
+    with patch.object(dictionary, "matching") as mock_matching:
+        solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL), cache)
+
+    mock_matching.assert_not_called()
+    assert len(cache) == len({row_layout(row) for row in board.rows})
+    assert solver.solve().score == expected.solve().score
+
+
+def test_init__other_pool__tables_built() -> None:
+    """Test that tables are keyed by the pool as well as the row layout."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    cache = CandidateTableCache()
+    BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL), cache)
+
+    solver = BranchAndBoundSolver(board, TilePool.from_str("S(4)E(1)A(1)T(2)"), cache)
+
+    assert len(cache) == 2 * len({row_layout(row) for row in board.rows})
+    assert (
+        solver.solve().score
+        == BranchAndBoundSolver(
+            board,
+            TilePool.from_str("S(4)E(1)A(1)T(2)"),
+        )
+        .solve()
+        .score
+    )
+
+
+def test_solve__stats__counts_work() -> None:
+    """Test that a solver given stats counts its tables, nodes and phases."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    cache = CandidateTableCache()
+    stats = SearchStats()
+    layouts = len({row_layout(row) for row in board.rows})
+
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL), cache, stats)
+    solution = solver.solve()
+
+    assert (
+        solution.score
+        == BranchAndBoundSolver(
+            board,
+            TilePool.from_str(ANYTIME_POOL),
+        )
+        .solve()
+        .score
+    )
+    assert stats.cache_misses == layouts
+    assert stats.cache_hits == len(board.rows) - layouts
+    assert stats.words_scanned == len(dictionary.all_words)
+    assert stats.nodes > 0
+    assert stats.prunes[PruneReason.BOUND] > 0
+    assert set(stats.seconds) == {"index", "search"}
+
+
+def test_solve__again__bounds_from_table_reused() -> None:
+    """Test that a second search prunes with the bounds of the first."""
+    dictionary = Dictionary(ANYTIME_COMMON, ANYTIME_VALID)
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    stats = SearchStats()
+    solver = BranchAndBoundSolver(board, TilePool.from_str(ANYTIME_POOL), stats=stats)
+
+    first = solver.solve().score
+    nodes = stats.nodes
+    second = solver.solve().score
+
+    assert first == second
+    assert stats.nodes - nodes < nodes
+
+
+@pytest.mark.parametrize("max_entries", [1, 4, 1 << 10])
+def test_solutions__small_table__match_brute_force(max_entries: int) -> None:
+    """Test that the k best fillings are found whatever the table keeps."""
+    dictionary = Dictionary(["SEA", "SET"], ["TEAS", "EAST", "ES"])
+    pool_str = "S(4)2E(1)2A(1)T(2)"
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    table = TranspositionTable(max_entries)
+
+    solver = BranchAndBoundSolver(board, TilePool.from_str(pool_str), table=table)
+    scores = sorted((s.score for s in solver.solutions(10)), reverse=True)
+
+    assert scores[:10] == filling_scores(MULTIPLIER_BOARD, pool_str, dictionary)[:10]
+    assert 0 < len(table) <= max_entries
@@ -0,0 +1,126 @@
+"""Tests for the candidate table cache."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.candidate_table import (
+    EMPTY_CANDIDATE,
+    Candidate,
+    CandidateTable,
+    CandidateTableCache,
+    TableKey,
+    pool_signature,
+    row_layout,
+)
+from bongo_solver.tile_pool import TilePool
+from bongo_solver.word.word_row import WordRow
+
+
+def key(version: str) -> TableKey:
+    """Return a table key for a dictionary version."""
+    return version, ((1, 2, 1, 1, 1), 2), (("A", 1, 5),)
+
+
+def table(word: str) -> CandidateTable:
+    """Return a table holding one candidate."""
+    candidates = [Candidate(5, word, 0, ((0, 1),), -1, 0, 5), EMPTY_CANDIDATE]
+    return candidates, candidates
+
+
+def test_row_layout__multipliers_and_bonus() -> None:
+    """Test that a row layout holds its multipliers and bonus slot."""
+    row = WordRow.from_str("[ 2B 3]", Dictionary([], []))
+
+    assert row_layout(row) == ((1, 2, 1, 1, 3), 2)
+
+
+def test_pool_signature__letters_in_order() -> None:
+    """Test that a pool signature lists each letter with its count and score."""
+    pool = TilePool.from_str("S(4)2A(1)E(1)2")
+
+    assert pool_signature(pool) == (("A", 1, 1), ("E", 2, 1), ("S", 2, 4))
+
+
+def test_get__missing__none() -> None:
+    """Test that a key without a table gives None."""
+    assert CandidateTableCache().get(key("v")) is None
+
+
+def test_put__over_limit__evicts_least_recently_used() -> None:
+    """Test that the table used least recently is evicted first."""
+    cache = CandidateTableCache(max_tables=2)
+    cache.put(key("a"), table("A"))
+    cache.put(key("b"), table("B"))
+    cache.get(key("a"))
+
+    cache.put(key("c"), table("C"))
+
+    assert key("a") in cache
+    assert key("b") not in cache
+    assert key("c") in cache
+    assert len(cache) == 2
+
+
+def test_init__no_tables__raises() -> None:
+    """Test that a cache must hold at least one table."""
+    with pytest.raises(ValueError, match="at least 1 table"):
+        CandidateTableCache(max_tables=0)
+
+
+def test_save__load__same_tables(tmp_path: Path) -> None:
+    """Test that saved tables are loaded by a cache with the same path."""
+    path = tmp_path / "tables.json"
+    cache = CandidateTableCache(path=path)
+    cache.put(key("a"), table("A"))
+    cache.put(key("b"), table("B"))
+
+    cache.save()
+    loaded = CandidateTableCache(max_tables=1, path=path)
+
+    assert loaded.path == path
+    assert loaded.get(key("b")) == table("B")
+    assert key("a") not in loaded
+
+
+def test_save__load__candidates_restored(tmp_path: Path) -> None:
+    """Test that loaded candidates are equal, shared and end with the empty one."""
+    path = tmp_path / "tables.json"
+    lone = Candidate(0, "Q", 2, ((3, 1),), 3, 20, 26)
+    every = [Candidate(9, "AB", 1, ((0, 1), (1, 1)), 0, 4, 14), lone, EMPTY_CANDIDATE]
+    cache = CandidateTableCache(path=path)
+    cache.put(key("a"), (every, [lone, EMPTY_CANDIDATE]))
+
+    cache.save()
+    loaded = CandidateTableCache(path=path).get(key("a"))
+
+    assert loaded is not None
+    assert loaded == (every, [lone, EMPTY_CANDIDATE])
+    assert loaded[1][0] is loaded[0][1]
+    assert loaded[0][-1] is EMPTY_CANDIDATE
+
+
+def test_init__not_json__raises(tmp_path: Path) -> None:
+    """Test that a file that is not JSON, such as an old pickle, is rejected."""
+    path = tmp_path / "tables.json"
+    path.write_bytes(b"\x80\x05K\x04.")
+
+    with pytest.raises(ValueError, match="not valid JSON"):
+        CandidateTableCache(path=path)
+
+
+def test_save__no_path__raises() -> None:
+    """Test that a cache without a path cannot be saved."""
+    with pytest.raises(ValueError, match="without a path"):
+        CandidateTableCache().save()
+
+
+def test_init__other_version__raises(tmp_path: Path) -> None:
+    """Test that a file of another format version is rejected."""
+    path = tmp_path / "tables.json"
+    path.write_text(json.dumps({"version": 99, "tables": []}))
+
+    with pytest.raises(ValueError, match="version 99"):
+        CandidateTableCache(path=path)
@@ -0,0 +1,113 @@
+"""Tests for the parallel solver."""
+
+import pickle
+from unittest.mock import Mock
+
+import pytest
+
+from bongo_solver.board import Board
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.branch_and_bound import BranchAndBoundSolver
+from bongo_solver.solver.parallel import (
+    first_best,
+    first_row_slices,
+    solve_parallel,
+)
+from bongo_solver.solver.shared_best import SharedBest
+from bongo_solver.solver.solution import Solution
+from bongo_solver.tile_pool import TilePool
+
+MULTIPLIER_BOARD = "[ 2B  ][  B 3][ B2  ][  B  ][ 2   ]"
+POOL = "S(4)2E(1)2A(1)2T(2)2"
+
+
+@pytest.fixture
+def dictionary() -> Dictionary:
+    """Return a dictionary of a few words."""
+    return Dictionary(["SEA", "SET", "AT"], ["TEAS", "EAST", "ES", "TEA"])
+
+
+@pytest.mark.parametrize(("size", "workers"), [(1, 4), (10, 1), (100, 3), (0, 2)])
+def test_first_row_slices__cover_each_candidate_once(size: int, workers: int) -> None:
+    """Test that the slices split the candidates without gaps or overlap."""
+    slices = first_row_slices(size, workers)
+
+    covered = [ix for part in slices for ix in range(size)[part]]
+
+    assert covered == list(range(size))
+
+
+def test_solve_parallel__matches_serial(dictionary: Dictionary) -> None:
+    """Test that splitting the search finds the same best score."""
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    expected = BranchAndBoundSolver(board, TilePool.from_str(POOL)).solve()
+
+    solution = solve_parallel(board, TilePool.from_str(POOL), workers=2)
+
+    assert solution.score == expected.score
+
+
+def test_solve_parallel__ties__first_slice_filling(dictionary: Dictionary) -> None:
+    """Test that of fillings tied for the best, the first slice's is returned."""
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(POOL))
+    best = solver.solve().score
+    floor = SharedBest()
+    floor.offer(best - 1)
+    solver.share_best(floor)
+    expected = next(
+        solution
+        for part in first_row_slices(solver.first_row_size, 2)
+        if (solution := solver.solve(part)).score == best
+    )
+
+    solutions = [
+        solve_parallel(board, TilePool.from_str(POOL), workers=2) for _ in range(3)
+    ]
+
+    assert {tuple(solution.words) for solution in solutions} == {tuple(expected.words)}
+
+
+def test_first_best__no_tie_possible__nothing_searched_again() -> None:
+    """Test that slices bounded below the best score are not searched again."""
+    solver = Mock(spec=BranchAndBoundSolver)
+    winner = Solution([], "", 7)
+    results = [(0, Solution([], "", 5), 6), (2, Solution([], "", 7), 7), (1, winner, 7)]
+
+    assert first_best(solver, [slice(0, 1)] * 3, results) is winner
+    solver.solve.assert_not_called()
+
+
+def test_first_best__pruned_before__tie_of_earlier_slice() -> None:
+    """Test that an earlier slice pruned by the shared score is searched again."""
+    solver = Mock(spec=BranchAndBoundSolver)
+    tie = Solution([], "", 7)
+    solver.solve.return_value = tie
+    slices = [slice(0, 1), slice(1, 2), slice(2, 3)]
+    results = [(0, Solution([], "", 0), 9), (1, Solution([], "", 3), 5)]
+    results.append((2, Solution([], "", 7), 7))
+
+    assert first_best(solver, slices, results) is tie
+    solver.solve.assert_called_once_with(slices[0])
+
+
+def test_solve__slices__best_of_parts_is_best(dictionary: Dictionary) -> None:
+    """Test that solving disjoint slices with a shared best finds the best."""
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(POOL))
+    expected = solver.solve().score
+    solver.share_best(SharedBest())
+
+    parts = [solver.solve(part) for part in first_row_slices(solver.first_row_size, 2)]
+
+    assert max(part.score for part in parts) == expected
+
+
+def test_solver__pickles(dictionary: Dictionary) -> None:
+    """Test that the solver can be sent to a spawned worker."""
+    board = Board.from_str(MULTIPLIER_BOARD, dictionary)
+    solver = BranchAndBoundSolver(board, TilePool.from_str(POOL))
+
+    restored = pickle.loads(pickle.dumps(solver))  # noqa: S301
+
+    assert restored.solve().score == solver.solve().score
@@ -0,0 +1,47 @@
+"""Tests for the Placement class."""
+
+from __future__ import annotations
+
+import pytest
+
+from bongo_solver.solver.placement import Placement
+
+
+def test_init__has_values() -> None:
+    """Test that a placement holds its word, offset and score."""
+    placement = Placement("CAT", 1, 12)
+
+    assert placement.word == "CAT"
+    assert placement.offset == 1
+    assert placement.score == 12
+
+
+@pytest.mark.parametrize(
+    ("index", "expected"),
+    [(0, None), (1, "C"), (2, "A"), (3, "T"), (4, None)],
+)
+def test_letter_at(index: int, expected: str | None) -> None:
+    """Test that letter_at returns the letter placed in a slot."""
+    placement = Placement("CAT", 1, 12)
+
+    assert placement.letter_at(index) == expected
+
+
+def test_eq__same__returns_true() -> None:
+    """Test that identical placements are equal."""
+    assert Placement("CAT", 1, 12) == Placement("CAT", 1, 12)
+
+
+def test_eq__different_offset__returns_false() -> None:
+    """Test that placements at different offsets are not equal."""
+    assert Placement("CAT", 1, 12) != Placement("CAT", 2, 12)
+
+
+def test_eq__different_object__returns_false() -> None:
+    """Test that a placement is not equal to other objects."""
+    assert Placement("CAT", 1, 12) != "CAT"
+
+
+def test_repr() -> None:
+    """Test the string representation of a placement."""
+    assert repr(Placement("CAT", 1, 12)) == "Placement('CAT', 1, 12)"
@@ -0,0 +1,79 @@
+"""Tests for the result cache."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from bongo_solver.solver.placement import Placement
+from bongo_solver.solver.result_cache import (
+    ResultCache,
+    solution_from_json,
+    solution_to_json,
+)
+from bongo_solver.solver.solution import Solution
+
+
+def solution(word: str) -> Solution:
+    """Return a solution placing a word in the last row."""
+    return Solution([None, None, None, None, Placement(word, 1, 12)], "CA", 12)
+
+
+def test_solution_json__round_trip() -> None:
+    """Test that a solution read back from JSON is the same."""
+    loaded = solution_from_json(solution_to_json(solution("CAT")))
+
+    assert loaded.placements == solution("CAT").placements
+    assert loaded.bonus_word == "CA"
+    assert loaded.score == 12
+
+
+def test_get__missing__none() -> None:
+    """Test that a fingerprint without a result gives None."""
+    assert ResultCache().get("a") is None
+
+
+def test_put__over_limit__evicts_least_recently_used() -> None:
+    """Test that the result used least recently is dropped first."""
+    cache = ResultCache(max_results=2)
+    cache.put("a", solution("CAT"))
+    cache.put("b", solution("ACT"))
+    cache.get("a")
+
+    cache.put("c", solution("AT"))
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+
+def test_init__no_results__raises() -> None:
+    """Test that a cache must hold at least one result."""
+    with pytest.raises(ValueError, match="at least 1 result"):
+        ResultCache(max_results=0)
+
+
+def test_path__results_kept_across_caches(tmp_path: Path) -> None:
+    """Test that results put in a file are found by a later cache."""
+    path = tmp_path / "results.sqlite"
+    with ResultCache(path=path) as cache:
+        cache.put("a", solution("CAT"))
+
+    with ResultCache(path=path) as loaded:
+        held = loaded.get("a")
+
+    assert loaded.path == path
+    assert held is not None
+    assert held.words == solution("CAT").words
+
+
+def test_init__other_version__raises(tmp_path: Path) -> None:
+    """Test that a database of another format version is rejected."""
+    path = tmp_path / "results.sqlite"
+    with sqlite3.connect(path) as connection:
+        connection.execute("PRAGMA user_version = 99")
+    connection.close()
+
+    with pytest.raises(ValueError, match="version 99"):
+        ResultCache(path=path)
@@ -0,0 +1,80 @@
+"""Tests for the SearchStats class."""
+
+from __future__ import annotations
+
+import json
+import logging
+
+import pytest
+
+from bongo_solver.solver.search_stats import PruneReason, SearchStats
+
+
+def test_init__nothing_counted() -> None:
+    """Test that new stats hold no work."""
+    stats = SearchStats()
+
+    assert stats.nodes == 0
+    assert stats.prunes == dict.fromkeys(PruneReason, 0)
+    assert stats.bonus_lost == 0
+    assert stats.cache_hits == stats.cache_misses == stats.words_scanned == 0
+    assert stats.seconds == {}
+
+
+def test_add_search__adds_to_counts() -> None:
+    """Test that the counts of several searches add up."""
+    stats = SearchStats()
+
+    stats.add_search(10, {PruneReason.BOUND: 3, PruneReason.TILES: 1})
+    stats.add_search(5, {PruneReason.BOUND: 2}, bonus_lost=4)
+    stats.add_search(1, {}, bonus_lost=1)
+
+    assert stats.nodes == 16
+    assert stats.prunes == {
+        PruneReason.BOUND: 5,
+        PruneReason.TILES: 1,
+        PruneReason.TRANSPOSITION: 0,
+    }
+    assert stats.bonus_lost == 5
+    assert stats.to_dict()["bonus_lost"] == 5
+
+
+def test_add_cache_lookup__counts_hits_and_misses() -> None:
+    """Test that cache lookups are counted by whether they hit."""
+    stats = SearchStats()
+
+    stats.add_cache_lookup(hit=True)
+    stats.add_cache_lookup(hit=False)
+    stats.add_cache_lookup(hit=True)
+
+    assert (stats.cache_hits, stats.cache_misses) == (2, 1)
+
+
+def test_phase__adds_time_even_when_raising() -> None:
+    """Test that the time of a phase is kept when its block raises."""
+    stats = SearchStats()
+
+    with stats.phase("search"):
+        pass
+    with pytest.raises(ZeroDivisionError), stats.phase("search"):
+        _ = 1 / 0
+
+    assert list(stats.seconds) == ["search"]
+    assert stats.seconds["search"] >= 0
+
+
+def test_log__json_message_and_extra(caplog: pytest.LogCaptureFixture) -> None:
+    """Test that the stats are logged as JSON and kept in the record."""
+    stats = SearchStats()
+    stats.add_search(7, {PruneReason.TILES: 2})
+    stats.add_words_scanned(3)
+
+    with caplog.at_level(logging.INFO):
+        stats.log()
+
+    record = caplog.records[0]
+    assert getattr(record, "search_stats", None) == stats.to_dict()
+    message = json.loads(record.getMessage().removeprefix("search stats "))
+    assert message["nodes"] == 7
+    assert message["prunes"]["tiles"] == 2
+    assert message["words_scanned"] == 3
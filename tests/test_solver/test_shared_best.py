@@ -0,0 +1,18 @@
+"""Tests for the SharedBest class."""
+
+from bongo_solver.solver.shared_best import SharedBest
+
+
+def test_value__starts_at_zero() -> None:
+    """Test that nothing has been found at first."""
+    assert SharedBest().value == 0
+
+
+def test_offer__keeps_highest() -> None:
+    """Test that a lower offer never replaces a higher one."""
+    shared_best = SharedBest()
+
+    shared_best.offer(10)
+    shared_best.offer(5)
+
+    assert shared_best.value == 10
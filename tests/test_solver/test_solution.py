@@ -0,0 +1,29 @@
+"""Tests for the Solution class."""
+
+from bongo_solver.solver.placement import Placement
+from bongo_solver.solver.solution import Solution
+
+
+def test_init__has_values() -> None:
+    """Test that a solution holds its placements, bonus word and score."""
+    placements = [Placement("CAT", 0, 4), None]
+
+    solution = Solution(placements, "C", 4)
+
+    assert solution.placements == tuple(placements)
+    assert solution.bonus_word == "C"
+    assert solution.score == 4
+
+
+def test_words__empty_rows__blank() -> None:
+    """Test that rows without a placement have an empty word."""
+    solution = Solution([Placement("CAT", 0, 4), None], "", 4)
+
+    assert solution.words == ["CAT", ""]
+
+
+def test_repr() -> None:
+    """Test the string representation of a solution."""
+    solution = Solution([Placement("CAT", 0, 4), None], "", 4)
+
+    assert repr(solution) == "Solution(['CAT', ''], '', 4)"
@@ -0,0 +1,66 @@
+"""Tests for the spellable candidate masks."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from bongo_solver.solver.spellable import (
+    lowest_bit,
+    ranked_masks,
+    set_bits,
+    spellable,
+    spellable_masks,
+)
+
+# The count of each of two letters each of three candidates needs.
+NEEDS = np.array([[1, 0], [2, 1], [0, 1]])
+
+
+def test_spellable_masks__each_count__candidates_needing_at_most_it() -> None:
+    """Test that each mask holds the candidates needing at most its count."""
+    masks = spellable_masks(NEEDS, [2, 1])
+
+    assert masks == [[0b100, 0b101, 0b111], [0b001, 0b111]]
+
+
+@pytest.mark.parametrize(
+    ("counts", "expected"),
+    [((2, 1), 0b111), ((1, 1), 0b101), ((2, 0), 0b001), ((0, 0), 0)],
+)
+def test_spellable__counts__candidates_spelled(
+    counts: tuple[int, int],
+    expected: int,
+) -> None:
+    """Test that the candidates the counts of each letter spell are set."""
+    masks = spellable_masks(NEEDS, [2, 1])
+
+    assert spellable(masks, counts, len(NEEDS)) == expected
+
+
+def test_spellable__no_letters__every_candidate() -> None:
+    """Test that candidates needing no tiles are spelled from an empty pool."""
+    assert spellable([], [], 3) == 0b111
+
+
+def test_ranked_masks__order__doubling_prefixes() -> None:
+    """Test that the masks hold the first 1, 2, 4 and then all candidates."""
+    masks = ranked_masks(np.array([3, 0, 4, 1, 2]))
+
+    assert masks == [0b01000, 0b01001, 0b11011, 0b11111]
+
+
+def test_ranked_masks__empty__no_masks() -> None:
+    """Test that an empty order has no masks."""
+    assert ranked_masks(np.array([], dtype=np.intp)) == []
+
+
+@pytest.mark.parametrize(("mask", "expected"), [(0, -1), (1, 0), (0b10100, 2)])
+def test_lowest_bit(mask: int, expected: int) -> None:
+    """Test that the index of the lowest set bit is returned."""
+    assert lowest_bit(mask) == expected
+
+
+def test_set_bits__lowest_first() -> None:
+    """Test that the indexes of the set bits are yielded lowest first."""
+    assert list(set_bits(0b1001010)) == [1, 3, 6]
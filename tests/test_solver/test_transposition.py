@@ -0,0 +1,69 @@
+"""Tests for the TranspositionTable class."""
+
+from __future__ import annotations
+
+import pytest
+
+from bongo_solver.solver.transposition import (
+    UNBOUNDED,
+    TranspositionTable,
+    zobrist_keys,
+)
+
+
+def test_zobrist_keys__repeatable_and_distinct() -> None:
+    """Test that the keys are the same every time and differ from each other."""
+    keys = zobrist_keys([3, 2])
+
+    assert keys == zobrist_keys([3, 2])
+    assert [len(row) for row in keys] == [3, 2]
+    assert len({key for row in keys for key in row}) == 5
+
+
+@pytest.mark.parametrize(("max_entries", "expected"), [(1, 1), (5, 4), (8, 8)])
+def test_init__slots_within_max_entries(max_entries: int, expected: int) -> None:
+    """Test that the table holds the largest power of two within the limit."""
+    assert TranspositionTable(max_entries).max_entries == expected
+
+
+def test_init__no_entries__raises() -> None:
+    """Test that a table must hold at least one state."""
+    with pytest.raises(ValueError, match="at least 1 state"):
+        TranspositionTable(0)
+
+
+def test_bound__not_held__unbounded() -> None:
+    """Test that a state never stored prunes nothing."""
+    table = TranspositionTable(4)
+
+    assert table.bound(12345) == UNBOUNDED
+    assert len(table) == 0
+
+
+def test_store__same_state__tighter_bound_kept() -> None:
+    """Test that storing a state again keeps the lower of its bounds."""
+    table = TranspositionTable(4)
+
+    table.store(7, 2, 30)
+    table.store(7, 2, 40)
+    table.store(7, 2, 25)
+
+    assert table.bound(7) == 25
+    assert len(table) == 1
+
+
+def test_store__slot_taken__shallower_state_kept() -> None:
+    """Test that a state nearer the top of the search keeps its slot."""
+    table = TranspositionTable(4)
+
+    table.store(1, 1, 10)
+    table.store(5, 3, 20)
+
+    assert table.bound(1) == 10
+    assert table.bound(5) == UNBOUNDED
+
+    table.store(9, 0, 30)
+
+    assert table.bound(1) == UNBOUNDED
+    assert table.bound(9) == 30
+    assert len(table) == 1
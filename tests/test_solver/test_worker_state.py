@@ -0,0 +1,53 @@
+"""Tests for the state kept by worker processes."""
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from bongo_solver.solver.worker_state import (
+    call_at_worker_exit,
+    keep_worker_state,
+    worker_state,
+)
+
+
+class Marker:
+    """Writes a file when closed."""
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the marker."""
+        self.__path = path
+
+    def close(self) -> None:
+        """Write the marker file."""
+        self.__path.write_text("closed")
+
+
+def init_marker(path: Path) -> None:
+    """Keep a marker closed when the worker exits."""
+    marker = Marker(path)
+    keep_worker_state(marker=marker)
+    call_at_worker_exit(marker.close)
+
+
+def has_marker() -> bool:
+    """Return whether the worker keeps a marker."""
+    return isinstance(worker_state("marker"), Marker)
+
+
+def test_worker_state__kept__returned_by_name() -> None:
+    """Test that a kept object is returned by its name."""
+    value = object()
+    keep_worker_state(value=value)
+
+    assert worker_state("value") is value
+
+
+def test_call_at_worker_exit__called_when_pool_shuts_down(tmp_path: Path) -> None:
+    """Test that a function given by a worker is called as the worker exits."""
+    path = tmp_path / "closed.txt"
+
+    with ProcessPoolExecutor(1, initializer=init_marker, initargs=(path,)) as pool:
+        assert pool.submit(has_marker).result()
+        assert not path.exists()
+
+    assert path.read_text() == "closed"
@@ -41,6 +41,23 @@ def test_from_string__multiple__is_right() -> None:
     assert all(tile.score == 40 for tile in result["C"])
 
 
+def test_from_string__repeated_letter__adds_counts() -> None:
+    """Tests that runs of the same letter and score add up."""
+    result = TilePool.from_str("a(20)2 A(20)3 B(30)0")
+
+    assert len(result) == 5
+    assert result.count_of("A") == 5
+    assert "B" not in result
+
+
+def test_from_string__zero_quantity__not_validated() -> None:
+    """Tests that a run of no tiles is not checked against the other scores."""
+    result = TilePool.from_str("A(20)2A(30)0")
+
+    assert result.count_of("A") == 2
+    assert result.score_of("A") == 20
+
+
 def test_init__no_tiles__is_empty() -> None:
     """Tests that an empty tile pool is created correctly."""
     result = TilePool()
@@ -185,3 +202,66 @@ def test_add__invalid_score__raises() -> None:
         match="New tile score does not match existing tiles.",
     ):
         pool.add(LetterTile("A", 30))
+
+
+def test_take__empties_then_add__new_score() -> None:
+    """Tests that a letter taken out entirely can return with another score."""
+    pool = TilePool.from_str("A(20)")
+    pool.take("A")
+    pool.add(LetterTile("A", 30))
+    assert pool.score_of("A") == 30
+    assert pool.count_by_letter() == {Letter("A"): 1}
+
+
+def test_len__tracks_take_and_add() -> None:
+    """Tests that the length follows tiles taken and added."""
+    pool = TilePool.from_str("A(20)2B(30)")
+    tile = pool.take("A")
+    assert len(pool) == 2
+    assert tile is not None
+    pool.add(tile)
+    assert len(pool) == 3
+
+
+def test_take__empty_letter__not_in_counts() -> None:
+    """Tests that letters with no tiles left are not reported."""
+    pool = TilePool.from_str("A(20)B(30)")
+    pool.take("A")
+    assert pool.count_by_letter() == {Letter("B"): 1}
+    assert pool.score_by_letter() == {Letter("B"): 30}
+    assert pool.score_of("A") is None
+    assert "A" not in pool
+
+
+def test_snapshot__restore__undoes_changes() -> None:
+    """Tests that restoring a snapshot undoes takes and adds."""
+    pool = TilePool.from_str("A(20)2B(30)")
+    snapshot = pool.snapshot()
+
+    pool.take("A")
+    pool.take("B")
+    pool.add(LetterTile("C", 40))
+    pool.restore(snapshot)
+
+    assert pool.count_by_letter() == {Letter("A"): 2, Letter("B"): 1}
+    assert pool.score_of("C") is None
+    assert len(pool) == 3
+
+
+def test_copy__is_independent() -> None:
+    """Tests that a copy holds the same tiles and changes separately."""
+    pool = TilePool.from_str("A(20)2B(30)")
+    copy = pool.copy()
+
+    copy.take("A")
+
+    assert pool.count_of("A") == 2
+    assert copy.count_of("A") == 1
+    assert copy.score_by_letter() == pool.score_by_letter()
+
+
+def test_take__not_a_to_z__raises() -> None:
+    """Tests that letters outside A to Z are rejected."""
+    pool = TilePool.from_str("A(20)")
+    with pytest.raises(ValueError, match="only holds the letters A to Z"):
+        pool.take("É")
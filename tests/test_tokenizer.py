@@ -0,0 +1,55 @@
+"""Tests for the board and tile pool tokenizer."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from bongo_solver.dictionary import Dictionary
+from bongo_solver.solver.candidate_table import row_layout
+from bongo_solver.tokenizer import tokenize_board, tokenize_pool
+from bongo_solver.word.word_row import WordRow
+
+ROWS = ["[ B  2]", "[  b  ]", "[ 3 B ]", "[  B  ]", "[2   9]"]
+
+
+@pytest.mark.parametrize("separator", ["", "\n", " row "])
+def test_tokenize_board__matches_rows(separator: str) -> None:
+    """Test that the layouts are those of the rows parsed one by one."""
+    rows = [WordRow.from_str(row, MagicMock(Dictionary)) for row in ROWS]
+
+    layouts = tokenize_board(separator.join(ROWS))
+
+    assert layouts == [row_layout(row) for row in rows]
+
+
+def test_tokenize_board__other_decimal_digit__is_multiplier() -> None:
+    """Test that decimal digits of other scripts are read as multipliers."""
+    layouts = tokenize_board("".join(["[٣    ]", *ROWS[1:]]))
+
+    assert layouts[0] == ((3, 1, 1, 1, 1), -1)
+
+
+@pytest.mark.parametrize("board_str", ["", "".join(ROWS[:4]), "[  2*  ]" * 5])
+def test_tokenize_board__not_five_rows__raises(board_str: str) -> None:
+    """Test that a board without five rows of five slots is rejected."""
+    with pytest.raises(ValueError, match="Insufficient board configuration"):
+        tokenize_board(board_str)
+
+
+def test_tokenize_board__bad_symbol__raises() -> None:
+    """Test that a slot symbol other than a digit, B or space is rejected."""
+    with pytest.raises(ValueError, match="Imporoperly formated WordRow string."):
+        tokenize_board("".join([*ROWS[:4], "[ BB x]"]))
+
+
+def test_tokenize_board__two_bonus_slots__raises() -> None:
+    """Test that a row with two bonus slots is rejected."""
+    with pytest.raises(ValueError, match="only contain one bonus slot"):
+        tokenize_board("".join(["[B  B ]", *ROWS[1:4], "[ x   ]"]))
+
+
+def test_tokenize_pool__runs() -> None:
+    """Test that each run gives its letter, score and count, one if none."""
+    runs = tokenize_pool("A(5)3 e(10) S(1)0")
+
+    assert runs == [("A", 5, 3), ("e", 10, 1), ("S", 1, 0)]
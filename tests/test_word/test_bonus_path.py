@@ -0,0 +1,79 @@
+"""Tests for the BonusPath class."""
+
+import pytest
+
+from bongo_solver.dictionary import Dictionary, WordKind
+from bongo_solver.word.bonus_path import BonusPath
+
+SLOTS = [(0, 2), (1, 3), (2, 3), (3, 2)]
+
+
+@pytest.fixture
+def dictionary() -> Dictionary:
+    """Return a dictionary of words of three to five letters."""
+    return Dictionary(["CAT", "CATS"], ["ACT", "CASTS"])
+
+
+def test_init__fillings_of_short_words(dictionary: Dictionary) -> None:
+    """Test that each word of up to four letters fills the slots at each offset."""
+    path = BonusPath(SLOTS, dictionary)
+
+    assert path.slots == tuple(SLOTS)
+    assert sorted(path.fillings) == [" ACT", " CAT", "ACT ", "CAT ", "CATS"]
+    assert path.kinds[path.fillings.index("CATS")] is WordKind.COMMON
+
+
+def test_init__wrong_slot_count__raises(dictionary: Dictionary) -> None:
+    """Test that a bonus path must have four slots."""
+    with pytest.raises(ValueError, match="must contain 4 slots"):
+        BonusPath(SLOTS[:3], dictionary)
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("????", True),
+        ("C???", True),
+        (" ???", True),
+        (" C?T", True),
+        ("CAT?", True),
+        ("CA ?", False),
+        ("CA S", False),
+        ("?  ?", False),
+        ("X???", False),
+        ("    ", False),
+    ],
+)
+def test_can_spell(dictionary: Dictionary, pattern: str, *, expected: bool) -> None:
+    """Test that can_spell tells whether a word can still fill the slots."""
+    assert BonusPath(SLOTS, dictionary).can_spell(pattern) is expected
+
+
+def test_kind_of__looks_up_fillings(dictionary: Dictionary) -> None:
+    """Test that kind_of gives the kind of the word in the slots, if any."""
+    path = BonusPath(SLOTS, dictionary)
+
+    assert path.kind_of(" CAT") is WordKind.COMMON
+    assert path.kind_of("ACT ") is WordKind.VALID
+    assert path.kind_of("A CT") is None
+    assert path.kind_of("CAST") is None
+
+
+def test_fitting__bitset_of_fillings(dictionary: Dictionary) -> None:
+    """Test that fitting holds the fillings with a letter at a position."""
+    path = BonusPath(SLOTS, dictionary)
+
+    fitting = path.fitting(3, "S")
+
+    assert [
+        path.fillings[bit] for bit in range(len(path.fillings)) if fitting >> bit & 1
+    ] == ["CATS"]
+    assert path.fitting(0, "Z") == 0
+
+
+def test_init__same_dictionary__index_shared(dictionary: Dictionary) -> None:
+    """Test that paths over the same dictionary share their fillings."""
+    first = BonusPath(SLOTS, dictionary)
+    second = BonusPath([(0, 0), (1, 1), (2, 2), (3, 3)], dictionary)
+
+    assert first.fillings is second.fillings
@@ -4,7 +4,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from bongo_solver.dictionary import Dictionary
+from bongo_solver.dictionary import Dictionary, WordKind
 from bongo_solver.letter_slot.letter_slot import LetterSlot
 from bongo_solver.letter_tile import LetterTile
 from bongo_solver.word.word import Word
@@ -143,8 +143,7 @@ def test_score__not_valid__zero(score_tile: MagicMock) -> None:
     """Test that the score property returns 0 when the word is not valid."""
     slots = [LetterSlot() for _ in range(5)]
     dictionary = MagicMock(Dictionary)
-    dictionary.is_common.return_value = False
-    dictionary.__contains__.return_value = False
+    dictionary.kind_of.return_value = None
     word_row = ConcreteWord(slots, dictionary)
 
     word_row[0] = score_tile
@@ -158,8 +157,7 @@ def test_score__valid__score(score_tile: MagicMock) -> None:
     """Test that the score property returns the score of the word when it is valid."""
     slots = [LetterSlot() for _ in range(5)]
     dictionary = MagicMock(Dictionary)
-    dictionary.is_common.return_value = False
-    dictionary.__contains__.return_value = True
+    dictionary.kind_of.return_value = WordKind.VALID
     word_row = ConcreteWord(slots, dictionary)
 
     word_row[0] = score_tile
@@ -173,8 +171,7 @@ def test_score__common__score(score_tile: MagicMock) -> None:
     """Test that the score returns 1.3 times the score of the word when it is common."""
     slots = [LetterSlot() for _ in range(5)]
     dictionary = MagicMock(Dictionary)
-    dictionary.is_common.return_value = True
-    dictionary.__contains__.return_value = False
+    dictionary.kind_of.return_value = WordKind.COMMON
     word_row = ConcreteWord(slots, dictionary)
 
     word_row[0] = score_tile
@@ -182,3 +179,85 @@ def test_score__common__score(score_tile: MagicMock) -> None:
     score = word_row.score
 
     assert score == 13
+
+
+@pytest.mark.parametrize(
+    ("indecies", "has_prefix", "expected"),
+    [
+        ([0, 1], True, True),
+        ([0, 1], False, False),
+        ([0, 2], True, False),
+    ],
+)
+def test_is_prefix(indecies: list[int], *, has_prefix: bool, expected: bool) -> None:
+    """Test that is_prefix checks contiguous letters against the dictionary."""
+    slots = [LetterSlot() for _ in range(5)]
+    dictionary = MagicMock(Dictionary)
+    dictionary.has_prefix.return_value = has_prefix
+    word_row = ConcreteWord(slots, dictionary)
+
+    for index in indecies:
+        word_row[index] = LetterTile("A", 1)
+
+    assert word_row.is_prefix is expected
+
+
+def test_init__with_tiles__running_totals() -> None:
+    """Test that the running totals start from the tiles already placed."""
+    slots = [LetterSlot(2), LetterSlot(), LetterSlot()]
+    slots[0].letter_tile = LetterTile("A", 3)
+    slots[2].letter_tile = LetterTile("B", 4)
+
+    word_row = ConcreteWord(slots, MagicMock(Dictionary))
+
+    assert word_row.raw_score == 10
+    assert word_row.filled == 2
+
+
+def test_set_item__updates_running_totals() -> None:
+    """Test that placing and removing tiles keeps the running totals."""
+    slots = [LetterSlot(), LetterSlot(3), LetterSlot()]
+    word_row = ConcreteWord(slots, MagicMock(Dictionary))
+
+    word_row[1] = LetterTile("A", 2)
+    word_row[0] = LetterTile("B", 5)
+    word_row[1] = None
+
+    assert word_row.raw_score == 5
+    assert word_row.filled == 1
+
+
+def test_set_item__shared_slot__updates_both_words() -> None:
+    """Test that a slot shared by two words updates both running totals."""
+    shared = LetterSlot(2)
+    row = ConcreteWord([LetterSlot(), shared], MagicMock(Dictionary))
+    column = ConcreteWord([shared, LetterSlot()], MagicMock(Dictionary))
+
+    row[1] = LetterTile("A", 3)
+
+    assert row.raw_score == column.raw_score == 6
+
+
+def test_score__read_twice__looks_up_once() -> None:
+    """Test that the dictionary is checked again only after a change."""
+    slots = [LetterSlot() for _ in range(3)]
+    dictionary = MagicMock(Dictionary)
+    dictionary.kind_of.return_value = WordKind.VALID
+    word_row = ConcreteWord(slots, dictionary)
+    word_row[0] = LetterTile("A", 1)
+
+    scores = [word_row.score, word_row.score]
+    word_row[1] = LetterTile("T", 2)
+    scores.append(word_row.score)
+
+    assert scores == [1, 1, 3]
+    assert dictionary.kind_of.call_count == 2
+
+
+def test_score__no_tiles__not_looked_up() -> None:
+    """Test that an empty word scores 0 without a dictionary check."""
+    dictionary = MagicMock(Dictionary)
+    word_row = ConcreteWord([LetterSlot() for _ in range(3)], dictionary)
+
+    assert word_row.score == 0
+    dictionary.kind_of.assert_not_called()
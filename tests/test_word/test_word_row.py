@@ -7,6 +7,8 @@ import pytest
 from bongo_solver.dictionary import Dictionary
 from bongo_solver.letter_slot.bonus_letter_slot import BonusLetterSlot
 from bongo_solver.letter_slot.letter_slot import LetterSlot
+from bongo_solver.letter_tile import LetterTile
+from bongo_solver.tile_pool import TilePool
 from bongo_solver.word.word_row import WordRow
 
 
@@ -130,6 +132,15 @@ def test_from_str__with_mult__has_mult(mult: int) -> None:
     # assert all(slot.multiplier == mult for slot in word_row.slots)  # noqa: ERA001
 
 
+def test_from_layout__has_multipliers_and_bonus() -> None:
+    """Test that a WordRow is built from slot multipliers and a bonus index."""
+    word_row = WordRow.from_layout((1, 2, 1, 3, 1), 2, MagicMock(Dictionary))
+
+    assert [slot.multiplier for slot in word_row.slots] == [1, 2, 1, 3, 1]
+    assert word_row.get_bonus_ix() == 2
+    assert isinstance(word_row.slots[2], BonusLetterSlot)
+
+
 def test_from_str__invalid_string() -> None:
     """Test that from_str raises an error when given an invalid string."""
     row_string = "[ 1 2 3 4 5 ]"
@@ -137,3 +148,52 @@ def test_from_str__invalid_string() -> None:
 
     with pytest.raises(ValueError, match="Imporoperly formated WordRow string."):
         WordRow.from_str(row_string, dictionary)
+
+
+def test_score_candidates__matches_score() -> None:
+    """Test that batch scores agree with placing each word in the row."""
+    dictionary = Dictionary(["CAT", "TACT"], ["ACT", "CATS"])
+    row = WordRow.from_str("[2 3  ]", dictionary)
+    pool = TilePool.from_str("C(4)A(1)T(3)2S(2)")
+    words = ["CAT", "ACT", "TACT", "CATS", "TAC"]
+
+    expected = []
+    for word in words:
+        for ix, letter in enumerate(word):
+            row[ix] = LetterTile(letter, pool.score_of(letter))
+        expected.append(row.score)
+        for ix in range(len(word)):
+            row[ix] = None
+
+    assert row.score_candidates(words, pool).tolist() == expected
+    # CAT scores 4*2 + 1 + 3*3 = 18, times 1.3 for a common word.
+    assert expected[0] == 23
+    assert expected[-1] == 0
+
+
+def test_score_candidates__offset() -> None:
+    """Test that words are scored against the slots from the offset."""
+    dictionary = Dictionary([], ["CAT"])
+    row = WordRow.from_str("[2 3  ]", dictionary)
+    pool = TilePool.from_str("C(4)A(1)T(3)")
+
+    # 4 + 1*3 + 3 = 10
+    assert row.score_candidates(["CAT"], pool, offset=1).tolist() == [10]
+
+
+def test_score_candidates__missing_letter__scores_nothing() -> None:
+    """Test that letters absent from the pool add nothing to the score."""
+    dictionary = Dictionary([], ["CAT"])
+    row = WordRow.from_str("[     ]", dictionary)
+    pool = TilePool.from_str("C(4)T(3)")
+
+    assert row.score_candidates(["CAT"], pool).tolist() == [7]
+
+
+@pytest.mark.parametrize("offset", [-1, 3])
+def test_score_candidates__does_not_fit__raises(offset: int) -> None:
+    """Test that words overflowing the row are rejected."""
+    row = WordRow.from_str("[     ]", Dictionary([], ["CAT"]))
+
+    with pytest.raises(ValueError, match="offset"):
+        row.score_candidates(["CAT"], TilePool(), offset=offset)
@@ -0,0 +1,89 @@
+"""Tests for the WordIndex class."""
+
+from __future__ import annotations
+
+import pytest
+
+from bongo_solver.word_index import WordIndex
+
+WORDS = ["CAT", "ACT", "TAC", "CAST", "CATS", "SCAT", "TACT", "EAST", "SEAT", "A"]
+
+
+@pytest.fixture
+def index() -> WordIndex:
+    """Return an index over a small set of words."""
+    return WordIndex(WORDS)
+
+
+def test_lengths(index: WordIndex) -> None:
+    """Test that the index reports the lengths of its words."""
+    assert index.lengths == [1, 3, 4]
+
+
+def test_words_of_length(index: WordIndex) -> None:
+    """Test that words are bucketed by length in sorted order."""
+    assert index.words_of_length(3) == ["ACT", "CAT", "TAC"]
+    assert index.words_of_length(5) == []
+
+
+@pytest.mark.parametrize(
+    ("pattern", "expected"),
+    [
+        ("???", ["ACT", "CAT", "TAC"]),
+        ("?A?", ["CAT", "TAC"]),
+        ("c??", ["CAT"]),
+        ("?A?T", ["CAST", "EAST", "TACT"]),
+        ("??A?", ["SCAT", "SEAT"]),
+        ("X??", []),
+        ("?????", []),
+    ],
+)
+def test_matching__pattern(index: WordIndex, pattern: str, expected: list[str]) -> None:
+    """Test that only words fitting the pattern are returned."""
+    assert index.matching(pattern) == expected
+
+
+@pytest.mark.parametrize(
+    ("letters", "expected"),
+    [
+        ({"A": 1, "C": 1, "S": 1, "T": 1}, ["CAST", "CATS", "SCAT"]),
+        ({"A": 1, "C": 1, "T": 2}, ["TACT"]),
+        ({"A": 1, "C": 1, "T": 1}, []),
+        ({}, []),
+    ],
+)
+def test_matching__letters(
+    index: WordIndex,
+    letters: dict[str, int],
+    expected: list[str],
+) -> None:
+    """Test that only words spelled from the letters are returned."""
+    assert index.matching("????", letters) == expected
+
+
+def test_matching__pattern_and_letters(index: WordIndex) -> None:
+    """Test that pattern and letter constraints are combined."""
+    assert index.matching("?A?T", {"A": 1, "C": 1, "S": 1, "T": 1}) == ["CAST"]
+
+
+def test_matching__matches_scan() -> None:
+    """Test that the index agrees with scanning every word."""
+    words = ["ABBA", "BABA", "ABAB", "BBAA", "AAAB", "BBBA"]
+    letters = {"A": 2, "B": 2}
+    index = WordIndex(words)
+
+    expected = sorted(
+        w for w in words if all(w.count(c) <= letters.get(c, 0) for c in w)
+    )
+
+    assert index.matching("????", letters) == expected
+
+
+def test_init__bitsets__round_trips(index: WordIndex) -> None:
+    """Test that an index loaded from its bitsets answers the same queries."""
+    loaded = WordIndex(WORDS, index.to_bytes())
+
+    assert loaded.lengths == index.lengths
+    assert loaded.matching("?A?T") == index.matching("?A?T")
+    assert loaded.matching("????", {"A": 1, "C": 1, "T": 2}) == ["TACT"]
+    assert loaded.to_bytes() == index.to_bytes()
@@ -0,0 +1,87 @@
+"""Tests for the WordTrie class."""
+
+import pytest
+
+from bongo_solver.word_trie import NO_NODE, ROOT, WordTrie
+
+WORDS = ["CAT", "CATS", "CAR", "CART", "DOG", "A"]
+
+
+@pytest.fixture
+def trie() -> WordTrie:
+    """Return a trie over a small set of words."""
+    return WordTrie(WORDS)
+
+
+def test_len__counts_nodes(trie: WordTrie) -> None:
+    """Test that shared prefixes share nodes."""
+    # root, A, C, CA, CAR, CART, CAT, CATS, D, DO, DOG
+    assert len(trie) == 11
+
+
+@pytest.mark.parametrize("prefix", ["", "C", "CA", "CAT", "CATS", "ca", "DO"])
+def test_has_prefix__prefix__true(trie: WordTrie, prefix: str) -> None:
+    """Test that prefixes of words are found."""
+    assert trie.has_prefix(prefix)
+
+
+@pytest.mark.parametrize("prefix", ["X", "CB", "CATSS", "DOGS"])
+def test_has_prefix__not_prefix__false(trie: WordTrie, prefix: str) -> None:
+    """Test that strings starting no word are not found."""
+    assert not trie.has_prefix(prefix)
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        ("", ["A", "C", "D"]),
+        ("CA", ["R", "T"]),
+        ("CAT", ["S"]),
+        ("CATS", []),
+        ("Q", []),
+    ],
+)
+def test_children(trie: WordTrie, prefix: str, expected: list[str]) -> None:
+    """Test that children lists the letters that can follow a prefix."""
+    assert trie.children(prefix) == expected
+
+
+@pytest.mark.parametrize(
+    ("prefix", "expected"),
+    [
+        ("", sorted(WORDS)),
+        ("CA", ["CAR", "CART", "CAT", "CATS"]),
+        ("cat", ["CAT", "CATS"]),
+        ("DOGS", []),
+    ],
+)
+def test_complete_words(trie: WordTrie, prefix: str, expected: list[str]) -> None:
+    """Test that complete_words lists the words starting with a prefix."""
+    assert trie.complete_words(prefix) == expected
+
+
+def test_contains(trie: WordTrie) -> None:
+    """Test that only whole words are contained."""
+    assert "CAT" in trie
+    assert "CA" not in trie
+    assert "CATSS" not in trie
+
+
+def test_step__walks_one_letter(trie: WordTrie) -> None:
+    """Test that step follows edges from node to node."""
+    node = trie.step(trie.step(ROOT, "D"), "O")
+
+    assert node == trie.find("DO")
+    assert not trie.is_word(node)
+    assert trie.is_word(trie.step(node, "G"))
+    assert trie.step(node, "X") == NO_NODE
+
+
+def test_init__arrays__round_trips(trie: WordTrie) -> None:
+    """Test that a trie loaded from its bytes answers the same queries."""
+    loaded = WordTrie(arrays=trie.to_bytes())
+
+    assert len(loaded) == len(trie)
+    assert loaded.complete_words("") == trie.complete_words("")
+    assert loaded.children("CA") == ["R", "T"]
+    assert loaded.to_bytes() == trie.to_bytes()